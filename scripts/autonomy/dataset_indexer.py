@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - DATASET INDEXER
+-----------------------------------------
+The engine behind Topological Deglutition: dataset text in, vectors out.
+
+1. Records are parsed from ingested chunks (JSON lines: ``text`` /
+   ``content`` / ``abstract`` / ``body``; otherwise one record per line),
+   NFKC-normalized and keyed by the SHA-256 of their normalized text.
+   ``records_from_chunk`` does this inside the ingestion worker processes.
+2. Records already indexed (persistent hash table) or repeated within the
+   chunk are dropped before any embedding work.
+3. The rest is embedded on CPU in dynamic batches (sorted by length, capped
+   by records and characters) spread over a thread or process pool.
+4. Vectors are upserted in bulk into a local-mode Qdrant collection with
+   content-hash point IDs, so a replayed chunk overwrites instead of
+   duplicating. The indexed offset of every source is stored afterwards:
+   after a crash, chunks already indexed are skipped.
+
+Encoders are pluggable (``ENCODERS``): ``sentence-transformers`` for real
+runs and ``hashing``, a deterministic feature-hashing encoder for offline
+tests. ``report()`` gives records/s and a per-stage latency breakdown.
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("SelfNutritionist")
+
+TEXT_FIELDS = ("text", "content", "abstract", "body")
+STAGES = ("parse", "dedup", "embed", "upsert")
+
+_WHITESPACE = re.compile(r"\s+")
+_TOKEN = re.compile(r"\w+")
+
+Record = Tuple[str, str]  # (content hash, normalized text)
+
+
+# ----------------------------------------------------------------------
+# Records
+# ----------------------------------------------------------------------
+
+
+def normalize_text(text: str) -> str:
+    """NFKC, collapsed whitespace, stripped."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def iter_records(text: str, min_chars: int = 16) -> Iterator[Record]:
+    """(hash, normalized text) for every record of a chunk of text."""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line[0] == "{":
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                item = None
+            if isinstance(item, dict):
+                line = next(
+                    (item[k] for k in TEXT_FIELDS if isinstance(item.get(k), str)),
+                    "",
+                )
+        record = normalize_text(line)
+        if len(record) >= min_chars:
+            yield content_hash(record), record
+
+
+def records_from_chunk(data: bytes, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    StreamingIngestor processor: parse, normalize and hash in the worker.
+    """
+    text = data.decode("utf-8", errors="replace")
+    return {**meta, "records": list(iter_records(text))}
+
+
+# ----------------------------------------------------------------------
+# Encoders
+# ----------------------------------------------------------------------
+
+
+class HashingEncoder:
+    """Deterministic feature-hashing embeddings (word uni- and bigrams)."""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str) -> Iterator[str]:
+        tokens = _TOKEN.findall(text.lower())
+        yield from tokens
+        for first, second in zip(tokens, tokens[1:]):
+            yield f"{first} {second}"
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                sign = 1.0 if value >> 63 else -1.0
+                vectors[row, value % self.dim] += sign
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceTransformerEncoder:
+    """sentence-transformers model on CPU (loaded on first use)."""
+
+    def __init__(
+        self,
+        model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        batch_size: int = 64,
+        device: str = "cpu",
+    ):
+        self.model_name = model
+        self.name = model
+        self.batch_size = batch_size
+        self.device = device
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def model(self):
+        with self._lock:
+            if self._model is None:
+                from sentence_transformers import SentenceTransformer
+
+                self._model = SentenceTransformer(self.model_name, device=self.device)
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self.model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32)
+
+    def __getstate__(self):
+        # Process workers load their own copy of the model
+        return {**self.__dict__, "_model": None, "_lock": None}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+ENCODERS = {
+    "hashing": HashingEncoder,
+    "sentence-transformers": SentenceTransformerEncoder,
+}
+
+
+def make_encoder(name: str, **options):
+    if name not in ENCODERS:
+        raise ValueError(f"Unknown encoder: {name} (available: {sorted(ENCODERS)})")
+    return ENCODERS[name](**options)
+
+
+def _timed_encode(encoder, texts: List[str]) -> Tuple[np.ndarray, float]:
+    started = time.perf_counter()
+    return encoder.encode(texts), time.perf_counter() - started
+
+
+_worker_encoder = None
+
+
+def _init_encoder(encoder) -> None:
+    global _worker_encoder
+    _worker_encoder = encoder
+
+
+def _encode_in_worker(texts: List[str]) -> Tuple[np.ndarray, float]:
+    return _timed_encode(_worker_encoder, texts)
+
+
+# ----------------------------------------------------------------------
+# Vector store
+# ----------------------------------------------------------------------
+
+
+class QdrantStore:
+    """Local-mode (embedded, on-disk) Qdrant collection."""
+
+    def __init__(self, path: Path, collection: str = "datasets"):
+        self.path = Path(path)
+        self.collection = collection
+        self._client = None
+
+    def _connect(self, dim: int):
+        if self._client is None:
+            from qdrant_client import QdrantClient, models
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._client = QdrantClient(path=str(self.path))
+            if not self._client.collection_exists(self.collection):
+                self._client.create_collection(
+                    self.collection,
+                    vectors_config=models.VectorParams(
+                        size=dim, distance=models.Distance.COSINE
+                    ),
+                )
+        return self._client
+
+    def upsert(
+        self, ids: List[str], vectors: np.ndarray, payloads: List[Dict[str, Any]]
+    ) -> None:
+        from qdrant_client import models
+
+        client = self._connect(vectors.shape[1])
+        client.upsert(
+            self.collection,
+            points=models.Batch(ids=ids, vectors=vectors.tolist(), payloads=payloads),
+            wait=True,
+        )
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+# ----------------------------------------------------------------------
+# Engine
+# ----------------------------------------------------------------------
+
+STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (hash TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS offsets (
+    source TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+"""
+
+
+class DatasetIndexer:
+    """Normalize, dedup, embed and upsert dataset records."""
+
+    def __init__(
+        self,
+        root: Path,
+        encoder: Any = "hashing",
+        store: Optional[Any] = None,
+        pool: str = "thread",
+        workers: int = 2,
+        max_batch: int = 256,
+        max_batch_chars: int = 200_000,
+        upsert_batch: int = 1024,
+        max_payload_chars: int = 2000,
+    ):
+        """
+        Args:
+            root: Directory of the index state (hashes, offsets) and, by
+                default, of the Qdrant collection (``root/qdrant``)
+            encoder: Encoder instance or ``ENCODERS`` name
+            store: Vector store with ``upsert(ids, vectors, payloads)``
+                (default: local-mode ``QdrantStore``)
+            pool: "thread" or "process" embedding workers
+            workers: Embedding workers
+            max_batch: Records per embedding batch
+            max_batch_chars: Characters per embedding batch
+            upsert_batch: Points per upsert request
+            max_payload_chars: Text stored with every point
+        """
+        if pool not in ("thread", "process"):
+            raise ValueError(f"Unknown pool: {pool}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.encoder = make_encoder(encoder) if isinstance(encoder, str) else encoder
+        self.store = store if store is not None else QdrantStore(self.root / "qdrant")
+        self.pool = pool
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_batch_chars = max_batch_chars
+        self.upsert_batch = upsert_batch
+        self.max_payload_chars = max_payload_chars
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.root / "index_state.db", check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(STATE_SCHEMA)
+        self._executor: Optional[Executor] = None
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def reset_stats(self) -> None:
+        self.stats = {
+            "chunks": 0,
+            "chunks_skipped": 0,
+            "records": 0,
+            "duplicates": 0,
+            "indexed": 0,
+            "seconds": {stage: 0.0 for stage in STAGES},
+            "embed_batches": [],
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """records/s overall and per stage, plus embedding batch latencies."""
+        seconds = self.stats["seconds"]
+        total = sum(seconds.values())
+        batches = self.stats["embed_batches"]
+        latency = (
+            {
+                "p50": float(np.percentile(batches, 50)),
+                "p95": float(np.percentile(batches, 95)),
+                "max": float(max(batches)),
+            }
+            if batches
+            else {}
+        )
+        return {
+            "encoder": self.encoder.name,
+            "chunks": self.stats["chunks"],
+            "chunks_skipped": self.stats["chunks_skipped"],
+            "records": self.stats["records"],
+            "duplicates": self.stats["duplicates"],
+            "indexed": self.stats["indexed"],
+            "seconds": total,
+            "records_per_second": self.stats["records"] / total if total else 0.0,
+            "indexed_per_second": self.stats["indexed"] / total if total else 0.0,
+            "stages": {
+                stage: {
+                    "seconds": seconds[stage],
+                    "share": seconds[stage] / total if total else 0.0,
+                }
+                for stage in STAGES
+            },
+            "embed_batch_seconds": latency,
+        }
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def indexed_offset(self, source: str) -> int:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT offset FROM offsets WHERE source = ?", (source,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def index_chunk(self, chunk: Dict[str, Any], dataset: str = "") -> int:
+        """
+        Index one StreamingIngestor result (``records`` or raw ``text``).
+
+        The chunk is fully upserted before this returns, so it can be used
+        directly as the ingestor's ``commit``.
+
+        Returns:
+            Number of records newly indexed
+        """
+        source = f"{dataset}/{chunk['source']}" if dataset else chunk["source"]
+        end = chunk["offset"] + chunk["length"]
+        if end <= self.indexed_offset(source):
+            self.stats["chunks_skipped"] += 1
+            return 0
+
+        started = time.perf_counter()
+        if "records" in chunk:
+            records = [tuple(record) for record in chunk["records"]]
+        else:
+            records = list(iter_records(chunk["text"]))
+        self._add_time("parse", started)
+
+        started = time.perf_counter()
+        fresh = self._new_records(records)
+        self._add_time("dedup", started)
+        self.stats["records"] += len(records)
+        self.stats["duplicates"] += len(records) - len(fresh)
+
+        if fresh:
+            vectors = self._embed([text for _, text in fresh])
+            started = time.perf_counter()
+            payload = {"dataset": dataset, "source": chunk["source"]}
+            limit = self.max_payload_chars
+            for i in range(0, len(fresh), self.upsert_batch):
+                batch = fresh[i : i + self.upsert_batch]
+                self.store.upsert(
+                    [str(uuid.UUID(hex=digest[:32])) for digest, _ in batch],
+                    vectors[i : i + self.upsert_batch],
+                    [
+                        {**payload, "hash": digest, "text": text[:limit]}
+                        for digest, text in batch
+                    ],
+                )
+            self._add_time("upsert", started)
+
+        # Hashes and offset only after the vectors are stored
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO hashes (hash) VALUES (?)",
+                [(digest,) for digest, _ in fresh],
+            )
+            self._db.execute(
+                "INSERT INTO offsets (source, offset) VALUES (?, ?)"
+                " ON CONFLICT(source) DO UPDATE"
+                " SET offset = MAX(offset, excluded.offset)",
+                (source, end),
+            )
+        self.stats["chunks"] += 1
+        self.stats["indexed"] += len(fresh)
+        return len(fresh)
+
+    def _add_time(self, stage: str, started: float) -> None:
+        self.stats["seconds"][stage] += time.perf_counter() - started
+
+    def _new_records(self, records: List[Record]) -> List[Record]:
+        """Records not seen before, in this chunk or in the index."""
+        unique: Dict[str, str] = {}
+        for digest, text in records:
+            unique.setdefault(digest, text)
+        digests = list(unique)
+        known = set()
+        with self._lock:
+            for i in range(0, len(digests), 500):
+                part = digests[i : i + 500]
+                marks = ",".join("?" * len(part))
+                known.update(
+                    row[0]
+                    for row in self._db.execute(
+                        f"SELECT hash FROM hashes WHERE hash IN ({marks})", part
+                    )
+                )
+        return [(d, unique[d]) for d in digests if d not in known]
+
+    def _batches(self, texts: List[str]) -> List[List[int]]:
+        """Dynamic batches of indices: similar lengths, bounded size."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batches, batch, chars = [], [], 0
+        for i in order:
+            size = len(texts[i])
+            if batch and (
+                len(batch) >= self.max_batch or chars + size > self.max_batch_chars
+            ):
+                batches.append(batch)
+                batch, chars = [], 0
+            batch.append(i)
+            chars += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            if self.pool == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_encoder,
+                    initargs=(self.encoder,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="embed"
+                )
+        return self._executor
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        started = time.perf_counter()
+        order = self._batches(texts)
+        batches = [[texts[i] for i in batch] for batch in order]
+        if self.workers <= 1 or len(batches) == 1:
+            timed = [_timed_encode(self.encoder, batch) for batch in batches]
+        elif self.pool == "process":
+            timed = list(self._pool().map(_encode_in_worker, batches))
+        else:
+            encoder = self.encoder
+            timed = list(
+                self._pool().map(lambda batch: _timed_encode(encoder, batch), batches)
+            )
+
+        vectors = np.empty((len(texts), timed[0][0].shape[1]), dtype=np.float32)
+        for batch, (result, seconds) in zip(order, timed):
+            vectors[batch] = result
+            self.stats["embed_batches"].append(seconds)
+        self._add_time("embed", started)
+        return vectors
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if hasattr(self.store, "close"):
+            self.store.close()
+        with self._lock:
+            self._db.close()
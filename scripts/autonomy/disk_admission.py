@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - DISK ADMISSION
+----------------------------------------
+Size-aware admission control for dataset acquisition.
+
+Free space alone does not protect ``/omnimind_storage``: two large torrents
+started while the disk looks empty still fill it mid-transfer. Instead:
+
+1. The payload size is read before starting, from the feed entry (``size``)
+   or from the torrent metainfo (``info.length`` / ``info.files``).
+2. Every admitted dataset reserves its payload plus ingestion scratch space
+   in a persistent ledger (the ``reservations`` table of the state
+   database), so reservations survive restarts.
+3. A dataset is admitted when it fits in the free space minus the floor
+   (MIN_DISK_SPACE_GB) minus what in-flight reservations still need, and in
+   the optional byte budget; deferred when it would fit once in-flight work
+   releases its space; skipped when it can never fit.
+4. Candidates are ordered smallest-first (or by value per GB), which
+   maximizes the datasets ingested per cycle.
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from download_scheduler import directory_size
+from nutrition_state import DONE_STATES, NutritionState, dataset_key
+
+logger = logging.getLogger("SelfNutritionist")
+
+ADMIT = "admit"
+DEFER = "defer"
+SKIP = "skip"
+
+GB = 1024**3
+
+
+def bdecode(data: bytes, index: int = 0) -> Tuple[Any, int]:
+    """Decode one bencoded value at ``index``; returns (value, next index)."""
+    token = data[index : index + 1]
+    if token == b"i":
+        end = data.index(b"e", index)
+        return int(data[index + 1 : end]), end + 1
+    if token == b"l":
+        index += 1
+        items = []
+        while data[index : index + 1] != b"e":
+            item, index = bdecode(data, index)
+            items.append(item)
+        return items, index + 1
+    if token == b"d":
+        index += 1
+        items = {}
+        while data[index : index + 1] != b"e":
+            key, index = bdecode(data, index)
+            items[key], index = bdecode(data, index)
+        return items, index + 1
+    if token.isdigit():
+        colon = data.index(b":", index)
+        start = colon + 1
+        end = start + int(data[index:colon])
+        return data[start:end], end
+    raise ValueError(f"Invalid bencoding at offset {index}")
+
+
+def torrent_payload_size(metainfo: bytes) -> int:
+    """Total payload bytes described by a .torrent file."""
+    torrent, _ = bdecode(metainfo)
+    info = torrent[b"info"]
+    if b"length" in info:
+        return info[b"length"]
+    return sum(f[b"length"] for f in info[b"files"])
+
+
+def fetch_metainfo(link: str, timeout: float = 30.0) -> bytes:
+    """Download a .torrent file (Academic Torrents serves them directly)."""
+    import requests
+
+    response = requests.get(link, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+class DiskAdmission:
+    """Admits, defers or skips downloads against a disk budget."""
+
+    def __init__(
+        self,
+        state: NutritionState,
+        root: Path,
+        min_free_bytes: int = 50 * GB,
+        budget_bytes: Optional[int] = None,
+        scratch_ratio: float = 0.1,
+        order: str = "smallest",
+        value: Optional[Callable[[Dict[str, Any]], float]] = None,
+        disk_usage: Callable[[Path], Any] = shutil.disk_usage,
+        fetch: Optional[Callable[[str], bytes]] = fetch_metainfo,
+    ):
+        """
+        Args:
+            state: State database holding the reservation ledger
+            root: Storage root (the partition being protected)
+            min_free_bytes: Free space that must always remain
+            budget_bytes: Optional cap on the bytes reserved at the same time
+            scratch_ratio: Extra space reserved for ingestion, as a fraction
+                of the payload (index segments, checkpoints)
+            order: "smallest" (smallest payload first) or "value" (highest
+                ``value(dataset)`` per GB first)
+            value: Value of a dataset for ``order="value"`` (default 1.0)
+            disk_usage: ``shutil.disk_usage`` compatible callable
+            fetch: Downloads torrent metainfo for a link (None: feed sizes
+                only)
+        """
+        if order not in ("smallest", "value"):
+            raise ValueError(f"Unknown order: {order}")
+        self.state = state
+        self.root = Path(root)
+        self.min_free_bytes = min_free_bytes
+        self.budget_bytes = budget_bytes
+        self.scratch_ratio = scratch_ratio
+        self.order_by = order
+        self.value = value or (lambda dataset: 1.0)
+        self.disk_usage = disk_usage
+        self.fetch = fetch
+        self._sizes: Dict[str, Optional[int]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+
+    def payload_size(self, dataset: Dict[str, Any]) -> Optional[int]:
+        """Expected payload bytes of a dataset, or None when unknown."""
+        link = dataset["link"]
+        if link in self._sizes:
+            return self._sizes[link]
+        size = None
+        if dataset.get("size"):
+            size = int(dataset["size"])
+        elif self.fetch is not None and link.endswith(".torrent"):
+            try:
+                size = torrent_payload_size(self.fetch(link))
+            except Exception as e:
+                logger.warning(f"No torrent metadata for {dataset.get('title')}: {e}")
+        self._sizes[link] = size
+        return size
+
+    def required_bytes(self, dataset: Dict[str, Any]) -> Optional[int]:
+        """Payload plus ingestion scratch space."""
+        size = self.payload_size(dataset)
+        return None if size is None else int(size * (1 + self.scratch_ratio))
+
+    def order(self, datasets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Datasets in admission order; unknown sizes go last."""
+
+        def key(dataset):
+            size = self.payload_size(dataset)
+            if size is None:
+                return (1, 0.0)
+            if self.order_by == "value":
+                return (0, -self.value(dataset) / max(size / GB, 1e-9))
+            return (0, float(size))
+
+        return sorted(datasets, key=key)
+
+    # ------------------------------------------------------------------
+    # Ledger
+    # ------------------------------------------------------------------
+
+    def outstanding(self) -> int:
+        """Bytes reserved but not yet written to disk."""
+        total = 0
+        for reservation in self.state.reservations():
+            written = directory_size(Path(reservation["path"]))
+            total += max(reservation["bytes"] - written, 0)
+        return total
+
+    def reconcile(self) -> int:
+        """Release reservations of datasets already done or failed."""
+        released = 0
+        for reservation in self.state.reservations():
+            if reservation["state"] in DONE_STATES + ("failed",):
+                self.state.release(reservation["key"])
+                released += 1
+        return released
+
+    def decide(self, dataset: Dict[str, Any], path: Path) -> str:
+        """
+        Admit (and reserve), defer or skip one dataset.
+
+        Returns:
+            ADMIT, DEFER or SKIP
+        """
+        title = dataset.get("title")
+        required = self.required_bytes(dataset)
+        if required is None:
+            logger.warning(f"Skipping {title}: payload size unknown")
+            return SKIP
+
+        with self._lock:
+            usage = self.disk_usage(self.root)
+            capacity = usage.total - self.min_free_bytes
+            if self.budget_bytes is not None:
+                capacity = min(capacity, self.budget_bytes)
+            if required > capacity:
+                logger.warning(
+                    f"Skipping {title}: needs {required / GB:.1f} GB, "
+                    f"capacity is {capacity / GB:.1f} GB"
+                )
+                return SKIP
+
+            reservations = self.state.reservations()
+            available = usage.free - self.min_free_bytes - self.outstanding()
+            if self.budget_bytes is not None:
+                reserved = sum(r["bytes"] for r in reservations)
+                available = min(available, self.budget_bytes - reserved)
+            if required > available:
+                logger.info(
+                    f"Deferring {title}: needs {required / GB:.1f} GB, "
+                    f"{max(available, 0) / GB:.1f} GB available"
+                )
+                return DEFER
+
+            self.state.reserve(dataset, path, required)
+            logger.info(f"Admitted {title}: reserved {required / GB:.1f} GB")
+            return ADMIT
+
+    def release(self, dataset: Dict[str, Any]) -> None:
+        """Give a dataset's reservation back (done, failed or abandoned)."""
+        self.state.release(dataset_key(dataset))
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - DOWNLOAD SCHEDULER
+--------------------------------------------
+Bounded, concurrent dataset downloads for the SelfNutritionist.
+
+Each download is a managed child process (aria2c by default) instead of a
+blocking ``subprocess.run``. A single scheduler loop:
+
+1. Starts up to ``max_concurrent`` downloads (MAX_CONCURRENT_DOWNLOADS).
+2. Polls them for exit status and progress (bytes on disk).
+3. Kills downloads that exceed their timeout and retries failures with
+   exponential backoff.
+4. Starts an ingestion thread together with every download (``on_start``),
+   so files are ingested while the dataset is still downloading, or hands
+   every finished download to an ingestion thread (``on_complete``).
+
+``fetch_command`` is a dependency-free stand-in for aria2c that handles
+``http(s)://`` and ``file://`` links, for tests and for mirrors that do not
+need BitTorrent.
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("SelfNutritionist")
+
+Command = Callable[[str, Path], List[str]]
+
+
+def aria2c_command(link: str, download_dir: Path) -> List[str]:
+    """aria2c invocation for a torrent (or HTTP) link."""
+    return [
+        "aria2c",
+        "--seed-time=0",
+        "--max-connection-per-server=4",
+        "--console-log-level=warn",
+        "--summary-interval=0",
+        f"--dir={download_dir}",
+        link,
+    ]
+
+
+def fetch_command(link: str, download_dir: Path) -> List[str]:
+    """Plain HTTP/file download through this module's ``fetch`` entry point."""
+    script = str(Path(__file__).resolve())
+    return [sys.executable, script, "fetch", link, str(download_dir)]
+
+
+def fetch(link: str, download_dir: Path, chunk_size: int = 1 << 20) -> Path:
+    """Stream ``link`` into ``download_dir`` (atomic rename when complete)."""
+    from urllib.parse import unquote, urlparse
+    from urllib.request import urlopen
+
+    name = Path(unquote(urlparse(link).path)).name or "download"
+    download_dir = Path(download_dir)
+    download_dir.mkdir(parents=True, exist_ok=True)
+    target = download_dir / name
+    partial = download_dir / f".{name}.part"
+    with urlopen(link, timeout=60) as response, open(partial, "wb") as f:
+        shutil.copyfileobj(response, f, chunk_size)
+    os.replace(partial, target)
+    return target
+
+
+def directory_size(path: Path) -> int:
+    """Bytes currently on disk below ``path``."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # Renamed or removed by the downloader while walking
+                pass
+    return total
+
+
+class _Download:
+    """State of one scheduled download."""
+
+    def __init__(self, dataset: Dict[str, Any], download_dir: Path):
+        self.dataset = dataset
+        self.download_dir = Path(download_dir)
+        self.attempts = 0
+        self.not_before = 0.0
+        self.process: Optional[subprocess.Popen] = None
+        self.stderr = None
+        self.started = 0.0
+        self.last_report = 0.0
+        # Set once the download completed or failed for good
+        self.done = threading.Event()
+        self.result: Dict[str, Any] = {
+            "title": dataset.get("title"),
+            "dir": str(download_dir),
+            "status": "pending",
+            "attempts": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+            "error": None,
+        }
+
+
+class DownloadScheduler:
+    """Runs downloads as a bounded pool of managed child processes."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 2,
+        timeout: float = 12 * 3600,
+        retries: int = 2,
+        backoff: float = 30.0,
+        poll_interval: float = 1.0,
+        progress_interval: float = 60.0,
+        command: Command = aria2c_command,
+        ingest_workers: int = 1,
+    ):
+        """
+        Args:
+            max_concurrent: Downloads running at the same time
+            timeout: Seconds after which one attempt is killed
+            retries: Extra attempts after a failure or timeout
+            backoff: Delay before the first retry; doubled for every retry
+            poll_interval: Seconds between polls of the running downloads
+            progress_interval: Seconds between progress log lines per download
+            command: Builds the child command from (link, download_dir)
+            ingest_workers: Threads running ``on_start``/``on_complete``
+                callbacks (with ``on_start``, at least ``max_concurrent``
+                keeps every running download streamed)
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.poll_interval = poll_interval
+        self.progress_interval = progress_interval
+        self.command = command
+        self.ingest_workers = ingest_workers
+
+    def run(
+        self,
+        downloads: Sequence[Tuple[Dict[str, Any], Path]],
+        on_complete: Optional[Callable[[Dict[str, Any], Path], Any]] = None,
+        can_start: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        on_start: Optional[
+            Callable[[Dict[str, Any], Path, threading.Event], Any]
+        ] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Download every (dataset, directory) pair.
+
+        Args:
+            downloads: Datasets (with a ``link``) and their target directories
+            on_complete: Called as ``on_complete(dataset, dir)`` in an
+                ingestion thread as soon as a download finishes
+            can_start: Checked right before a download starts; returning
+                False skips it (e.g. not enough disk space) and None defers it
+                while other downloads or ingestions are still running
+            on_start: Called as ``on_start(dataset, dir, download_done)`` in
+                an ingestion thread when a download first starts;
+                ``download_done`` is set once it completed or failed for good
+                (the status is in the returned dict)
+
+        Returns:
+            One status dict per download, in input order
+        """
+        queue = [_Download(dataset, path) for dataset, path in downloads]
+        pending = list(queue)
+        active: List[_Download] = []
+        ingesting: List[Tuple[_Download, Future]] = []
+
+        with ThreadPoolExecutor(
+            max_workers=self.ingest_workers, thread_name_prefix="ingest"
+        ) as ingest:
+            try:
+                while pending or active:
+                    now = time.monotonic()
+                    for download in list(pending):
+                        if len(active) >= self.max_concurrent:
+                            break
+                        if download.not_before > now:
+                            continue
+                        admitted = True if can_start is None else can_start(
+                            download.dataset
+                        )
+                        if admitted is None and (
+                            active or any(not f.done() for _, f in ingesting)
+                        ):
+                            # Deferred: retry once running work frees space
+                            download.result["status"] = "deferred"
+                            download.not_before = now + self.poll_interval
+                            continue
+                        pending.remove(download)
+                        if not admitted:
+                            download.result["status"] = "skipped"
+                            title = download.result["title"]
+                            logger.warning(f"Skipping download: {title}")
+                            continue
+                        self._start(download)
+                        active.append(download)
+                        if on_start is not None and download.attempts == 1:
+                            future = ingest.submit(
+                                on_start,
+                                download.dataset,
+                                download.download_dir,
+                                download.done,
+                            )
+                            ingesting.append((download, future))
+
+                    for download in list(active):
+                        finished = self._poll(download)
+                        if finished is None:
+                            continue
+                        active.remove(download)
+                        if finished:
+                            download.done.set()
+                            if on_complete is not None:
+                                future = ingest.submit(
+                                    on_complete,
+                                    download.dataset,
+                                    download.download_dir,
+                                )
+                                ingesting.append((download, future))
+                        elif download.attempts <= self.retries:
+                            delay = self.backoff * 2 ** (download.attempts - 1)
+                            download.not_before = time.monotonic() + delay
+                            download.result["status"] = "retrying"
+                            pending.append(download)
+                            logger.warning(
+                                f"Retrying {download.result['title']} in {delay:.0f}s "
+                                f"(attempt {download.attempts + 1})"
+                            )
+                        else:
+                            download.result["status"] = "failed"
+                            download.done.set()
+
+                    if pending or active:
+                        time.sleep(self.poll_interval)
+            finally:
+                for download in active:
+                    self._kill(download)
+                # Streaming ingestions stop once their download is over
+                for download in queue:
+                    download.done.set()
+
+            for download, future in ingesting:
+                try:
+                    future.result()
+                    download.result["ingested"] = True
+                except Exception as e:
+                    title = download.result["title"]
+                    logger.error(f"Ingestion failed for {title}: {e}")
+                    download.result["ingested"] = False
+                    download.result["ingest_error"] = str(e)
+
+        return [download.result for download in queue]
+
+    def _start(self, download: _Download) -> None:
+        download.attempts += 1
+        download.result["attempts"] = download.attempts
+        download.result["status"] = "downloading"
+        download.download_dir.mkdir(parents=True, exist_ok=True)
+        download.stderr = tempfile.TemporaryFile()
+        download.started = download.last_report = time.monotonic()
+        cmd = self.command(download.dataset["link"], download.download_dir)
+        logger.info(
+            f"Starting download: {download.result['title']} -> {download.download_dir}"
+        )
+        download.process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=download.stderr
+        )
+
+    def _poll(self, download: _Download) -> Optional[bool]:
+        """None while running, True on success, False on failure or timeout."""
+        now = time.monotonic()
+        elapsed = now - download.started
+        returncode = download.process.poll()
+
+        if returncode is None:
+            if elapsed > self.timeout:
+                self._kill(download)
+                return self._finish(download, f"timed out after {elapsed:.0f}s")
+            if now - download.last_report >= self.progress_interval:
+                download.last_report = now
+                size = directory_size(download.download_dir)
+                logger.info(
+                    f"Downloading {download.result['title']}: "
+                    f"{size / 1024**2:.1f} MB in {elapsed:.0f}s"
+                )
+            return None
+
+        if returncode == 0:
+            return self._finish(download, None)
+        error = f"exit code {returncode}: {self._stderr(download)}"
+        return self._finish(download, error)
+
+    def _finish(self, download: _Download, error: Optional[str]) -> bool:
+        result = download.result
+        result["seconds"] += time.monotonic() - download.started
+        result["bytes"] = directory_size(download.download_dir)
+        result["error"] = error
+        if download.stderr is not None:
+            download.stderr.close()
+            download.stderr = None
+        if error is None:
+            result["status"] = "completed"
+            logger.info(
+                f"Download complete: {result['title']} "
+                f"({result['bytes'] / 1024**2:.1f} MB, {result['seconds']:.0f}s)"
+            )
+            return True
+        logger.error(f"Download failed for {result['title']}: {error}")
+        return False
+
+    @staticmethod
+    def _stderr(download: _Download, limit: int = 500) -> str:
+        if download.stderr is None:
+            return ""
+        download.stderr.seek(0)
+        return download.stderr.read().decode(errors="replace").strip()[-limit:]
+
+    @staticmethod
+    def _kill(download: _Download) -> None:
+        process = download.process
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+if __name__ == "__main__":
+    # python download_scheduler.py fetch <url> <dir>
+    if len(sys.argv) != 4 or sys.argv[1] != "fetch":
+        sys.exit("usage: download_scheduler.py fetch <url> <dir>")
+    fetch(sys.argv[2], Path(sys.argv[3]))
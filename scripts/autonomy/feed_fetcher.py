@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - FEED FETCHER
+--------------------------------------
+Conditional, streaming fetch of the Academic Torrents RSS feed.
+
+1. One pooled ``requests.Session`` is reused across cycles.
+2. The last ETag / Last-Modified validators are sent back
+   (If-None-Match / If-Modified-Since): an unchanged feed is a 304 with no
+   body.
+3. Changed feeds are parsed incrementally with ``iterparse`` straight from
+   the response stream; every ``<item>`` is cleared once read, so memory
+   does not grow with the feed.
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nutrition_state import NutritionState
+
+logger = logging.getLogger("SelfNutritionist")
+
+
+def pooled_session(pool_size: int = 4) -> requests.Session:
+    """Session with a keep-alive connection pool and transient-error retries."""
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3, backoff_factor=1.0, status_forcelist=(502, 503, 504)
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def iter_items(stream) -> Iterator[Dict[str, Optional[str]]]:
+    """Yield feed items (title, link, description, size) from a stream."""
+    for _, element in ET.iterparse(stream, events=("end",)):
+        if element.tag != "item":
+            continue
+        yield {
+            "title": element.findtext("title"),
+            "link": element.findtext("link"),
+            "description": element.findtext("description"),
+            # Payload bytes, when the feed publishes them
+            "size": element.findtext("size"),
+        }
+        element.clear()
+
+
+class FeedFetcher:
+    """Fetches a feed only when it changed since the last successful fetch."""
+
+    def __init__(
+        self,
+        url: str,
+        state: NutritionState,
+        session: Optional[requests.Session] = None,
+        timeout: float = 30.0,
+    ):
+        self.url = url
+        self.state = state
+        self.session = session or pooled_session()
+        self.timeout = timeout
+
+    def fetch(self) -> Optional[List[Dict[str, Optional[str]]]]:
+        """
+        Returns:
+            The feed items, or None when the server reports it unchanged (304)
+        """
+        headers = {}
+        etag, last_modified = self.state.feed_validators(self.url)
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        with self.session.get(
+            self.url, headers=headers, timeout=self.timeout, stream=True
+        ) as response:
+            if response.status_code == 304:
+                logger.info("Feed unchanged since last fetch (304).")
+                return None
+            response.raise_for_status()
+            response.raw.decode_content = True
+            datasets = [item for item in iter_items(response.raw) if item["link"]]
+
+            # Validators are stored only after the whole feed was parsed
+            self.state.save_feed_validators(
+                self.url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+        return datasets
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - NUTRITION STATE
+-----------------------------------------
+Persistent memory of what the SelfNutritionist has already eaten.
+
+A small SQLite database (WAL mode) next to the datasets it describes:
+
+1. ``datasets``: one row per dataset, keyed by torrent infohash (or by its
+   link when no infohash can be derived), moving through
+   seen -> downloading -> downloaded -> ingested -> cleaned (or failed).
+2. ``feeds``: the ETag / Last-Modified validators of every fetched feed,
+   so an unchanged feed costs a single 304.
+3. ``reservations``: disk space reserved by admitted downloads until they
+   are ingested and cleaned (see ``disk_admission``).
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("SelfNutritionist")
+
+STATES = ("seen", "downloading", "downloaded", "ingested", "cleaned", "failed")
+
+# States after which a dataset is never downloaded again
+DONE_STATES = ("ingested", "cleaned")
+
+_INFOHASH = re.compile(r"(?:btih:|/download/|/details/)([0-9a-fA-F]{40})\b")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    key TEXT PRIMARY KEY,
+    link TEXT NOT NULL,
+    title TEXT,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS datasets_state ON datasets (state);
+CREATE TABLE IF NOT EXISTS feeds (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reservations (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def dataset_key(dataset: Dict[str, str]) -> str:
+    """Torrent infohash of a dataset (lowercase hex), else its link."""
+    link = dataset["link"]
+    match = _INFOHASH.search(link)
+    return match.group(1).lower() if match else link
+
+
+class NutritionState:
+    """SQLite-backed dedup and lifecycle state (thread-safe)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Datasets
+    # ------------------------------------------------------------------
+
+    def observe(self, datasets: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Record feed entries as seen and return those still worth fetching.
+
+        Entries already ingested or cleaned are dropped, and so are
+        duplicates within the feed itself.
+        """
+        now = time.time()
+        fresh = []
+        keys = set()
+        with self._lock, self._db:
+            for dataset in datasets:
+                key = dataset_key(dataset)
+                if key in keys:
+                    continue
+                keys.add(key)
+                self._db.execute(
+                    "INSERT OR IGNORE INTO datasets"
+                    " (key, link, title, state, first_seen, updated_at)"
+                    " VALUES (?, ?, ?, 'seen', ?, ?)",
+                    (key, dataset["link"], dataset.get("title"), now, now),
+                )
+                (state,) = self._db.execute(
+                    "SELECT state FROM datasets WHERE key = ?", (key,)
+                ).fetchone()
+                if state not in DONE_STATES:
+                    fresh.append(dataset)
+        return fresh
+
+    def mark(
+        self, dataset: Dict[str, str], state: str, error: Optional[str] = None
+    ) -> None:
+        """Move a dataset to ``state`` (inserting it if it was never seen)."""
+        if state not in STATES:
+            raise ValueError(f"Unknown state: {state}")
+        now = time.time()
+        attempt = 1 if state == "downloading" else 0
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO datasets"
+                " (key, link, title, state, attempts, error, first_seen, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET state = excluded.state,"
+                " attempts = attempts + excluded.attempts, error = excluded.error,"
+                " updated_at = excluded.updated_at",
+                (
+                    dataset_key(dataset),
+                    dataset["link"],
+                    dataset.get("title"),
+                    state,
+                    attempt,
+                    error,
+                    now,
+                    now,
+                ),
+            )
+
+    def state(self, dataset: Dict[str, str]) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT state FROM datasets WHERE key = ?", (dataset_key(dataset),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def counts(self) -> Dict[str, int]:
+        """Number of datasets per state."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT state, COUNT(*) FROM datasets GROUP BY state"
+            ).fetchall()
+        return dict(rows)
+
+    # ------------------------------------------------------------------
+    # Disk reservations
+    # ------------------------------------------------------------------
+
+    def reserve(self, dataset: Dict[str, str], path: Path, size: int) -> None:
+        """Reserve ``size`` bytes for a dataset downloading into ``path``."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO reservations (key, path, bytes, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (dataset_key(dataset), str(path), size, time.time()),
+            )
+
+    def release(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM reservations WHERE key = ?", (key,))
+
+    def reservations(self) -> List[Dict[str, object]]:
+        """Current reservations with the state of their dataset."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT r.key, r.path, r.bytes, d.state FROM reservations r"
+                " LEFT JOIN datasets d ON d.key = r.key"
+            ).fetchall()
+        return [
+            {"key": key, "path": path, "bytes": size, "state": state}
+            for key, path, size, state in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # Feeds
+    # ------------------------------------------------------------------
+
+    def feed_validators(self, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """(ETag, Last-Modified) of the last successful fetch of ``url``."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified FROM feeds WHERE url = ?", (url,)
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def save_feed_validators(
+        self, url: str, etag: Optional[str], last_modified: Optional[str]
+    ) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO feeds (url, etag, last_modified, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -17,14 +17,20 @@ Guardian: Doxiwehu OmniMind
 
 import logging
 import os
+from functools import partial
 import shutil
-import subprocess
-import time
-import xml.etree.ElementTree as ET
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import requests
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from dataset_indexer import DatasetIndexer, records_from_chunk  # noqa: E402
+from disk_admission import ADMIT, DEFER, GB, DiskAdmission  # noqa: E402
+from download_scheduler import DownloadScheduler  # noqa: E402
+from feed_fetcher import FeedFetcher  # noqa: E402
+from nutrition_state import NutritionState, dataset_key  # noqa: E402
+from streaming_ingest import StreamingIngestor  # noqa: E402
 
 # Configure logging
 logging.basicConfig(
@@ -43,17 +49,57 @@ SYMLINK_ROOT = Path("data/datasets")
 RSS_FEED_URL = "https://academictorrents.com/collection/datasets.xml"
 MAX_CONCURRENT_DOWNLOADS = 2
 MIN_DISK_SPACE_GB = 50  # Stop if free space < 50GB
+INGEST_MAX_IN_FLIGHT = 8  # Chunks (4MB each) held in memory while ingesting
+INGEST_WORKERS = 2
+INDEX_ENCODER = "sentence-transformers"
 
 class SelfNutritionist:
-    def __init__(self):
+    def __init__(
+        self,
+        scheduler: Optional[DownloadScheduler] = None,
+        state: Optional[NutritionState] = None,
+        feed_url: str = RSS_FEED_URL,
+        ingestor: Optional[StreamingIngestor] = None,
+        admission: Optional[DiskAdmission] = None,
+        indexer: Optional[DatasetIndexer] = None,
+    ):
         self.storage_root = STORAGE_ROOT
         self.symlink_root = SYMLINK_ROOT
         self.storage_root.mkdir(parents=True, exist_ok=True)
         self.symlink_root.mkdir(parents=True, exist_ok=True)
 
-        # Ensure aria2c is available
-        if not shutil.which("aria2c"):
-            raise RuntimeError("aria2c not found. Please install it.")
+        # What was already seen, downloaded, ingested and cleaned
+        self.state = state or NutritionState(self.storage_root / "nutrition_state.db")
+        self.feed = FeedFetcher(feed_url, self.state)
+
+        # Vector index of everything eaten (local-mode Qdrant)
+        self.indexer = indexer or DatasetIndexer(
+            self.storage_root / "index", encoder=INDEX_ENCODER
+        )
+
+        # Chunked ingestion: bounded RAM, raw files released as they are eaten.
+        # Records are parsed and hashed in the workers, embedded by the indexer.
+        self.ingestor = ingestor or StreamingIngestor(
+            process=records_from_chunk,
+            max_in_flight=INGEST_MAX_IN_FLIGHT,
+            workers=INGEST_WORKERS,
+        )
+
+        # Space is reserved per dataset (payload + ingestion scratch) before
+        # it starts, instead of only looking at the current free space
+        self.admission = admission or DiskAdmission(
+            self.state, self.storage_root, min_free_bytes=MIN_DISK_SPACE_GB * GB
+        )
+
+        if scheduler is None:
+            # Ensure aria2c is available (the default downloader)
+            if not shutil.which("aria2c"):
+                raise RuntimeError("aria2c not found. Please install it.")
+            scheduler = DownloadScheduler(
+                max_concurrent=MAX_CONCURRENT_DOWNLOADS,
+                ingest_workers=MAX_CONCURRENT_DOWNLOADS,
+            )
+        self.scheduler = scheduler
 
     def check_disk_space(self) -> bool:
         """Check if there is enough disk space on the storage partition."""
@@ -62,93 +108,85 @@ class SelfNutritionist:
         logger.info(f"Disk Space: {free_gb:.2f} GB free")
         return free_gb > MIN_DISK_SPACE_GB
 
-    def fetch_feed(self) -> List[Dict[str, str]]:
-        """Fetch the RSS feed from Academic Torrents."""
-        logger.info(f"Fetching RSS feed from {RSS_FEED_URL}...")
+    def fetch_feed(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Fetch the RSS feed from Academic Torrents.
+
+        Returns None when the feed is unchanged since the last fetch (304).
+        """
+        logger.info(f"Fetching RSS feed from {self.feed.url}...")
         try:
-            response = requests.get(RSS_FEED_URL, timeout=30)
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-
-            datasets = []
-            for item in root.findall("./channel/item"):
-                title = item.find("title").text
-                link = item.find("link").text
-                description = item.find("description").text
-
-                # Basic filtering (avoid huge video datasets if possible, focus on text/data)
-                # For now, we take everything as requested by the user ("first page")
-                datasets.append({
-                    "title": title,
-                    "link": link, # This is the torrent download link
-                    "description": description
-                })
-
-            logger.info(f"Found {len(datasets)} datasets in feed.")
+            # For now, we take everything as requested by the user ("first page")
+            datasets = self.feed.fetch()
+            if datasets is not None:
+                logger.info(f"Found {len(datasets)} datasets in feed.")
             return datasets
         except Exception as e:
             logger.error(f"Failed to fetch feed: {e}")
             return []
 
-    def download_dataset(self, dataset: Dict[str, str]) -> Optional[Path]:
-        """Download a dataset via aria2c."""
-        title = dataset["title"]
-        link = dataset["link"]
-
+    def _download_dir(self, dataset: Dict[str, str]) -> Path:
         # Create a safe directory name
-        safe_name = "".join([c if c.isalnum() else "_" for c in title])
-        download_dir = self.storage_root / safe_name
-        download_dir.mkdir(exist_ok=True)
+        safe_name = "".join([c if c.isalnum() else "_" for c in dataset["title"]])
+        return self.storage_root / safe_name
 
-        logger.info(f"Starting download: {title} -> {download_dir}")
-
-        cmd = [
-            "aria2c",
-            "--seed-time=0",
-            "--max-connection-per-server=4",
-            f"--dir={download_dir}",
-            link
-        ]
-
-        try:
-            # Run aria2c (blocking for simplicity in this v1, can be async later)
-            # In a real autonomous loop, this would be a background process monitored by PID
-            subprocess.run(cmd, check=True)
-            logger.info(f"Download complete: {title}")
-            return download_dir
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Download failed for {title}: {e}")
-            return None
-
-    def ingest_and_cleanup(self, dataset_dir: Path):
+    def download_dataset(self, dataset: Dict[str, str]) -> Optional[Path]:
+        """Download a single dataset (blocks until it finished or failed)."""
+        download_dir = self._download_dir(dataset)
+        [result] = self.scheduler.run([(dataset, download_dir)])
+        return download_dir if result["status"] == "completed" else None
+
+    def ingest_and_cleanup(
+        self,
+        dataset_dir: Path,
+        dataset: Optional[Dict[str, str]] = None,
+        download_done: Callable[[], bool] = lambda: True,
+    ) -> bool:
         """
         Ingest the dataset using DatasetIndexer and then delete raw files.
         This is the 'Topological Deglutition' phase.
+
+        While ``download_done`` returns False the dataset is still being
+        downloaded and completed files are ingested as they appear. When the
+        feed entry is given, its progress is recorded in the state database.
+        Returns True on success.
         """
         logger.info(f"Starting ingestion for {dataset_dir}...")
 
-        # 1. Ingest
-        # We need to call the DatasetIndexer.
-        # Since it's a library, we can import it or run a script.
-        # For robustness, we'll run a separate script to avoid memory leaks in the long-running agent.
-
-        ingest_cmd = [
-            "python3",
-            "src/memory/ingest_dataset.py", # We need to create this wrapper
-            "--dir", str(dataset_dir)
-        ]
-
         try:
-            # subprocess.run(ingest_cmd, check=True) # TODO: Enable when ingest_dataset.py exists
-            logger.info(f"Ingestion simulated/complete for {dataset_dir}")
-
-            # 2. Cleanup
-            logger.info(f"Cleaning up raw files in {dataset_dir}...")
-            # shutil.rmtree(dataset_dir) # TODO: Enable after verification
-            logger.info(f"Cleanup complete. Space reclaimed.")
+            # 1. Ingest + 2. Cleanup, file by file: every file is streamed in
+            # chunks and deleted as soon as its chunks are committed. Progress
+            # is checkpointed, so a crash resumes in the middle of the dataset.
+            namespace = dataset_key(dataset) if dataset else Path(dataset_dir).name
+            self.indexer.reset_stats()
+            stats = self.ingestor.ingest(
+                dataset_dir,
+                download_done=download_done,
+                commit=partial(self.indexer.index_chunk, dataset=namespace),
+            )
+            report = self.indexer.report()
+            logger.info(
+                f"Ingestion complete for {dataset_dir}: {stats['files']} files, "
+                f"{report['indexed']} records indexed "
+                f"({report['duplicates']} duplicates, "
+                f"{report['records_per_second']:.0f} records/s)"
+            )
+            if dataset is not None:
+                self.state.mark(dataset, "downloaded")
+                self.state.mark(dataset, "ingested")
+
+            if self.ingestor.delete_sources:
+                shutil.rmtree(dataset_dir, ignore_errors=True)
+                logger.info("Cleanup complete. Space reclaimed.")
+                if dataset is not None:
+                    self.state.mark(dataset, "cleaned")
+            return True
 
         except Exception as e:
             logger.error(f"Ingestion failed: {e}")
+            if dataset is not None:
+                self.state.mark(dataset, "failed", error=str(e))
+            return False
 
     def run_autonomous_cycle(self):
         """Main autonomous loop."""
@@ -159,20 +197,48 @@ class SelfNutritionist:
             return
 
         datasets = self.fetch_feed()
+        if datasets is None:
+            logger.info("Nothing new in the feed. Zero downloads this cycle.")
+            return []
 
-        for dataset in datasets[:5]: # Limit to first 5 for safety in this test run
-            if not self.check_disk_space():
-                break
-
-            logger.info(f"Processing: {dataset['title']}")
-
-            # Check if already ingested (needs a state database, skipping for v1)
-
-            download_path = self.download_dataset(dataset)
-            if download_path:
-                self.ingest_and_cleanup(download_path)
-
-            time.sleep(5) # Rest between meals
+        # Skip what was already ingested (state database), smallest first so
+        # the cycle ingests as many datasets as the disk allows
+        self.admission.reconcile()
+        datasets = self.admission.order(self.state.observe(datasets))
+        datasets = datasets[:5]  # Limit to first 5 for safety
+
+        def can_start(dataset: Dict[str, str]) -> Optional[bool]:
+            decision = self.admission.decide(dataset, self._download_dir(dataset))
+            if decision == DEFER:
+                return None
+            if decision != ADMIT:
+                return False
+            self.state.mark(dataset, "downloading")
+            return True
+
+        def ingest(
+            dataset: Dict[str, str], path: Path, download_done: threading.Event
+        ) -> None:
+            try:
+                self.ingest_and_cleanup(path, dataset, download_done.is_set)
+            finally:
+                self.admission.release(dataset)
+
+        # Up to MAX_CONCURRENT_DOWNLOADS run at once; every dataset is
+        # ingested file by file while it is still downloading
+        results = self.scheduler.run(
+            [(dataset, self._download_dir(dataset)) for dataset in datasets],
+            can_start=can_start,
+            on_start=ingest,
+        )
+        for dataset, result in zip(datasets, results):
+            if result["status"] == "failed":
+                self.state.mark(dataset, "failed", error=result["error"])
+                self.admission.release(dataset)
+
+        completed = sum(r["status"] == "completed" for r in results)
+        logger.info(f"Cycle complete: {completed}/{len(results)} datasets downloaded")
+        return results
 
 if __name__ == "__main__":
     agent = SelfNutritionist()
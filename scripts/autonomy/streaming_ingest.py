@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+🛡️ SOVEREIGN TERRITORY - STREAMING INGESTION
+---------------------------------------------
+Memory- and disk-bounded Topological Deglutition.
+
+Instead of waiting for a whole dataset, indexing the entire directory and
+only then deleting it, files are eaten one bite at a time:
+
+1. Files are picked up as soon as they are complete (no ``.aria2`` control
+   file, no ``.part`` suffix), also while the download is still running.
+2. Every file is read in fixed-size chunks cut at line boundaries, through
+   ``mmap`` for large files.
+3. Chunks are processed by worker processes through a bounded window of
+   ``max_in_flight`` chunks and committed in order (e.g. to the indexer).
+4. Committed progress is checkpointed before the bytes behind it are
+   released: large files get the committed range punched out
+   (FALLOC_FL_PUNCH_HOLE) and every file is deleted once fully committed.
+
+Peak RAM is about ``max_in_flight * chunk_size``; raw data on disk only
+shrinks. After a crash, ``ingest`` resumes each file at its last committed
+offset (chunks after it may be committed twice, never lost).
+
+Guardian: Doxiwehu OmniMind
+"""
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("SelfNutritionist")
+
+CHECKPOINT_NAME = ".ingest_checkpoint.json"
+INCOMPLETE_SUFFIXES = (".aria2", ".part", ".tmp")
+
+_FALLOC_FL_KEEP_SIZE = 0x01
+_FALLOC_FL_PUNCH_HOLE = 0x02
+_fallocate = None
+
+
+def punch_hole(fd: int, offset: int, length: int) -> bool:
+    """Release the disk blocks of a byte range (Linux); False if unsupported."""
+    global _fallocate
+    if _fallocate is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            _fallocate = libc.fallocate
+            _fallocate.argtypes = [
+                ctypes.c_int,
+                ctypes.c_int,
+                ctypes.c_longlong,
+                ctypes.c_longlong,
+            ]
+        except (OSError, AttributeError, TypeError):
+            _fallocate = False
+    if not _fallocate or length <= 0:
+        return False
+    mode = _FALLOC_FL_PUNCH_HOLE | _FALLOC_FL_KEEP_SIZE
+    return _fallocate(fd, mode, offset, length) == 0
+
+
+def iter_chunks(
+    path: Path, start: int, chunk_size: int, mmap_threshold: int
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset, data) chunks of a file from ``start``.
+
+    Chunks end at the last newline inside ``chunk_size`` bytes (when there
+    is one), so line-oriented records are never split.
+    """
+    size = path.stat().st_size
+    if start >= size:
+        return
+    with open(path, "rb") as f:
+        if size >= mmap_threshold:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                offset = start
+                while offset < size:
+                    end = min(offset + chunk_size, size)
+                    if end < size:
+                        newline = view.rfind(b"\n", offset, end)
+                        if newline >= offset:
+                            end = newline + 1
+                    yield offset, view[offset:end]
+                    offset = end
+            return
+
+        f.seek(start)
+        offset = start
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                return
+            if offset + len(data) < size:
+                newline = data.rfind(b"\n")
+                if newline >= 0:
+                    data = data[: newline + 1]
+                    f.seek(offset + len(data))
+            yield offset, data
+            offset += len(data)
+
+
+def decode_text_chunk(data: bytes, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """Default chunk processor: decoded text plus its origin."""
+    return {**meta, "text": data.decode("utf-8", errors="replace")}
+
+
+class _Checkpoint:
+    """Committed offset per file, replaced atomically."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            with open(path) as f:
+                self.files: Dict[str, Dict[str, Any]] = json.load(f)["files"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.files = {}
+
+    def offset(self, name: str) -> int:
+        return self.files.get(name, {}).get("offset", 0)
+
+    def done(self, name: str) -> bool:
+        return self.files.get(name, {}).get("done", False)
+
+    def save(self, name: str, offset: int, done: bool = False) -> None:
+        self.files[name] = {"offset": offset, "done": done}
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"files": self.files}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+
+class StreamingIngestor:
+    """Chunked, bounded, checkpointed ingestion of a dataset directory."""
+
+    def __init__(
+        self,
+        process: Callable[[bytes, Dict[str, Any]], Any] = decode_text_chunk,
+        commit: Optional[Callable[[Any], None]] = None,
+        chunk_size: int = 4 << 20,
+        mmap_threshold: int = 64 << 20,
+        max_in_flight: int = 8,
+        workers: Optional[int] = None,
+        delete_sources: bool = True,
+        punch_threshold: int = 256 << 20,
+        poll_interval: float = 2.0,
+        settle_seconds: float = 30.0,
+    ):
+        """
+        Args:
+            process: Picklable ``process(data, meta)`` run in the workers
+                (meta: source, offset, length)
+            commit: Called in order in this process with every result, e.g.
+                the indexer upsert (default: results are only counted)
+            chunk_size: Bytes per chunk (upper bound)
+            mmap_threshold: Files at least this large are read through mmap
+            max_in_flight: Chunks read but not yet committed (RAM bound)
+            workers: Worker processes (default: CPU count; 0 = inline)
+            delete_sources: Delete each file once fully committed
+            punch_threshold: Files at least this large get committed ranges
+                punched out while they are still being read
+            poll_interval: Seconds between scans while a download runs
+            settle_seconds: A file untouched this long counts as complete
+                even while its download runs
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.process = process
+        self.commit = commit
+        self.chunk_size = chunk_size
+        self.mmap_threshold = mmap_threshold
+        self.max_in_flight = max_in_flight
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.delete_sources = delete_sources
+        self.punch_threshold = punch_threshold
+        self.poll_interval = poll_interval
+        self.settle_seconds = settle_seconds
+
+    # ------------------------------------------------------------------
+    # File discovery
+    # ------------------------------------------------------------------
+
+    def ready_files(self, dataset_dir: Path, download_done: bool) -> List[Path]:
+        """Complete data files below ``dataset_dir``, smallest first."""
+        now = time.time()
+        ready = []
+        for path in Path(dataset_dir).rglob("*"):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            if path.suffix in INCOMPLETE_SUFFIXES:
+                continue
+            if path.with_name(path.name + ".aria2").exists():
+                continue  # aria2c is still writing it
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if download_done or now - stat.st_mtime >= self.settle_seconds:
+                ready.append((stat.st_size, path))
+        return [path for _, path in sorted(ready)]
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def ingest(
+        self,
+        dataset_dir: Path,
+        download_done: Callable[[], bool] = lambda: True,
+        commit: Optional[Callable[[Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ingest every file of ``dataset_dir``, also while it is downloading.
+
+        Args:
+            dataset_dir: Dataset directory
+            download_done: Returns True once no more files will appear
+            commit: Overrides the ingestor's ``commit`` for this dataset
+
+        Returns:
+            Stats: files, chunks, bytes, peak_in_flight, seconds, records/s
+        """
+        dataset_dir = Path(dataset_dir)
+        commit = commit or self.commit
+        checkpoint = _Checkpoint(dataset_dir / CHECKPOINT_NAME)
+        stats = {"files": 0, "chunks": 0, "bytes": 0, "peak_in_flight": 0}
+        started = time.perf_counter()
+        handled = set()
+
+        pool = None
+        if self.workers > 0:
+            # Spawned workers: the agent process runs download/ingest threads
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            while True:
+                done = download_done()
+                new = [
+                    path
+                    for path in self.ready_files(dataset_dir, done)
+                    if path not in handled
+                ]
+                for path in new:
+                    handled.add(path)
+                    self._ingest_file(
+                        path, dataset_dir, checkpoint, pool, commit, stats
+                    )
+                if done and not new:
+                    break
+                if not new:
+                    time.sleep(self.poll_interval)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        stats["seconds"] = time.perf_counter() - started
+        stats["chunks_per_second"] = stats["chunks"] / max(stats["seconds"], 1e-9)
+        logger.info(
+            f"Streamed {stats['files']} files ({stats['bytes'] / 1024**2:.1f} MB, "
+            f"{stats['chunks']} chunks) in {stats['seconds']:.1f}s"
+        )
+        return stats
+
+    def _ingest_file(
+        self,
+        path: Path,
+        dataset_dir: Path,
+        checkpoint: _Checkpoint,
+        pool: Optional[ProcessPoolExecutor],
+        commit: Optional[Callable[[Any], None]],
+        stats: Dict[str, Any],
+    ) -> None:
+        name = str(path.relative_to(dataset_dir))
+        if checkpoint.done(name):
+            self._release(path)
+            return
+
+        size = path.stat().st_size
+        start = checkpoint.offset(name)
+        window: deque = deque()  # (offset, length, future) in file order
+
+        # Committed ranges of large files are released before the file ends
+        fd = None
+        if self.delete_sources and size >= self.punch_threshold:
+            fd = os.open(path, os.O_RDWR)
+        try:
+            for offset, data in iter_chunks(
+                path, start, self.chunk_size, self.mmap_threshold
+            ):
+                meta = {"source": name, "offset": offset, "length": len(data)}
+                if pool is None:
+                    future: Future = Future()
+                    future.set_result(self.process(data, meta))
+                else:
+                    future = pool.submit(self.process, data, meta)
+                window.append((offset, len(data), future))
+                stats["peak_in_flight"] = max(stats["peak_in_flight"], len(window))
+                del data
+                if len(window) >= self.max_in_flight:
+                    self._commit_oldest(window, name, checkpoint, fd, commit, stats)
+            while window:
+                self._commit_oldest(window, name, checkpoint, fd, commit, stats)
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+        checkpoint.save(name, size, done=True)
+        stats["files"] += 1
+        self._release(path)
+
+    def _commit_oldest(
+        self,
+        window: deque,
+        name: str,
+        checkpoint: _Checkpoint,
+        fd: Optional[int],
+        commit: Optional[Callable[[Any], None]],
+        stats: Dict[str, Any],
+    ) -> None:
+        offset, length, future = window.popleft()
+        result = future.result()
+        if commit is not None:
+            commit(result)
+        # Checkpoint first: released bytes must never be needed again
+        checkpoint.save(name, offset + length)
+        if fd is not None:
+            punch_hole(fd, offset, length)
+        stats["chunks"] += 1
+        stats["bytes"] += length
+
+    def _release(self, path: Path) -> None:
+        if self.delete_sources:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
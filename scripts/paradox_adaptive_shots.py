@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Adaptive Shot Allocation (Public Version)
+====================================================
+
+Sequential sampling that stops as soon as the interpretation is settled.
+
+``_interpret_result`` only distinguishes three buckets:
+
+- superposition: normalized entropy > 0.8
+- resolved: otherwise, dominant-state probability > 0.7
+- equilibrium: everything else
+
+Shots are taken in rounds. After each round a Wilson interval is computed
+for the dominant-state probability and a multinomial bootstrap interval for
+the normalized entropy. Sampling stops once both intervals lie on one side
+of the thresholds that decide the bucket, or when the shot or time budget
+runs out. The per-round error rate is the overall one divided by the
+maximum number of rounds (Bonferroni), so peeking after every round does
+not inflate the chance of settling on the wrong bucket.
+
+Every round is a separate Sampler job, so on a shared device each round
+waits in the queue again. Adaptive sampling saves shots, not wall time: on
+a busy backend prefer a larger ``initial_shots`` (most paradoxes settle in
+the first round), or stop starting new rounds after ``max_seconds``.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import logging
+import math
+import time
+from collections import Counter
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from paradox_counts import SparseCounts
+
+logger = logging.getLogger("ParadoxRunner")
+
+ENTROPY_THRESHOLD = 0.8
+DOMINANCE_THRESHOLD = 0.7
+
+
+def interpretation_bucket(entropy: float, dominant_probability: float) -> str:
+    """The interpretation bucket of a normalized entropy / dominance pair."""
+    if entropy > ENTROPY_THRESHOLD:
+        return "superposition"
+    if dominant_probability > DOMINANCE_THRESHOLD:
+        return "resolved"
+    return "equilibrium"
+
+
+def wilson_interval(successes: int, trials: int, alpha: float) -> Tuple[float, float]:
+    """Two-sided Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    half /= denominator
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def entropy_interval(
+    sparse: SparseCounts, alpha: float, resamples: int, rng: np.random.Generator
+) -> Tuple[float, float]:
+    """Percentile bootstrap interval of the normalized entropy."""
+    if sparse.num_bits == 0 or len(sparse) < 2:
+        # A single observed outcome: every resample has entropy 0
+        return 0.0, 0.0
+    p = sparse.probabilities()
+    samples = rng.multinomial(int(sparse.shots), p, size=resamples) / sparse.shots
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(samples > 0, samples * np.log2(samples), 0.0)
+    entropies = -terms.sum(axis=1) / sparse.num_bits
+    low, high = np.quantile(entropies, [alpha / 2, 1 - alpha / 2])
+    return float(low), float(high)
+
+
+def settled_bucket(
+    entropy_ci: Tuple[float, float], dominance_ci: Tuple[float, float]
+) -> Optional[str]:
+    """The bucket both intervals agree on, or None while undecided."""
+    if entropy_ci[0] > ENTROPY_THRESHOLD:
+        return "superposition"
+    if entropy_ci[1] <= ENTROPY_THRESHOLD:
+        if dominance_ci[0] > DOMINANCE_THRESHOLD:
+            return "resolved"
+        if dominance_ci[1] <= DOMINANCE_THRESHOLD:
+            return "equilibrium"
+    return None
+
+
+class AdaptiveShotPolicy:
+    """Round sizes, budgets and confidence level of adaptive sampling."""
+
+    def __init__(
+        self,
+        initial_shots: int = 256,
+        round_shots: int = 256,
+        max_shots: int = 4096,
+        max_seconds: Optional[float] = None,
+        confidence: float = 0.95,
+        bootstrap_resamples: int = 400,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize policy.
+
+        Args:
+            initial_shots: Shots of the first round
+            round_shots: Shots of every further round
+            max_shots: Shot budget
+            max_seconds: Wall-clock budget (None = unlimited)
+            confidence: Overall confidence of the settled bucket
+            bootstrap_resamples: Bootstrap resamples for the entropy interval
+            seed: Bootstrap seed
+        """
+        if not 0 < initial_shots <= max_shots or round_shots < 1:
+            raise ValueError("Need 0 < initial_shots <= max_shots and round_shots >= 1")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be in (0, 1)")
+
+        self.initial_shots = initial_shots
+        self.round_shots = round_shots
+        self.max_shots = max_shots
+        self.max_seconds = max_seconds
+        self.confidence = confidence
+        self.bootstrap_resamples = bootstrap_resamples
+        self.seed = seed
+
+    @property
+    def max_rounds(self) -> int:
+        return 1 + math.ceil((self.max_shots - self.initial_shots) / self.round_shots)
+
+    @property
+    def round_alpha(self) -> float:
+        """Per-round error rate (Bonferroni over all possible rounds)."""
+        return (1 - self.confidence) / self.max_rounds
+
+    def run(
+        self, sample: Callable[[int], Dict[str, int]]
+    ) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        """
+        Sample in rounds until the bucket is settled or the budget is spent.
+
+        Args:
+            sample: Callable shots -> counts, e.g. one Sampler job per call
+                (each call queues again on a shared device)
+
+        Returns:
+            Tuple (accumulated counts, adaptive metrics)
+        """
+        rng = np.random.default_rng(self.seed)
+        alpha = self.round_alpha
+        counts: Counter = Counter()
+        shots = 0
+        rounds = 0
+        start = time.perf_counter()
+
+        while True:
+            round_size = self.initial_shots if rounds == 0 else self.round_shots
+            round_size = min(round_size, self.max_shots - shots)
+            counts.update(sample(round_size))
+            shots += round_size
+            rounds += 1
+
+            sparse = SparseCounts.from_dict(counts)
+            dominant = sparse.top_k(1)[0][1]
+            entropy_ci = entropy_interval(
+                sparse, alpha, self.bootstrap_resamples, rng
+            )
+            dominance_ci = wilson_interval(int(dominant), int(sparse.shots), alpha)
+            bucket = settled_bucket(entropy_ci, dominance_ci)
+
+            elapsed = time.perf_counter() - start
+            logger.info(
+                f"   Round {rounds}: {shots} shots, entropy "
+                f"[{entropy_ci[0]:.3f}, {entropy_ci[1]:.3f}], dominance "
+                f"[{dominance_ci[0]:.3f}, {dominance_ci[1]:.3f}]"
+                + (f" → {bucket}" if bucket else "")
+            )
+
+            if bucket is not None:
+                stop_reason = "settled"
+            elif shots >= self.max_shots:
+                stop_reason = "shot_budget"
+            elif self.max_seconds is not None and elapsed >= self.max_seconds:
+                stop_reason = "time_budget"
+            else:
+                continue
+            break
+
+        return dict(counts), {
+            "shots_used": shots,
+            "rounds": rounds,
+            "stop_reason": stop_reason,
+            "settled_bucket": bucket,
+            "confidence": self.confidence,
+            "entropy_ci": list(entropy_ci),
+            "dominant_probability_ci": list(dominance_ci),
+            "sampling_time_seconds": elapsed,
+        }
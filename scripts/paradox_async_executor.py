@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Pipelined Asynchronous Paradox Executor (Public Version)
+===================================================================
+
+asyncio executor that overlaps the stages of ParadoxExperimentRunner.
+
+``run_paradox`` builds, transpiles, submits and then blocks on
+``job.result()`` before touching the next paradox. Here the next circuit is
+built and transpiled while earlier jobs wait in the queue, up to
+``max_in_flight`` jobs are polled concurrently with exponential backoff, and
+every result is written as soon as its job completes.
+
+Blocking calls (transpilation, submission, polling, downloads, file writes)
+run in worker threads so the event loop only schedules.
+
+With a job journal, paradoxes and jobs are journaled as in ``run_paradox``,
+so an interrupted pipelined run can be finished with ``resume()``.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from paradox_tracing import stopwatch
+
+logger = logging.getLogger("ParadoxRunner")
+
+
+def _default_sampler_factory(backend):
+    from qiskit_ibm_runtime import SamplerV2
+
+    return SamplerV2(mode=backend)
+
+
+class AsyncParadoxExecutor:
+    """Pipelines build → transpile → submit → poll → write across paradoxes."""
+
+    def __init__(
+        self,
+        runner,
+        max_in_flight: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+        sampler_factory: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            runner: ParadoxExperimentRunner providing backend, cache and output
+            max_in_flight: Maximum number of submitted, unfinished jobs
+            poll_interval: First delay between status polls (seconds)
+            max_poll_interval: Upper bound of the backoff delay (seconds)
+            backoff_factor: Multiplier applied to the delay after each poll
+            sampler_factory: Callable backend -> sampler (default: SamplerV2).
+                Lets tests inject samplers with simulated queue delays.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be a positive integer")
+
+        self.runner = runner
+        self.max_in_flight = max_in_flight
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.sampler_factory = sampler_factory or _default_sampler_factory
+
+    async def run(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        collect: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute the selected paradoxes through the pipeline.
+
+        Args:
+            paradox_names: Keys of ``builders`` to run (default: all of them)
+            builders: Mapping name -> (circuit_builder, description)
+                (default: ``PARADOX_BUILDERS``)
+            shots: Shots per circuit
+            collect: Keep the results to return them (False: they are only
+                written to the runner's result store)
+
+        Returns:
+            List of experiment results, in the order of ``paradox_names``
+            (None when ``collect`` is False)
+        """
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+
+        runner = self.runner
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        results: Dict[str, Dict[str, Any]] = {}
+        # Results are always in the runner's store; keep them only if asked
+        keep = results.__setitem__ if collect else lambda name, result: None
+        jobs: Set[asyncio.Task] = set()  # unfinished jobs only
+
+        logger.info(
+            f"⚡ Pipelined execution: {len(paradox_names)} paradoxes, "
+            f"{self.max_in_flight} jobs in flight"
+        )
+
+        for paradox_name in paradox_names:
+            paradox_dir = runner._paradox_dir(paradox_name)
+            try:
+                circuit_builder, description = builders[paradox_name]
+                qc = await asyncio.to_thread(runner._build, circuit_builder)
+                planned = await asyncio.to_thread(
+                    runner._journal_plan, paradox_name, qc, shots, "async"
+                )
+                transpiled, transpile_time, cache_hit = await asyncio.to_thread(
+                    runner._transpile, qc
+                )
+                logger.info(
+                    f"🔧 {paradox_name} transpiled in {transpile_time:.2f}s"
+                    + (" (cache hit)" if cache_hit else "")
+                )
+            except Exception as e:
+                logger.error(f"❌ Error preparing {paradox_name}: {e}")
+                keep(
+                    paradox_name,
+                    await asyncio.to_thread(
+                        runner._record_error, paradox_name, paradox_dir, e
+                    ),
+                )
+                continue
+
+            # Wait for a free slot; earlier jobs keep being polled meanwhile
+            await in_flight.acquire()
+            job = asyncio.create_task(
+                self._execute(
+                    in_flight,
+                    keep,
+                    paradox_name,
+                    description,
+                    paradox_dir,
+                    qc,
+                    transpiled,
+                    planned,
+                    {
+                        "transpile_time_seconds": transpile_time,
+                        "transpile_cache_hit": cache_hit,
+                        "shots": shots,
+                    },
+                )
+            )
+            jobs.add(job)
+            job.add_done_callback(jobs.discard)
+
+        await asyncio.gather(*jobs)
+        await asyncio.to_thread(runner._record_cache_stats)
+
+        if not collect:
+            return None
+        return [results[name] for name in paradox_names]
+
+    async def _execute(
+        self,
+        in_flight: asyncio.Semaphore,
+        keep: Callable[[str, Dict[str, Any]], None],
+        paradox_name: str,
+        description: str,
+        paradox_dir,
+        circuit,
+        transpiled,
+        planned: Optional[str],
+        metrics: Dict[str, Any],
+    ) -> None:
+        """
+        Submit one circuit, wait for it without blocking, and save its result.
+
+        Journaled like ``run_paradox``: a job an interrupted run left
+        unconsumed is re-attached, and the job is only completed once the
+        result is recorded.
+        """
+        runner = self.runner
+        try:
+            await asyncio.to_thread(runner._calibrate_readout, [transpiled])
+            start_exec = time.perf_counter()
+            job, submit_seconds = await asyncio.to_thread(
+                runner._submit,
+                lambda: self.sampler_factory(runner._execution_backend()),
+                [transpiled],
+                metrics["shots"],
+                circuits=[circuit],
+            )
+            logger.info(f"🚀 {paradox_name} submitted (Job ID: {job.job_id()})")
+
+            with stopwatch() as waited:
+                await self._wait_for(job)
+                try:
+                    result = await asyncio.to_thread(job.result)
+                except Exception as e:
+                    await asyncio.to_thread(runner._journal_failed, job, e)
+                    raise
+            metrics["execution_time_seconds"] = time.perf_counter() - start_exec
+            stages = {"submit": submit_seconds}
+            stages.update(
+                await asyncio.to_thread(runner.tracer.record_job, job, waited.seconds)
+            )
+            metrics["stage_seconds"] = stages
+            logger.info(
+                f"✅ {paradox_name} result received "
+                f"({metrics['execution_time_seconds']:.2f}s)"
+            )
+
+            counts = runner._extract_counts(result[0])
+            result_data = await asyncio.to_thread(
+                runner._record_result,
+                paradox_name,
+                description,
+                paradox_dir,
+                counts,
+                metrics,
+                circuit=circuit,
+                transpiled=transpiled,
+            )
+            await asyncio.to_thread(
+                runner._journal_recorded,
+                paradox_name,
+                planned,
+                metrics["shots"],
+                paradox_dir,
+            )
+            await asyncio.to_thread(runner._journal_completed, [job])
+            keep(paradox_name, result_data)
+        except Exception as e:
+            logger.error(f"❌ Error in {paradox_name}: {e}")
+            keep(
+                paradox_name,
+                await asyncio.to_thread(
+                    runner._record_error, paradox_name, paradox_dir, e
+                ),
+            )
+        finally:
+            in_flight.release()
+
+    async def _wait_for(self, job) -> None:
+        """Poll a job until it reaches a final state, backing off between polls."""
+        delay = self.poll_interval
+        while not await asyncio.to_thread(job.in_final_state):
+            await asyncio.sleep(delay)
+            delay = min(delay * self.backoff_factor, self.max_poll_interval)
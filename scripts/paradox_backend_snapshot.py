@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Backend Target Snapshots (Public Version)
+====================================================
+
+Local, TTL-bounded cache of the selected backend's transpilation data.
+
+``connect_ibm`` used to call ``least_busy`` and ``backend.status()`` on every
+start, and transpilation needed the live backend object. A snapshot stores
+what transpilation actually reads (the ``Target``, its coupling map and the
+calibration properties) so the runner can start, transpile and dry-run with
+no network. ``SnapshotBackend`` is the offline stand-in built from it: it
+fingerprints exactly like the live backend it was taken from, so transpile
+cache entries are shared between online and offline runs.
+
+Stale snapshots are still served immediately; a daemon thread refreshes them
+in the background and hands the fresh stand-in to the caller.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import json
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from paradox_transpile_cache import backend_fingerprint
+
+logger = logging.getLogger("ParadoxRunner")
+
+DEFAULT_TTL_SECONDS = 6 * 3600
+
+
+class SnapshotBackend:
+    """Offline backend stand-in: target and calibration, but no execution."""
+
+    def __init__(self, snapshot: Dict[str, Any]):
+        self.name = snapshot["name"]
+        self.num_qubits = snapshot["num_qubits"]
+        self.backend_version = snapshot["backend_version"]
+        self.status_msg = snapshot["status"]
+        self.saved_at = snapshot["saved_at"]
+        self.target = snapshot["target"]
+        self._properties = snapshot["properties"]
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was taken."""
+        return time.time() - self.saved_at
+
+    @property
+    def coupling_map(self):
+        return self.target.build_coupling_map()
+
+    @property
+    def operation_names(self) -> List[str]:
+        return list(self.target.operation_names)
+
+    def properties(self):
+        """Calibration properties captured with the snapshot (may be None)."""
+        return self._properties
+
+    def run(self, *args: Any, **kwargs: Any):
+        raise RuntimeError(
+            f"{self.name} is an offline snapshot; connect to execute circuits"
+        )
+
+    def __repr__(self) -> str:
+        return f"<SnapshotBackend {self.name} ({self.num_qubits} qubits)>"
+
+
+def capture_snapshot(backend) -> Dict[str, Any]:
+    """Collect the transpilation-relevant state of a live backend."""
+    try:
+        properties = backend.properties()
+    except Exception:
+        properties = None
+    try:
+        status = backend.status().status_msg
+    except Exception:
+        status = "unknown"
+
+    target = backend.target
+    coupling_map = target.build_coupling_map()
+    return {
+        "name": backend.name,
+        "num_qubits": backend.num_qubits,
+        "backend_version": str(getattr(backend, "backend_version", "")),
+        "status": status,
+        "saved_at": time.time(),
+        "coupling_map": (
+            [list(edge) for edge in coupling_map.get_edges()]
+            if coupling_map is not None
+            else None
+        ),
+        "target": target,
+        "properties": properties,
+    }
+
+
+class BackendSnapshotCache:
+    """On-disk backend snapshots with a time-to-live."""
+
+    def __init__(
+        self, cache_dir: Optional[Path] = None, ttl: float = DEFAULT_TTL_SECONDS
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding the snapshots
+                (default: results/backend_snapshots)
+            ttl: Age in seconds after which a snapshot is refreshed
+        """
+        self.cache_dir = Path(cache_dir or "results/backend_snapshots")
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing: Optional[threading.Thread] = None
+
+    def save(self, backend) -> SnapshotBackend:
+        """Snapshot a live backend and make it the latest one."""
+        snapshot = capture_snapshot(backend)
+        stand_in = SnapshotBackend(snapshot)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with self._lock:
+            self._write(f"{snapshot['name']}.pkl", pickle.dumps(snapshot))
+            # Human-readable sidecar: everything but the pickled objects
+            summary = {
+                k: v for k, v in snapshot.items() if k not in ("target", "properties")
+            }
+            summary["saved_at_iso"] = datetime.fromtimestamp(
+                snapshot["saved_at"]
+            ).isoformat()
+            # Transpile cache keys can be derived without unpickling the target
+            summary["fingerprint"] = backend_fingerprint(stand_in)
+            self._write(
+                f"{snapshot['name']}.json", json.dumps(summary, indent=2).encode()
+            )
+            self._write("latest.json", json.dumps({"name": snapshot["name"]}).encode())
+
+        logger.info(f"📦 Backend snapshot saved: {snapshot['name']}")
+        return stand_in
+
+    def load(self, name: Optional[str] = None) -> Optional[SnapshotBackend]:
+        """
+        Load a snapshot, stale or not.
+
+        Args:
+            name: Backend name (default: the most recently saved backend)
+
+        Returns:
+            The stand-in, or None if nothing usable is cached
+        """
+        try:
+            if name is None:
+                with open(self.cache_dir / "latest.json") as f:
+                    name = json.load(f)["name"]
+            with open(self.cache_dir / f"{name}.pkl", "rb") as f:
+                return SnapshotBackend(pickle.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Unreadable or written by an incompatible qiskit version
+            logger.warning(f"⚠️ Ignoring backend snapshot {name}: {e}")
+            return None
+
+    def load_summary(self, name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a snapshot's JSON sidecar only (no qiskit import, no unpickling).
+
+        Args:
+            name: Backend name (default: the most recently saved backend)
+        """
+        try:
+            if name is None:
+                with open(self.cache_dir / "latest.json") as f:
+                    name = json.load(f)["name"]
+            with open(self.cache_dir / f"{name}.json") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError, KeyError):
+            return None
+
+    def is_stale(self, snapshot: SnapshotBackend) -> bool:
+        return snapshot.age > self.ttl
+
+    def refresh_async(
+        self,
+        fetch: Callable[[], Any],
+        on_refresh: Optional[Callable[[Any, SnapshotBackend], None]] = None,
+    ) -> threading.Thread:
+        """
+        Refresh a snapshot in a daemon thread (at most one refresh at a time).
+
+        Args:
+            fetch: Returns the live backend (does the network calls)
+            on_refresh: Called in the refresh thread with the live backend
+                and its new stand-in once it was snapshotted
+
+        Returns:
+            The refresh thread (join it to wait for completion)
+        """
+
+        def refresh() -> None:
+            try:
+                backend = fetch()
+                stand_in = self.save(backend)
+                if on_refresh is not None:
+                    on_refresh(backend, stand_in)
+            except Exception as e:
+                logger.warning(f"⚠️ Backend snapshot refresh failed: {e}")
+
+        with self._lock:
+            if self._refreshing is None or not self._refreshing.is_alive():
+                self._refreshing = threading.Thread(
+                    target=refresh, name="backend-snapshot-refresh", daemon=True
+                )
+                self._refreshing.start()
+            return self._refreshing
+
+    def _write(self, filename: str, data: bytes) -> None:
+        # Atomic replace: concurrent readers never see a partial snapshot
+        path = self.cache_dir / filename
+        tmp = path.with_name(f".{filename}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
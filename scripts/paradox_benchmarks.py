@@ -0,0 +1,649 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Offline Benchmark Suite (Public Version)
+===================================================
+
+Times the local hot path, without any QPU or network access:
+
+- build: every PARADOX_BUILDERS entry over growing sizes (Collatz n up to
+  10^6, halting ``program_length`` up to thousands), directly and through
+  the registry's template cache
+- transpile: optimization levels 0-3 against a saved fake target
+  (FakeTorino, snapshotted once under ``benchmarks/targets/``)
+- simulate: exact ideal distribution (stabilizer tableau) and sampling,
+  plus Aer for small circuits when qiskit-aer is installed
+- analyze: counts parsing, entropy, top states and ideal distances, as done
+  for every recorded result
+
+Each case is timed like ``timeit``: the loop count is calibrated first, then
+the best and median of ``repeat`` loops are stored. Results are written as a
+JSON baseline; ``compare`` flags cases slower than a baseline by more than a
+threshold (and exits non-zero, so it can gate CI). ``scaling`` fits the
+construction time of the parametric builders against their size and fails
+when growth is worse than linear. ``startup`` times ``paradox_cli.py list``
+and a warm ``dry-run`` as fresh processes and fails when either exceeds its
+budget (or leaves a run directory behind).
+
+Usage:
+    python scripts/paradox_benchmarks.py run --quick --save-baseline
+    python scripts/paradox_benchmarks.py run --output results/benchmarks/new.json
+    python scripts/paradox_benchmarks.py compare benchmarks/baseline.json \\
+        results/benchmarks/new.json --threshold 0.25
+    python scripts/paradox_benchmarks.py scaling --max-exponent 1.2
+    python scripts/paradox_benchmarks.py startup --budget 0.3
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+logger = logging.getLogger("ParadoxRunner")
+
+SCHEMA_VERSION = 1
+DEFAULT_DIR = Path("benchmarks")
+DEFAULT_BASELINE = DEFAULT_DIR / "baseline.json"
+DEFAULT_OUTPUT_DIR = Path("results/benchmarks")
+TARGET_BACKEND = "fake_torino"
+
+GROUPS = ("build", "transpile", "simulate", "analyze")
+
+# Sizes per paradox; --quick keeps the first QUICK_SIZES entries of each list
+BUILD_SIZES = {
+    "collatz_conjecture": [{"n": n} for n in (7, 10**2, 10**3, 10**4, 10**5, 10**6)],
+    "halting_problem": [
+        {"program_length": length} for length in (3, 16, 64, 256, 1024, 4096)
+    ],
+}
+TRANSPILE_SIZES = {
+    "collatz_conjecture": [{"n": n} for n in (7, 10**3, 10**6)],
+    "halting_problem": [{"program_length": length} for length in (3, 16, 64)],
+}
+# The stabilizer tableau is cubic in the qubit count: stop at a few hundred
+SIMULATE_SIZES = {
+    "collatz_conjecture": [{"n": n} for n in (7, 10**3, 10**6)],
+    "halting_problem": [{"program_length": length} for length in (3, 64, 256)],
+}
+ANALYZE_SHOTS = (1024, 100_000, 1_000_000)
+# Builder parameter swept by the scaling check (circuit size is linear in it)
+SCALING_PARAMS = {
+    "halting_problem": ("program_length", {}),
+    "collatz_conjecture": ("max_steps", {"n": 10**6}),
+}
+SCALING_SIZES = (256, 1024, 4096, 16384)
+# CLI commands that must start within the startup budget (warm caches)
+STARTUP_COMMANDS = (["list"], ["dry-run", "--offline"])
+CLI_SCRIPT = Path(__file__).resolve().parent / "paradox_cli.py"
+QUICK_SIZES = 3
+AER_MAX_QUBITS = 24
+SIMULATION_SHOTS = 1024
+
+
+class Case(NamedTuple):
+    """One benchmark: a stable name, the timed callable and its metadata."""
+
+    name: str
+    group: str
+    func: Callable[[], Any]
+    info: Dict[str, Any]
+
+
+def _label(params: Dict[str, Any]) -> str:
+    return ",".join(f"{k}={v}" for k, v in sorted(params.items())) or "default"
+
+
+def _sizes(table: Dict[str, List[Dict[str, Any]]], name: str, quick: bool):
+    sizes = table.get(name, [{}])
+    return sizes[:QUICK_SIZES] if quick else sizes
+
+
+def load_target(target_dir: Optional[Path] = None):
+    """
+    The saved fake backend every transpile benchmark runs against.
+
+    The snapshot is taken once from FakeTorino and reused, so baselines do
+    not move when the fake provider's calibration data is updated. It is
+    re-created if it was written by an incompatible qiskit version.
+    """
+    from paradox_backend_snapshot import BackendSnapshotCache
+
+    cache = BackendSnapshotCache(target_dir or DEFAULT_DIR / "targets")
+    snapshot = cache.load(TARGET_BACKEND)
+    if snapshot is None:
+        from qiskit_ibm_runtime.fake_provider import FakeTorino
+
+        snapshot = cache.save(FakeTorino())
+    return snapshot
+
+
+def environment() -> Dict[str, Any]:
+    """Versions and machine the timings were taken on."""
+    import numpy
+    import qiskit
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "qiskit": qiskit.__version__,
+        "numpy": numpy.__version__,
+    }
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+
+
+def build_cases(quick: bool = False) -> Iterator[Case]:
+    from paradox_circuit_builders import PARADOX_BUILDERS
+
+    for name in PARADOX_BUILDERS:
+        builder = PARADOX_BUILDERS.spec(name).builder
+        for params in _sizes(BUILD_SIZES, name, quick):
+            circuit = builder(**params)
+            info = {
+                "paradox": name,
+                "params": params,
+                "qubits": circuit.num_qubits,
+                "size": circuit.size(),
+            }
+            label = f"{name}/{_label(params)}"
+            yield Case(
+                f"build/{label}",
+                "build",
+                lambda b=builder, p=params: b(**p),
+                info,
+            )
+            yield Case(
+                f"build_registry/{label}",
+                "build",
+                lambda n=name, p=params: PARADOX_BUILDERS.build(n, **p),
+                info,
+            )
+
+
+def transpile_cases(quick: bool = False, target_dir: Optional[Path] = None):
+    from paradox_circuit_builders import PARADOX_BUILDERS
+    from paradox_transpile_pool import transpile_circuit
+
+    backend = load_target(target_dir)
+    levels = (0, 1) if quick else (0, 1, 2, 3)
+    for name in PARADOX_BUILDERS:
+        for params in _sizes(TRANSPILE_SIZES, name, quick):
+            circuit = PARADOX_BUILDERS.build(name, **params)
+            if circuit.num_qubits > backend.num_qubits:
+                continue
+            for level in levels:
+                yield Case(
+                    f"transpile/{name}/{_label(params)}/O{level}",
+                    "transpile",
+                    lambda c=circuit, o=level: transpile_circuit(
+                        c, backend.target, optimization_level=o, seed_transpiler=42
+                    ),
+                    {
+                        "paradox": name,
+                        "params": params,
+                        "qubits": circuit.num_qubits,
+                        "optimization_level": level,
+                        "target": backend.name,
+                    },
+                )
+
+
+def simulate_cases(quick: bool = False) -> Iterator[Case]:
+    from paradox_circuit_builders import PARADOX_BUILDERS
+    from paradox_ideal_simulator import ideal_distribution
+
+    try:
+        from qiskit_aer import AerSimulator
+
+        aer = AerSimulator(seed_simulator=42)
+    except ImportError:
+        aer = None
+
+    for name in PARADOX_BUILDERS:
+        for params in _sizes(SIMULATE_SIZES, name, quick):
+            circuit = PARADOX_BUILDERS.build(name, **params)
+            info = {"paradox": name, "params": params, "qubits": circuit.num_qubits}
+            label = f"{name}/{_label(params)}"
+            yield Case(
+                f"simulate_ideal/{label}",
+                "simulate",
+                lambda c=circuit: ideal_distribution(c).sample(
+                    SIMULATION_SHOTS, seed=42
+                ),
+                info,
+            )
+            if aer is not None and circuit.num_qubits <= AER_MAX_QUBITS:
+                yield Case(
+                    f"simulate_aer/{label}",
+                    "simulate",
+                    lambda c=circuit: aer.run(c, shots=SIMULATION_SHOTS)
+                    .result()
+                    .get_counts(),
+                    info,
+                )
+
+
+def analyze_counts(counts: Dict[str, int], ideal) -> Dict[str, Any]:
+    """The per-result analysis of the runner, without writing anything."""
+    from paradox_adaptive_shots import interpretation_bucket
+    from paradox_counts import SparseCounts
+
+    sparse = SparseCounts.from_dict(counts)
+    top = sparse.top_k(5)
+    entropy = sparse.entropy(normalized=True)
+    return {
+        "top": top,
+        "distances": sparse.distances(ideal),
+        "bucket": interpretation_bucket(entropy, top[0][1] / sparse.shots),
+    }
+
+
+def analyze_cases(quick: bool = False) -> Iterator[Case]:
+    from paradox_circuit_builders import PARADOX_BUILDERS
+    from paradox_ideal_simulator import ideal_distribution
+
+    # 2^16 equally likely outcomes: the largest ideal support the runner
+    # enumerates for its distances
+    circuit = PARADOX_BUILDERS.build("halting_problem", program_length=15)
+    distribution = ideal_distribution(circuit)
+    ideal = distribution.probabilities()
+    for shots in ANALYZE_SHOTS[: 2 if quick else None]:
+        counts = distribution.sample(shots, seed=42)
+        yield Case(
+            f"analyze/halting_problem/shots={shots}",
+            "analyze",
+            lambda c=counts: analyze_counts(c, ideal),
+            {"shots": shots, "outcomes": len(counts), "qubits": circuit.num_qubits},
+        )
+
+
+# ----------------------------------------------------------------------
+# Running
+# ----------------------------------------------------------------------
+
+
+def time_case(func: Callable[[], Any], repeat: int = 5) -> Dict[str, Any]:
+    """Best and median seconds per call over ``repeat`` calibrated loops."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "min_seconds": min(samples),
+        "median_seconds": statistics.median(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(
+    groups: Optional[List[str]] = None,
+    quick: bool = False,
+    repeat: int = 5,
+    match: Optional[str] = None,
+    target_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Run the selected benchmark groups.
+
+    Args:
+        groups: Subset of GROUPS (default: all)
+        quick: Only the smaller sizes and optimization levels 0-1
+        repeat: Timed loops per case
+        match: Only cases whose name contains this substring
+        target_dir: Directory of the saved fake target
+
+    Returns:
+        Baseline document: environment and per-case timings
+    """
+    factories = {
+        "build": lambda: build_cases(quick),
+        "transpile": lambda: transpile_cases(quick, target_dir),
+        "simulate": lambda: simulate_cases(quick),
+        "analyze": lambda: analyze_cases(quick),
+    }
+    results: Dict[str, Dict[str, Any]] = {}
+    for group in groups or GROUPS:
+        for case in factories[group]():
+            if match and match not in case.name:
+                continue
+            timing = time_case(case.func, repeat)
+            results[case.name] = {"group": case.group, **timing, "info": case.info}
+            logger.info(f"⏱️ {case.name}: {_format_seconds(timing['min_seconds'])}")
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "quick": quick,
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def save(document: Dict[str, Any], path: Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(document, f, indent=2)
+    os.replace(tmp, path)
+    return path
+
+
+def load(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(
+            f"{path}: unsupported benchmark schema {document.get('schema')}"
+        )
+    return document
+
+
+def scaling_exponent(sizes: List[int], seconds: List[float]) -> float:
+    """Least-squares slope of log(seconds) over log(size): 1.0 = linear."""
+    import numpy as np
+
+    return float(np.polyfit(np.log(sizes), np.log(seconds), 1)[0])
+
+
+def check_scaling(
+    max_exponent: float = 1.2,
+    sizes: Sequence[int] = SCALING_SIZES,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Size-scaling check of the parametric circuit builders.
+
+    Returns:
+        One row per builder: swept parameter, sizes, best seconds per size,
+        fitted exponent and whether it stays within ``max_exponent``
+    """
+    from paradox_circuit_builders import PARADOX_BUILDERS
+
+    rows = []
+    for name, (param, fixed) in SCALING_PARAMS.items():
+        builder = PARADOX_BUILDERS.spec(name).builder
+        timers = [
+            timeit.Timer(lambda v=value: builder(**fixed, **{param: v}))
+            for value in sizes
+        ]
+        # Every size gets about the work of one build of the largest, and
+        # sizes are interleaved in every round, so load that drifts during
+        # the check slows all of them alike instead of bending the fit
+        numbers = [max(1, max(sizes) // value) for value in sizes]
+        seconds = [float("inf")] * len(sizes)
+        for _ in range(repeat):
+            for i, (timer, number) in enumerate(zip(timers, numbers)):
+                seconds[i] = min(seconds[i], timer.timeit(number) / number)
+        exponent = scaling_exponent(list(sizes), seconds)
+        rows.append(
+            {
+                "paradox": name,
+                "param": param,
+                "sizes": list(sizes),
+                "seconds": seconds,
+                "exponent": exponent,
+                "linear": exponent <= max_exponent,
+            }
+        )
+    return rows
+
+
+def check_startup(
+    budget: float = 0.3,
+    repeat: int = 5,
+    target_dir: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Startup check of the CLI: wall time of fresh ``paradox_cli.py`` processes.
+
+    Runs in a scratch directory holding a snapshot of the saved benchmark
+    target, a built circuit bundle and a warm transpile cache (the state
+    after a first online run), so it measures start-up, not transpilation.
+
+    Returns:
+        One row per command: wall seconds per run, median, budget, whether
+        the median is within it and whether no run directory was created
+    """
+    from paradox_backend_snapshot import BackendSnapshotCache
+
+    target = load_target(target_dir)
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="paradox_startup_") as workspace:
+        BackendSnapshotCache(Path(workspace) / "results/backend_snapshots").save(
+            target
+        )
+
+        def cli(args: List[str]) -> float:
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, str(CLI_SCRIPT), *args],
+                cwd=workspace,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            return time.perf_counter() - start
+
+        cli(["build"])
+        cli(["dry-run", "--offline"])  # warm the transpile cache
+        for args in STARTUP_COMMANDS:
+            seconds = [cli(args) for _ in range(repeat)]
+            median = statistics.median(seconds)
+            run_dirs = list((Path(workspace) / "results").glob("run_*"))
+            rows.append(
+                {
+                    "command": " ".join(args),
+                    "seconds": seconds,
+                    "median_seconds": median,
+                    "budget_seconds": budget,
+                    "within_budget": median <= budget,
+                    "run_dirs": len(run_dirs),
+                }
+            )
+    return rows
+
+
+# ----------------------------------------------------------------------
+# Comparison
+# ----------------------------------------------------------------------
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.25,
+    noise_floor: float = 0.0005,
+) -> List[Dict[str, Any]]:
+    """
+    Compare two benchmark documents case by case.
+
+    The best time of each case is compared (the least noisy statistic). A
+    case regresses when it is more than ``threshold`` slower and the
+    slowdown exceeds ``noise_floor`` seconds.
+
+    Returns:
+        One row per case: name, baseline/current seconds, ratio and status
+        (regression, improved, ok, new or missing)
+    """
+    rows = []
+    old, new = baseline["results"], current["results"]
+    for name in sorted(set(old) | set(new)):
+        if name not in new:
+            rows.append({"name": name, "status": "missing"})
+            continue
+        if name not in old:
+            rows.append(
+                {"name": name, "status": "new", "current": new[name]["min_seconds"]}
+            )
+            continue
+
+        before = old[name]["min_seconds"]
+        after = new[name]["min_seconds"]
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > 1 + threshold and after - before > noise_floor:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold) and before - after > noise_floor:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "status": status,
+                "baseline": before,
+                "current": after,
+                "ratio": ratio,
+            }
+        )
+    return rows
+
+
+def _format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def print_comparison(rows: List[Dict[str, Any]], verbose: bool = False) -> None:
+    markers = {"regression": "❌", "improved": "🚀", "ok": "  ", "new": "🆕"}
+    for row in rows:
+        if row["status"] == "ok" and not verbose:
+            continue
+        if row["status"] == "missing":
+            print(f"⚠️  {row['name']}: missing from current run")
+        elif row["status"] == "new":
+            print(f"🆕 {row['name']}: {_format_seconds(row['current'])}")
+        else:
+            print(
+                f"{markers[row['status']]} {row['name']}: "
+                f"{_format_seconds(row['baseline'])} -> "
+                f"{_format_seconds(row['current'])} ({row['ratio']:.2f}x)"
+            )
+
+    tally = {s: sum(r["status"] == s for r in rows) for s in markers}
+    print(
+        f"regressions={tally['regression']} improved={tally['improved']} "
+        f"ok={tally['ok']} new={tally['new']}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline paradox benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmark suite")
+    run.add_argument("--group", action="append", choices=GROUPS, dest="groups")
+    run.add_argument("--quick", action="store_true", help="Smaller sizes only")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--match", help="Only cases whose name contains this")
+    run.add_argument("--output", type=Path, help="Result file")
+    run.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        type=Path,
+        help=f"Also write the baseline (default: {DEFAULT_BASELINE})",
+    )
+    run.add_argument("--target-dir", type=Path)
+
+    diff = commands.add_parser("compare", help="Flag regressions against a baseline")
+    diff.add_argument("baseline", type=Path)
+    diff.add_argument("current", type=Path)
+    diff.add_argument("--threshold", type=float, default=0.25)
+    diff.add_argument("--noise-floor", type=float, default=0.0005)
+    diff.add_argument("--verbose", action="store_true", help="Show unchanged cases")
+
+    scaling = commands.add_parser(
+        "scaling", help="Check that circuit construction scales linearly"
+    )
+    scaling.add_argument("--max-exponent", type=float, default=1.2)
+    scaling.add_argument("--repeat", type=int, default=3)
+
+    startup = commands.add_parser(
+        "startup", help="Check CLI start-up time against a budget"
+    )
+    startup.add_argument("--budget", type=float, default=0.3, help="Seconds")
+    startup.add_argument("--repeat", type=int, default=5)
+    startup.add_argument("--target-dir", type=Path)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+
+    if args.command == "run":
+        document = run_suite(
+            args.groups, args.quick, args.repeat, args.match, args.target_dir
+        )
+        output = args.output or DEFAULT_OUTPUT_DIR / (
+            f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        print(f"📁 Results: {save(document, output)}")
+        if args.save_baseline:
+            print(f"📌 Baseline: {save(document, args.save_baseline)}")
+        return 0
+
+    if args.command == "scaling":
+        rows = check_scaling(args.max_exponent, repeat=args.repeat)
+        for row in rows:
+            timings = "  ".join(
+                f"{size}:{_format_seconds(seconds)}"
+                for size, seconds in zip(row["sizes"], row["seconds"])
+            )
+            print(
+                f"{'✅' if row['linear'] else '❌'} {row['paradox']} "
+                f"({row['param']}): exponent {row['exponent']:.2f}  {timings}"
+            )
+        return 0 if all(row["linear"] for row in rows) else 1
+
+    if args.command == "startup":
+        rows = check_startup(args.budget, args.repeat, args.target_dir)
+        for row in rows:
+            ok = row["within_budget"] and not row["run_dirs"]
+            print(
+                f"{'✅' if ok else '❌'} {row['command']}: median "
+                f"{_format_seconds(row['median_seconds'])} "
+                f"(budget {_format_seconds(row['budget_seconds'])}"
+                + (f", {row['run_dirs']} run dirs created)" if row["run_dirs"] else ")")
+            )
+        return 0 if all(r["within_budget"] and not r["run_dirs"] for r in rows) else 1
+
+    baseline, current = load(args.baseline), load(args.current)
+    if baseline["environment"] != current["environment"]:
+        print("⚠️  Environments differ; timings may not be comparable")
+    rows = compare(baseline, current, args.threshold, args.noise_floor)
+    print_comparison(rows, args.verbose)
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    sys.exit(main())
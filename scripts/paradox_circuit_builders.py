@@ -9,11 +9,41 @@ Each function builds a quantum circuit that represents a paradox
 in superposition, allowing quantum hardware to "navigate" the paradox
 rather than "resolve" it.
 
+PARADOX_BUILDERS is a registry: builders declare their parameters, circuits
+that share a gate skeleton (e.g. Collatz n values with the same register
+width) are built from one cached template, and sweeps are generated lazily.
+
+The parametric builders (Collatz, halting) are assembled from cached
+per-width block circuits (Hadamard layer, CX fan-out/fan-in, measurement
+layer) composed in bulk, so construction is linear in the circuit size with
+a small constant, even for thousands of qubits.
+
 Author: OmniMind
 Signature: 21c1749bcffd2904
 """
 
+import itertools
+import math
+from collections import OrderedDict
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
 from qiskit import QuantumCircuit
+from qiskit.circuit import CircuitInstruction
+from qiskit.circuit.library import XGate
 
 
 def build_liar_paradox_circuit() -> QuantumCircuit:
@@ -82,84 +112,337 @@ def build_schrodinger_cat_circuit() -> QuantumCircuit:
     return qc
 
 
-def build_collatz_conjecture(n: int = 7, max_steps: int = 3) -> QuantumCircuit:
+def _prepend_x(qc: QuantumCircuit, init_qubits: List[int]) -> QuantumCircuit:
+    """Insert X gates on ``init_qubits`` at the start of ``qc`` (in place)."""
+    gate = XGate()
+    for position, i in enumerate(init_qubits):
+        qc.data.insert(position, CircuitInstruction(gate, (qc.qubits[i],)))
+    return qc
+
+
+@lru_cache(maxsize=128)
+def _block(kind: str, width: int) -> QuantumCircuit:
     """
-    Collatz Conjecture: Does every 3n+1 sequence reach 1?
+    Cached instruction block for ``QuantumCircuit(width, width)``.
+
+    Kinds: ``h`` (Hadamard on every qubit), ``fan_out`` (CX from qubit 0 to
+    every other qubit), ``fan_in`` (CX from every other qubit to qubit 0) and
+    ``measure`` (qubit i into clbit i). Blocks are never mutated: they are
+    only composed, bit by index, into the circuits that use them.
+    """
+    block = QuantumCircuit(width, width)
+    others = range(1, width)
+    if kind == "h":
+        block.h(range(width))
+    elif kind == "fan_out":
+        if others:  # a single qubit has no CX partners
+            block.cx([0] * len(others), others)
+    elif kind == "fan_in":
+        if others:
+            block.cx(others, [0] * len(others))
+    elif kind == "measure":
+        block.measure(range(width), range(width))
+    else:
+        raise ValueError(f"Unknown instruction block: {kind}")
+    return block
+
+
+def _extend(qc: QuantumCircuit, kind: str) -> None:
+    """Compose a cached block onto a ``QuantumCircuit(n, n)``."""
+    # copy=False shares the block's gate objects, which are never mutated
+    qc.compose(_block(kind, qc.num_qubits), inplace=True, copy=False)
+
+
+def build_halting_problem(program_length: int = 3) -> QuantumCircuit:
+    """
+    Halting Problem: Does a program terminate?
 
     Encoding:
-    - Qubits represent current number in binary
-    - Superposition of "even" and "odd"
-    - Circuit applies rules: if even, n/2; if odd, 3n+1
+    - Qubits represent program states
+    - Superposition of "halts" and "doesn't halt"
+    - Circuit simulates execution in superposition
     """
-    import math
+    n_qubits = program_length + 1  # +1 for halt state
 
-    n_qubits = max(4, math.ceil(math.log2(n * 3 + 1)))
+    qc = QuantumCircuit(n_qubits, n_qubits, name="halting_problem")
 
-    qc = QuantumCircuit(n_qubits, n_qubits, name="collatz_conjecture")
+    # Qubit 0: Halt state (0 = no halt, 1 = halt)
+    # Qubits 1-n: Program states
 
-    # Initialize with number n in binary
+    # Create superposition of initial states
+    _extend(qc, "h")
+
+    # Simulate program execution: each step is X(0)·CX(0, step+1)·X(0)
+    # (invert halt, execute next instruction, restore). The X(0) pairs between
+    # consecutive steps cancel, leaving one fan-out conjugated by X(0).
+    if program_length:
+        qc.x(0)
+        _extend(qc, "fan_out")
+        qc.x(0)
+
+    # Check if reached halt state
+    _extend(qc, "fan_in")
+
+    # Measure
+    _extend(qc, "measure")
+
+    return qc
+
+
+def collatz_layout(n: int = 7, max_steps: int = 3) -> Tuple[Tuple[int, int], List[int]]:
+    """
+    Structure of a Collatz circuit.
+
+    Returns:
+        Tuple (template key (n_qubits, max_steps), qubits initialized with X)
+    """
+    n_qubits = max(4, math.ceil(math.log2(n * 3 + 1)))
     binary_n = format(n, f"0{n_qubits}b")
-    for i, bit in enumerate(reversed(binary_n)):
-        if bit == "1":
-            qc.x(i)
+    init_qubits = [i for i, bit in enumerate(reversed(binary_n)) if bit == "1"]
+    return (n_qubits, max_steps), init_qubits
+
+
+def build_collatz_skeleton(n_qubits: int, max_steps: int) -> QuantumCircuit:
+    """
+    Collatz gate skeleton shared by every n with the same register width.
+
+    The circuit of a given n is this skeleton preceded by X gates on the
+    binary representation of n.
+    """
+    qc = QuantumCircuit(n_qubits, n_qubits, name="collatz_conjecture")
 
     # Create superposition in parity qubit
     qc.h(0)  # Qubit 0 represents even/odd
 
     # Simulate Collatz steps in superposition
-    for step in range(max_steps):
-        qc.cx(0, 1)  # Entangle parity with next bit
+    # Each step entangles parity with the next bit
+    if max_steps:
+        qc.cx([0] * max_steps, [1] * max_steps)
 
     # Measure all qubits
-    qc.measure(range(n_qubits), range(n_qubits))
+    _extend(qc, "measure")
 
     return qc
 
 
-def build_halting_problem(program_length: int = 3) -> QuantumCircuit:
+def build_collatz_conjecture(n: int = 7, max_steps: int = 3) -> QuantumCircuit:
     """
-    Halting Problem: Does a program terminate?
+    Collatz Conjecture: Does every 3n+1 sequence reach 1?
 
     Encoding:
-    - Qubits represent program states
-    - Superposition of "halts" and "doesn't halt"
-    - Circuit simulates execution in superposition
+    - Qubits represent current number in binary
+    - Superposition of "even" and "odd"
+    - Circuit applies rules: if even, n/2; if odd, 3n+1
     """
-    n_qubits = program_length + 1  # +1 for halt state
+    (n_qubits, max_steps), init_qubits = collatz_layout(n, max_steps)
 
-    qc = QuantumCircuit(n_qubits, n_qubits, name="halting_problem")
+    # Initialize with number n in binary, then run the shared skeleton
+    return _prepend_x(build_collatz_skeleton(n_qubits, max_steps), init_qubits)
 
-    # Qubit 0: Halt state (0 = no halt, 1 = halt)
-    # Qubits 1-n: Program states
 
-    # Create superposition of initial states
-    for i in range(n_qubits):
-        qc.h(i)
+class ParadoxSpec(NamedTuple):
+    """Registry entry: a builder, its description and its declared parameters."""
 
-    # Simulate program execution
-    for step in range(program_length):
-        qc.x(0)  # Invert halt
-        qc.cx(0, step + 1)  # Execute next instruction
-        qc.x(0)  # Restore
+    builder: Callable[..., QuantumCircuit]
+    description: str
+    params: Dict[str, Any]
+    # params -> (template key, X-initialized qubits); None = no shared skeleton
+    layout: Optional[Callable[..., Tuple[Hashable, List[int]]]] = None
+    # template key -> skeleton circuit
+    skeleton: Optional[Callable[..., QuantumCircuit]] = None
 
-    # Check if reached halt state
-    for i in range(1, n_qubits):
-        qc.cx(i, 0)
 
-    # Measure
-    qc.measure(range(n_qubits), range(n_qubits))
+class SweepPoint(NamedTuple):
+    """One circuit yielded by ParadoxRegistry.sweep."""
 
-    return qc
+    params: Dict[str, Any]
+    template_key: Hashable
+    circuit: QuantumCircuit
 
 
-# Dictionary of circuit builders
-PARADOX_BUILDERS = {
-    "liar_paradox": (build_liar_paradox_circuit, "This sentence is false"),
-    "epr_paradox": (build_epr_paradox_circuit, "Quantum entanglement non-locality"),
-    "schrodinger_cat": (
-        build_schrodinger_cat_circuit,
-        "Cat alive and dead simultaneously",
-    ),
-    "collatz_conjecture": (build_collatz_conjecture, "Does 3n+1 always reach 1?"),
-    "halting_problem": (build_halting_problem, "Does program terminate?"),
-}
+class ParadoxRegistry(Mapping):
+    """
+    Registry of paradox circuit builders.
+
+    Behaves like the original ``{name: (builder, description)}`` dictionary,
+    and adds declared parameters, memoized construction from structurally
+    deduplicated templates (kept in a bounded LRU cache) and lazy sweeps.
+    """
+
+    def __init__(self, template_cache_size: int = 256):
+        self._specs: Dict[str, ParadoxSpec] = {}
+        self._templates: "OrderedDict[Tuple[str, Hashable], QuantumCircuit]" = (
+            OrderedDict()
+        )
+        self.template_cache_size = template_cache_size
+        self.template_hits = 0
+        self.template_misses = 0
+
+    def register(
+        self,
+        name: str,
+        builder: Callable[..., QuantumCircuit],
+        description: str,
+        params: Optional[Dict[str, Any]] = None,
+        layout: Optional[Callable[..., Tuple[Hashable, List[int]]]] = None,
+        skeleton: Optional[Callable[..., QuantumCircuit]] = None,
+    ) -> None:
+        """
+        Register a builder.
+
+        Args:
+            name: Paradox name
+            builder: Function returning the QuantumCircuit
+            description: Description of the paradox
+            params: Declared parameters with their default values
+            layout: Maps parameters to (template key, qubits initialized with X)
+            skeleton: Builds the shared circuit skeleton of a template key
+        """
+        self._specs[name] = ParadoxSpec(
+            builder, description, dict(params or {}), layout, skeleton
+        )
+
+    def __getitem__(self, name: str) -> Tuple[Callable[..., QuantumCircuit], str]:
+        spec = self._specs[name]
+        return spec.builder, spec.description
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def spec(self, name: str) -> ParadoxSpec:
+        return self._specs[name]
+
+    def parameters(self, name: str) -> Dict[str, Any]:
+        """Declared parameters of a builder with their default values."""
+        return dict(self._specs[name].params)
+
+    def _resolve(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        spec = self._specs[name]
+        unknown = set(params) - set(spec.params)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {name}: {sorted(unknown)}")
+        return {**spec.params, **params}
+
+    def template_key(self, name: str, **params: Any) -> Hashable:
+        """Structural key: circuits with equal keys differ only in X-initialization."""
+        spec = self._specs[name]
+        resolved = self._resolve(name, params)
+        if spec.layout is None:
+            return tuple(sorted(resolved.items()))
+        return spec.layout(**resolved)[0]
+
+    def build(self, name: str, **params: Any) -> QuantumCircuit:
+        """
+        Build a circuit, reusing the cached skeleton of its template.
+
+        The skeleton is copied as a whole (a native copy of its instruction
+        list, several times cheaper than appending the instructions again)
+        and the X initialization is inserted in front of it.
+
+        Returns:
+            A new QuantumCircuit (safe to modify)
+        """
+        spec = self._specs[name]
+        resolved = self._resolve(name, params)
+        if spec.layout is None or spec.skeleton is None:
+            return spec.builder(**resolved)
+
+        key, init_qubits = spec.layout(**resolved)
+        return _prepend_x(self._template(name, key).copy(), init_qubits)
+
+    def sweep(
+        self,
+        name: str,
+        grid: Union[Mapping[str, Iterable[Any]], Iterable[Dict[str, Any]]],
+    ) -> Iterator[SweepPoint]:
+        """
+        Lazily build circuits over a parameter sweep.
+
+        Args:
+            name: Paradox name
+            grid: Either {param: values} (cartesian product) or an iterable of
+                parameter dictionaries. Ranges are consumed lazily, so memory
+                stays flat however large the sweep is.
+
+        Yields:
+            SweepPoint(params, template_key, circuit)
+        """
+        if isinstance(grid, Mapping):
+            names = list(grid)
+            points: Iterable[Dict[str, Any]] = (
+                dict(zip(names, values))
+                for values in itertools.product(*(grid[n] for n in names))
+            )
+        else:
+            points = grid
+
+        for params in points:
+            yield SweepPoint(
+                params,
+                self.template_key(name, **params),
+                self.build(name, **params),
+            )
+
+    def cache_info(self) -> Dict[str, int]:
+        """Template cache counters."""
+        return {
+            "hits": self.template_hits,
+            "misses": self.template_misses,
+            "size": len(self._templates),
+            "max_size": self.template_cache_size,
+        }
+
+    def _template(self, name: str, key: Hashable) -> QuantumCircuit:
+        cache_key = (name, key)
+        template = self._templates.get(cache_key)
+        if template is not None:
+            self._templates.move_to_end(cache_key)
+            self.template_hits += 1
+            return template
+
+        self.template_misses += 1
+        spec = self._specs[name]
+        template = spec.skeleton(*key) if isinstance(key, tuple) else spec.skeleton(key)
+        self._templates[cache_key] = template
+        if len(self._templates) > self.template_cache_size:
+            self._templates.popitem(last=False)
+        return template
+
+
+def halting_layout(program_length: int = 3) -> Tuple[Tuple[int], List[int]]:
+    """Structure of a halting circuit: one template per program length."""
+    return (program_length,), []
+
+
+# Registry of circuit builders
+PARADOX_BUILDERS = ParadoxRegistry()
+PARADOX_BUILDERS.register(
+    "liar_paradox", build_liar_paradox_circuit, "This sentence is false"
+)
+PARADOX_BUILDERS.register(
+    "epr_paradox", build_epr_paradox_circuit, "Quantum entanglement non-locality"
+)
+PARADOX_BUILDERS.register(
+    "schrodinger_cat",
+    build_schrodinger_cat_circuit,
+    "Cat alive and dead simultaneously",
+)
+PARADOX_BUILDERS.register(
+    "collatz_conjecture",
+    build_collatz_conjecture,
+    "Does 3n+1 always reach 1?",
+    params={"n": 7, "max_steps": 3},
+    layout=collatz_layout,
+    skeleton=build_collatz_skeleton,
+)
+PARADOX_BUILDERS.register(
+    "halting_problem",
+    build_halting_problem,
+    "Does program terminate?",
+    params={"program_length": 3},
+    layout=halting_layout,
+    skeleton=build_halting_problem,
+)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Precompiled Circuit Bundle (Public Version)
+======================================================
+
+Versioned QPY bundle of the default PARADOX_BUILDERS circuits.
+
+Importing ``paradox_circuit_builders`` pulls in all of qiskit and builds
+every circuit from scratch. The bundle stores the built circuits once, in
+a single QPY file, next to a JSON manifest with everything the CLI needs
+without qiskit: names, descriptions, parameters, sizes and circuit
+fingerprints (which, with a backend snapshot sidecar, give the transpile
+cache keys).
+
+The manifest records the bundle format, the qiskit version and a hash of
+``paradox_circuit_builders.py``; a bundle is stale as soon as any of them
+changes, and is then simply rebuilt.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("ParadoxRunner")
+
+BUNDLE_FORMAT = 1
+DEFAULT_BUNDLE_DIR = Path("results/circuit_bundle")
+MANIFEST_FILE = "manifest.json"
+CIRCUITS_FILE = "circuits.qpy"
+BUILDERS_SOURCE = Path(__file__).resolve().parent / "paradox_circuit_builders.py"
+
+
+def builders_digest() -> str:
+    """Hash of the builder source: any edit invalidates the bundle."""
+    return hashlib.sha256(BUILDERS_SOURCE.read_bytes()).hexdigest()
+
+
+def qiskit_version() -> str:
+    """Installed qiskit version, read from its VERSION.txt (no import)."""
+    spec = importlib.util.find_spec("qiskit")
+    if spec is None or spec.origin is None:
+        return ""
+    try:
+        return (Path(spec.origin).parent / "VERSION.txt").read_text().strip()
+    except OSError:
+        from importlib import metadata
+
+        return metadata.version("qiskit")
+
+
+class CircuitBundle:
+    """Prebuilt circuits: JSON manifest plus one QPY file."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or DEFAULT_BUNDLE_DIR)
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._circuits: Optional[Dict[str, Any]] = None
+
+    @property
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        """The manifest, or None when no bundle was built."""
+        if self._manifest is None:
+            try:
+                with open(self.path / MANIFEST_FILE) as f:
+                    self._manifest = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return None
+        return self._manifest
+
+    def stale_reason(self) -> Optional[str]:
+        """Why the bundle cannot be used (None when it is current)."""
+        manifest = self.manifest
+        if manifest is None or not (self.path / CIRCUITS_FILE).exists():
+            return "no bundle"
+        if manifest.get("format") != BUNDLE_FORMAT:
+            return f"bundle format {manifest.get('format')} != {BUNDLE_FORMAT}"
+        if manifest.get("qiskit") != qiskit_version():
+            return f"built with qiskit {manifest.get('qiskit')}"
+        if manifest.get("builders_digest") != builders_digest():
+            return "paradox_circuit_builders.py changed"
+        return None
+
+    def is_current(self) -> bool:
+        return self.stale_reason() is None
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        """Per-paradox manifest entries, in registry order."""
+        return list(self.manifest["paradoxes"]) if self.manifest else []
+
+    def load(self) -> Dict[str, Any]:
+        """All circuits by paradox name (QPY is read once per bundle object)."""
+        if self._circuits is None:
+            from qiskit import qpy
+
+            with open(self.path / CIRCUITS_FILE, "rb") as f:
+                circuits = qpy.load(f)
+            names = [entry["name"] for entry in self.entries]
+            self._circuits = dict(zip(names, circuits))
+        return self._circuits
+
+    def builders(self) -> Dict[str, Tuple[Callable[[], Any], str]]:
+        """
+        ``{name: (builder, description)}``, like PARADOX_BUILDERS, whose
+        builders return copies of the bundled circuits.
+        """
+        circuits = self.load()
+        return {
+            entry["name"]: (circuits[entry["name"]].copy, entry["description"])
+            for entry in self.entries
+        }
+
+    @classmethod
+    def build(
+        cls,
+        path: Optional[Path] = None,
+        names: Optional[Sequence[str]] = None,
+    ) -> "CircuitBundle":
+        """
+        Build the default circuit of every registered paradox and write the
+        bundle (QPY first, manifest last, both atomically replaced).
+        """
+        from qiskit import qpy
+
+        from paradox_circuit_builders import PARADOX_BUILDERS
+        from paradox_transpile_cache import circuit_fingerprint
+
+        bundle = cls(path)
+        bundle.path.mkdir(parents=True, exist_ok=True)
+        names = list(names or PARADOX_BUILDERS)
+        circuits = [PARADOX_BUILDERS.build(name) for name in names]
+
+        entries = []
+        for name, circuit in zip(names, circuits):
+            entries.append(
+                {
+                    "name": name,
+                    "description": PARADOX_BUILDERS[name][1],
+                    "params": PARADOX_BUILDERS.parameters(name),
+                    "num_qubits": circuit.num_qubits,
+                    "num_clbits": circuit.num_clbits,
+                    "depth": circuit.depth(),
+                    "size": circuit.size(),
+                    "fingerprint": circuit_fingerprint(circuit),
+                }
+            )
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "qiskit": qiskit_version(),
+            "builders_digest": builders_digest(),
+            "created_at": time.time(),
+            "paradoxes": entries,
+        }
+
+        tmp = bundle.path / f".{CIRCUITS_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            qpy.dump(circuits, f)
+        os.replace(tmp, bundle.path / CIRCUITS_FILE)
+        tmp = bundle.path / f".{MANIFEST_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp, bundle.path / MANIFEST_FILE)
+
+        logger.info(
+            f"📦 Circuit bundle written: {bundle.path} ({len(names)} circuits)"
+        )
+        bundle._manifest = manifest
+        bundle._circuits = dict(zip(names, circuits))
+        return bundle
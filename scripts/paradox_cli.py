@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Paradox Command Line (Public Version)
+================================================
+
+Fast-start entry point for the paradox experiments:
+
+    python scripts/paradox_cli.py list                 # paradoxes in the bundle
+    python scripts/paradox_cli.py build                # (re)build the QPY bundle
+    python scripts/paradox_cli.py dry-run [--offline]  # transpile, submit nothing
+    python scripts/paradox_cli.py run [-p NAME] [--shots N] [--emulator]
+    python scripts/paradox_cli.py report [RUN_DIR]     # results of a run
+
+Heavy imports (qiskit, the runner, IBM runtime) happen only inside the
+commands that need them. Circuits come from the versioned QPY bundle
+(``paradox_circuit_bundle``), rebuilt automatically when stale. ``list``
+reads only the bundle manifest; ``dry-run`` answers from the manifest, the
+backend snapshot sidecar and the transpile cache index when every circuit
+is already cached, and falls back to the runner for the misses. Neither
+creates a ``results/run_<timestamp>`` directory.
+
+``paradox_benchmarks.py startup`` keeps both under their time budget.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from paradox_circuit_bundle import DEFAULT_BUNDLE_DIR, CircuitBundle  # noqa: E402
+from paradox_transpile_pool import DEFAULT_SEED_TRANSPILER  # noqa: E402
+
+OPTIMIZATION_LEVEL = 3
+RESULTS_DIR = Path("results")
+
+
+def _runner_module():
+    """Import the runner (qiskit, numpy, IBM runtime) and configure logging."""
+    import logging
+
+    import quantum_paradox_runner
+
+    logging.basicConfig(level=logging.INFO, format=quantum_paradox_runner.LOG_FORMAT)
+    return quantum_paradox_runner
+
+
+def _current_bundle(path: Path) -> CircuitBundle:
+    """The bundle at ``path``, rebuilt first if it is missing or stale."""
+    bundle = CircuitBundle(path)
+    reason = bundle.stale_reason()
+    if reason is not None:
+        print(f"📦 Rebuilding circuit bundle ({reason})...", file=sys.stderr)
+        _runner_module()
+        bundle = CircuitBundle.build(path)
+    return bundle
+
+
+def _transpiler_seed(args: argparse.Namespace) -> int:
+    return DEFAULT_SEED_TRANSPILER if args.seed is None else args.seed
+
+
+def _select(bundle: CircuitBundle, names: Optional[List[str]]) -> List[str]:
+    available = [entry["name"] for entry in bundle.entries]
+    unknown = sorted(set(names or []) - set(available))
+    if unknown:
+        raise SystemExit(f"Unknown paradox(es): {', '.join(unknown)}")
+    return names or available
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    bundle = CircuitBundle(args.bundle)
+    if bundle.is_current():
+        rows = [
+            (e["name"], e["num_qubits"], e["description"]) for e in bundle.entries
+        ]
+    else:
+        # No usable bundle: fall back to the (slow) builder registry
+        from paradox_circuit_builders import PARADOX_BUILDERS
+
+        rows = [
+            (name, "?", description)
+            for name, (_, description) in PARADOX_BUILDERS.items()
+        ]
+        print(
+            f"(no current bundle: run '{Path(__file__).name} build')", file=sys.stderr
+        )
+    for name, qubits, description in rows:
+        print(f"{name:<22} {qubits:>4} qubits  {description}")
+    return 0
+
+
+def cmd_build(args: argparse.Namespace) -> int:
+    _runner_module()
+    bundle = CircuitBundle.build(args.bundle)
+    for entry in bundle.entries:
+        print(
+            f"{entry['name']:<22} {entry['num_qubits']:>4} qubits  "
+            f"depth {entry['depth']:<5} {entry['fingerprint'][:12]}"
+        )
+    return 0
+
+
+def plan_from_cache(
+    bundle: CircuitBundle,
+    names: List[str],
+    snapshot_dir: Optional[Path] = None,
+    cache_dir: Optional[Path] = None,
+    seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Dry-run summaries from stored fingerprints only (no qiskit import).
+
+    Returns:
+        One summary per paradox, or None if the snapshot sidecar has no
+        fingerprint or any circuit is not in the transpile cache yet
+    """
+    from paradox_backend_snapshot import BackendSnapshotCache
+    from paradox_transpile_cache import TranspileCache, cache_key
+
+    summary = BackendSnapshotCache(snapshot_dir).load_summary()
+    if summary is None or "fingerprint" not in summary:
+        return None
+    cache = TranspileCache(cache_dir)
+    entries = {entry["name"]: entry for entry in bundle.entries}
+
+    plan = []
+    for name in names:
+        key = cache_key(
+            entries[name]["fingerprint"],
+            summary["fingerprint"],
+            OPTIMIZATION_LEVEL,
+            seed_transpiler,
+        )
+        cached = cache.peek(key)
+        if cached is None or "depth" not in cached:
+            return None
+        plan.append(
+            {
+                "paradox": name,
+                "backend": summary["name"],
+                "depth": cached["depth"],
+                "size": cached["size"],
+                "transpile_time_seconds": 0.0,
+                "transpile_cache_hit": True,
+            }
+        )
+    return plan
+
+
+def cmd_dry_run(args: argparse.Namespace) -> int:
+    bundle = _current_bundle(args.bundle)
+    names = _select(bundle, args.paradox)
+
+    plan = plan_from_cache(bundle, names, seed_transpiler=_transpiler_seed(args))
+    if plan is None:
+        runner_module = _runner_module()
+        with runner_module.ParadoxExperimentRunner(
+            seed_transpiler=_transpiler_seed(args)
+        ) as runner:
+            runner.connect_ibm(offline=args.offline)
+            plan = runner.dry_run(names, builders=bundle.builders())
+
+    for row in plan:
+        print(
+            f"🔧 {row['paradox']:<22} {row['backend']}: depth {row['depth']}, "
+            f"{row['size']} ops"
+            + (" (cached)" if row["transpile_cache_hit"] else "")
+        )
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    bundle = _current_bundle(args.bundle)
+    names = _select(bundle, args.paradox)
+    runner_module = _runner_module()
+
+    emulator = None
+    if args.emulator:
+        from paradox_backend_snapshot import BackendSnapshotCache
+        from paradox_noise_emulator import NoiseEmulator
+
+        snapshot = BackendSnapshotCache().load()
+        if snapshot is None:
+            raise SystemExit("No backend snapshot cached: run dry-run online first")
+        emulator = NoiseEmulator(snapshot, seed=args.seed)
+
+    try:
+        with runner_module.ParadoxExperimentRunner(
+            emulator=emulator, seed_transpiler=_transpiler_seed(args)
+        ) as runner:
+            if emulator is None:
+                runner.connect_ibm()
+            runner.run_batch(names, builders=bundle.builders(), shots=args.shots)
+            runner.generate_summary_report()
+    finally:
+        if emulator is not None:
+            emulator.close()
+    print(f"📁 {runner.output_dir}")
+    return 0
+
+
+def latest_run(results_dir: Path = RESULTS_DIR) -> Optional[Path]:
+    runs = sorted(results_dir.glob("run_*"))
+    return runs[-1] if runs else None
+
+
+def cmd_report(args: argparse.Namespace) -> int:
+    from paradox_result_store import ResultStore
+
+    run_dir = args.run_dir or latest_run()
+    if run_dir is None or not Path(run_dir).is_dir():
+        print("No run found", file=sys.stderr)
+        return 1
+
+    records = 0
+    for record in ResultStore(Path(run_dir) / "stream").iter_records():
+        records += 1
+        if args.json:
+            print(json.dumps(record))
+        elif "error" in record:
+            print(f"❌ {record['paradox']}: {record['error']}")
+        elif "backends" in record:
+            backends = ", ".join(record["backends"])
+            print(f"🌐 {record['paradox']}: fan-out over {backends}")
+        else:
+            print(
+                f"✅ {record['paradox']}: {record['interpretation']['conclusion']} "
+                f"({record['metrics']['execution_time_seconds']:.2f}s)"
+            )
+    if not args.json:
+        print(f"{records} results in {run_dir}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="OmniMind paradox experiments")
+    parser.add_argument(
+        "--bundle",
+        type=Path,
+        default=DEFAULT_BUNDLE_DIR,
+        help=f"Circuit bundle directory (default: {DEFAULT_BUNDLE_DIR})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="List the paradoxes")
+    commands.add_parser("build", help="Build the QPY circuit bundle")
+
+    dry_run = commands.add_parser("dry-run", help="Transpile without submitting")
+    run = commands.add_parser("run", help="Run paradoxes as one batch")
+    for command in (dry_run, run):
+        command.add_argument("-p", "--paradox", action="append", help="Paradox name")
+        command.add_argument(
+            "--seed",
+            type=int,
+            help=f"Transpiler/emulator seed (transpiler default: "
+            f"{DEFAULT_SEED_TRANSPILER})",
+        )
+    dry_run.add_argument(
+        "--offline", action="store_true", help="Use the cached snapshot only"
+    )
+    run.add_argument("--shots", type=int, default=1024)
+    run.add_argument(
+        "--emulator", action="store_true", help="Noise-aware local emulator"
+    )
+
+    report = commands.add_parser("report", help="Show the results of a run")
+    report.add_argument("run_dir", nargs="?", type=Path, help="Default: latest run")
+    report.add_argument("--json", action="store_true", help="One JSON per line")
+
+    args = parser.parse_args(argv)
+    handlers = {
+        "list": cmd_list,
+        "build": cmd_build,
+        "dry-run": cmd_dry_run,
+        "run": cmd_run,
+        "report": cmd_report,
+    }
+    return handlers[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
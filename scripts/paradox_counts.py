@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Sparse Counts Representation (Public Version)
+========================================================
+
+NumPy-backed measurement counts with vectorized analysis.
+
+Outcomes are stored as parallel arrays: integer keys (one row of 64-bit
+words per observed outcome, clbit 0 = least significant bit) and counts.
+Only observed outcomes are stored, so 133-qubit registers cost the same as
+2-qubit ones. Entropy, marginals, top-k and distances to a reference
+distribution (TVD, Hellinger, KL) are computed without Python loops over
+outcomes, and the type round-trips to the ``quantum_result`` JSON schema
+(``{"counts": ..., "distribution": ...}``).
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+WORD_BITS = 64
+
+
+def _void_keys(keys: np.ndarray) -> np.ndarray:
+    """View each multi-word key row as one opaque scalar (for sort/unique)."""
+    keys = np.ascontiguousarray(keys)
+    return keys.view(np.dtype((np.void, keys.shape[1] * keys.itemsize))).ravel()
+
+
+class SparseCounts:
+    """Observed outcomes as parallel (key words, count) arrays."""
+
+    __slots__ = ("keys", "counts", "num_bits")
+
+    def __init__(self, keys: np.ndarray, counts: np.ndarray, num_bits: int):
+        """
+        Initialize from raw arrays; duplicate keys are merged and sorted.
+
+        Args:
+            keys: (m, words) uint64 array, bit i of the outcome = clbit i
+            counts: (m,) counts (int) or weights (float, for distributions)
+            num_bits: Width of the classical register
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        if keys.ndim == 1:
+            keys = keys.reshape(-1, 1)
+        counts = np.asarray(counts)
+
+        unique, first, inverse = np.unique(
+            _void_keys(keys), return_index=True, return_inverse=True
+        )
+        merged = np.zeros(len(unique), dtype=counts.dtype)
+        np.add.at(merged, inverse.ravel(), counts)
+
+        self.keys = keys[first]
+        self.counts = merged
+        self.num_bits = num_bits
+
+    # ------------------------------------------------------------------
+    # Construction / serialization
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_bit_rows(
+        cls, rows: np.ndarray, counts: np.ndarray, num_bits: Optional[int] = None
+    ) -> "SparseCounts":
+        """Build from (m, num_bits) boolean rows, column i = clbit i."""
+        rows = np.asarray(rows, dtype=bool)
+        num_bits = rows.shape[1] if num_bits is None else num_bits
+        words = max(1, -(-num_bits // WORD_BITS))
+        padded = np.zeros((rows.shape[0], words * WORD_BITS), dtype=bool)
+        padded[:, : rows.shape[1]] = rows
+        packed = np.packbits(padded, axis=1, bitorder="little")
+        keys = packed.view("<u8").astype(np.uint64).reshape(rows.shape[0], words)
+        return cls(keys, counts, num_bits)
+
+    @classmethod
+    def from_dict(
+        cls, counts: Mapping[str, Union[int, float]], num_bits: Optional[int] = None
+    ) -> "SparseCounts":
+        """
+        Build from Qiskit-style counts ``{"0101": 12, ...}`` (clbit 0 rightmost).
+
+        Float values are accepted too, e.g. a probability distribution.
+
+        Raises:
+            ValueError: If an outcome is not ``num_bits`` (default: the width
+                of the first outcome) bits wide
+        """
+        states = [state.replace(" ", "") for state in counts]
+        if num_bits is None:
+            num_bits = len(states[0]) if states else 0
+        widths = set(map(len, states)) - {num_bits}
+        if widths:
+            raise ValueError(
+                f"Register width mismatch: expected {num_bits}-bit outcomes, "
+                f"got {sorted(widths)}-bit"
+            )
+        values = np.array(list(counts.values())) if counts else np.zeros(0, np.int64)
+
+        if not states:
+            return cls(np.zeros((0, 1), dtype=np.uint64), values, num_bits)
+
+        chars = np.frombuffer("".join(states).encode("ascii"), dtype=np.uint8)
+        rows = (chars.reshape(len(states), num_bits) == ord("1"))[:, ::-1]
+        return cls.from_bit_rows(rows, values, num_bits)
+
+    @classmethod
+    def from_json(cls, quantum_result: Mapping[str, Any]) -> "SparseCounts":
+        """Build from the ``quantum_result`` section of result_sanitized.json."""
+        return cls.from_dict(quantum_result["counts"])
+
+    def bit_rows(self) -> np.ndarray:
+        """(m, num_bits) boolean outcome rows, column i = clbit i."""
+        as_bytes = np.ascontiguousarray(self.keys.astype("<u8")).view(np.uint8)
+        bits = np.unpackbits(as_bytes, axis=1, bitorder="little")
+        return bits[:, : self.num_bits].astype(bool)
+
+    def states(self) -> List[str]:
+        """Outcome bitstrings (clbit 0 rightmost), aligned with ``counts``."""
+        if len(self) == 0:
+            return []
+        chars = np.where(self.bit_rows()[:, ::-1], ord("1"), ord("0")).astype(np.uint8)
+        flat = chars.tobytes().decode("ascii")
+        width = self.num_bits
+        return [flat[i : i + width] for i in range(0, len(flat), width)]
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """Qiskit-style counts dictionary."""
+        return dict(zip(self.states(), self.counts.tolist()))
+
+    def to_json(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """The ``quantum_result`` schema: counts and normalized distribution."""
+        states = self.states()
+        return {
+            "counts": dict(zip(states, self.counts.tolist())),
+            "distribution": dict(zip(states, self.probabilities().tolist())),
+        }
+
+    # ------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @property
+    def shots(self) -> Union[int, float]:
+        return self.counts.sum().item()
+
+    def probabilities(self) -> np.ndarray:
+        """Normalized probabilities aligned with ``keys``."""
+        total = self.counts.sum() or 1
+        return self.counts / total
+
+    def entropy(self, normalized: bool = False) -> float:
+        """
+        Shannon entropy of the observed distribution.
+
+        Args:
+            normalized: Divide by the register width, giving a value in [0, 1]
+                (1 = uniform over all 2^num_bits outcomes)
+
+        Returns:
+            Entropy in bits (or normalized)
+        """
+        p = self.probabilities()
+        p = p[p > 0]
+        entropy = float(-(p * np.log2(p)).sum()) + 0.0
+        if normalized:
+            return entropy / self.num_bits if self.num_bits else 0.0
+        return entropy
+
+    def marginal(self, bits: Sequence[int]) -> "SparseCounts":
+        """
+        Marginal counts over a subset of clbits.
+
+        Args:
+            bits: Clbit indices to keep; ``bits[j]`` becomes clbit j
+        """
+        return SparseCounts.from_bit_rows(
+            self.bit_rows()[:, list(bits)], self.counts, len(bits)
+        )
+
+    def top_k(self, k: int = 5) -> List[Tuple[str, Union[int, float]]]:
+        """The ``k`` most frequent outcomes, most frequent first."""
+        k = min(k, len(self))
+        if k == 0:
+            return []
+        idx = np.argpartition(-self.counts, k - 1)[:k]
+        idx = idx[np.argsort(-self.counts[idx], kind="stable")]
+        top = SparseCounts.__new__(SparseCounts)
+        top.keys, top.counts = self.keys[idx], self.counts[idx]
+        top.num_bits = self.num_bits
+        return list(zip(top.states(), top.counts.tolist()))
+
+    def align(self, other: "CountsLike") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Probability vectors of ``self`` and ``other`` over the union of outcomes.
+        """
+        other = as_sparse_counts(other, self.num_bits)
+        if other.num_bits != self.num_bits:
+            raise ValueError(
+                f"Register width mismatch: {self.num_bits} vs {other.num_bits}"
+            )
+        words = max(self.keys.shape[1], other.keys.shape[1])
+        keys = np.zeros((len(self) + len(other), words), dtype=np.uint64)
+        keys[: len(self), : self.keys.shape[1]] = self.keys
+        keys[len(self) :, : other.keys.shape[1]] = other.keys
+
+        _, inverse = np.unique(_void_keys(keys), return_inverse=True)
+        inverse = inverse.ravel()
+        size = inverse.max() + 1 if len(inverse) else 0
+        p = np.zeros(size)
+        q = np.zeros(size)
+        p[inverse[: len(self)]] = self.probabilities()
+        q[inverse[len(self) :]] = other.probabilities()
+        return p, q
+
+    def tvd(self, other: "CountsLike") -> float:
+        """Total variation distance, in [0, 1]."""
+        p, q = self.align(other)
+        return float(0.5 * np.abs(p - q).sum())
+
+    def hellinger(self, other: "CountsLike") -> float:
+        """Hellinger distance, in [0, 1]."""
+        p, q = self.align(other)
+        return float(np.sqrt(max(0.0, 1.0 - np.sqrt(p * q).sum())))
+
+    def kl_divergence(self, other: "CountsLike", epsilon: float = 1e-12) -> float:
+        """
+        Kullback-Leibler divergence KL(self ‖ other) in bits.
+
+        ``other`` is floored at ``epsilon`` (and renormalized) so outcomes
+        that the reference forbids, e.g. noise on an ideal Bell state, give a
+        large finite value instead of infinity.
+        """
+        p, q = self.align(other)
+        q = np.maximum(q, epsilon)
+        q = q / q.sum()
+        mask = p > 0
+        return float((p[mask] * np.log2(p[mask] / q[mask])).sum())
+
+    def distances(self, other: "CountsLike") -> Dict[str, float]:
+        """TVD, Hellinger and KL distances to a reference distribution."""
+        return {
+            "tvd": self.tvd(other),
+            "hellinger": self.hellinger(other),
+            "kl_divergence": self.kl_divergence(other),
+        }
+
+
+CountsLike = Union[SparseCounts, Mapping[str, Union[int, float]]]
+
+
+def as_sparse_counts(counts: CountsLike, num_bits: Optional[int] = None) -> SparseCounts:
+    """Accept either a SparseCounts or a counts/distribution dictionary."""
+    if isinstance(counts, SparseCounts):
+        return counts
+    return SparseCounts.from_dict(counts, num_bits)
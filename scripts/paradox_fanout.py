@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Multi-Backend Fan-out (Public Version)
+=================================================
+
+Runs the same paradox suite on several backends concurrently.
+
+Proofs like ``ibm_benchmarks_proof_sanitized.json`` compare backends
+(ibm_fez, ibm_torino), which used to mean one sequential run per backend.
+Here every backend gets its own worker thread: the suite is transpiled for
+it through the shared transpile cache (keyed by backend, so each backend has
+its own entries), submitted as one multi-PUB Sampler job and collected. A
+failing backend only marks its own entries as failed, and a paradox whose
+circuit cannot be built gets an error record while the others still run.
+
+Backends are labelled by name; a backend listed more than once (e.g. to
+compare repeated runs) is labelled ``name#2``, ``name#3``, ...
+
+Results are aggregated into one record per paradox with per-backend counts,
+timings and interpretation, plus pairwise cross-backend distances (TVD,
+Hellinger, KL) in the ``backends`` schema of the published proofs.
+
+With a job journal, every backend's job is journaled like a ``run_batch``
+job, and a paradox counts as recorded once every backend delivered its
+counts, so ``resume()`` repeats a fan-out that did not finish (re-attaching
+the jobs that were already submitted).
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from paradox_counts import SparseCounts
+from paradox_tracing import span, stopwatch
+
+logger = logging.getLogger("ParadoxRunner")
+
+
+def backend_labels(backends: Sequence[Any]) -> List[str]:
+    """Unique labels: backend names, repeated names suffixed ``#2``, ``#3``..."""
+    labels = []
+    seen: Dict[str, int] = {}
+    for backend in backends:
+        name = backend if isinstance(backend, str) else backend.name
+        seen[name] = seen.get(name, 0) + 1
+        labels.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return labels
+
+
+def _default_sampler_factory(backend):
+    from qiskit_ibm_runtime import SamplerV2
+
+    return SamplerV2(mode=backend)
+
+
+class MultiBackendFanout:
+    """Executes one circuit suite on N backends in parallel threads."""
+
+    def __init__(
+        self,
+        runner,
+        backends: Sequence[Any],
+        max_workers: Optional[int] = None,
+        sampler_factory: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Initialize fan-out.
+
+        Args:
+            runner: ParadoxExperimentRunner providing cache, service and output
+            backends: Backend objects, or backend names resolved through the
+                runner's IBM service (inside the worker, so an unreachable
+                backend fails alone)
+            max_workers: Concurrent backends (default: all of them)
+            sampler_factory: Callable backend -> sampler (default: SamplerV2)
+        """
+        if not backends:
+            raise ValueError("At least one backend is required")
+
+        self.runner = runner
+        self.backends = list(backends)
+        self.max_workers = max_workers or len(self.backends)
+        self.sampler_factory = sampler_factory or _default_sampler_factory
+
+    def run(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the selected paradoxes on every backend.
+
+        Returns:
+            One aggregated record per paradox (an error record if its circuit
+            could not be built), in the order of ``paradox_names``
+        """
+        runner = self.runner
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+
+        labels = backend_labels(self.backends)
+        # Journaled under all backends at once; resume() fans out again
+        journal_backend = ",".join(labels)
+        backend_names = [b if isinstance(b, str) else b.name for b in self.backends]
+
+        records: Dict[str, Dict[str, Any]] = {}
+        planned: Dict[str, Optional[str]] = {}
+        built: List[str] = []
+        circuits: List[Any] = []
+        for name in paradox_names:
+            try:
+                qc = runner._build(builders[name][0])
+            except Exception as e:
+                logger.error(f"❌ Error building {name}: {e}")
+                records[name] = runner._record_error(name, runner._paradox_dir(name), e)
+                continue
+            circuits.append(qc)
+            built.append(name)
+            planned[name] = runner._journal_plan(
+                name,
+                qc,
+                shots,
+                "fanout",
+                backend_name=journal_backend,
+                backends=backend_names,
+            )
+
+        logger.info(
+            f"🌐 Fan-out: {len(built)} paradoxes on {len(labels)} backends "
+            f"({', '.join(labels)})"
+        )
+        if not built:
+            return [records[name] for name in paradox_names]
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fanout"
+        ) as pool:
+            futures = [
+                pool.submit(self._run_backend, backend, circuits, shots)
+                for backend in self.backends
+            ]
+            outcomes = {}
+            for label, future in zip(labels, futures):
+                try:
+                    outcomes[label] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Backend {label} failed: {e}")
+                    outcomes[label] = e
+
+        for i, name in enumerate(built):
+            records[name] = self._aggregate(
+                i, name, builders[name][1], circuits[i], outcomes, shots
+            )
+            if all(
+                entry["status"] == "completed"
+                for entry in records[name]["backends"].values()
+            ):
+                runner._journal_recorded(
+                    name,
+                    planned[name],
+                    shots,
+                    runner._paradox_dir(name),
+                    backend_name=journal_backend,
+                    filename="fanout_sanitized.json",
+                )
+        runner._journal_completed(
+            [
+                outcome["job"]
+                for outcome in outcomes.values()
+                if not isinstance(outcome, Exception)
+            ]
+        )
+        return [records[name] for name in paradox_names]
+
+    def _run_backend(self, backend, circuits: List[Any], shots: int) -> Dict[str, Any]:
+        """Transpile, submit and collect the whole suite on one backend."""
+        runner = self.runner
+        if isinstance(backend, str):
+            backend = runner._connect_service().backend(backend)
+
+        with span("transpile", runner.tracer):
+            transpiled = runner.transpile_cache.transpile_many(
+                circuits,
+                backend,
+                optimization_level=runner.optimization_level,
+                seed_transpiler=runner.seed_transpiler,
+                pool=runner.transpile_pool,
+            )
+        logger.info(f"🔧 {backend.name}: {len(circuits)} circuits transpiled")
+
+        job, submit_seconds = runner._submit(
+            lambda: self.sampler_factory(backend),
+            [circuit for circuit, _, _ in transpiled],
+            shots,
+            circuits=circuits,
+            backend=backend,
+        )
+        logger.info(f"🚀 {backend.name}: job submitted ({len(circuits)} PUBs)")
+        try:
+            with stopwatch() as waited:
+                result = job.result()
+        except Exception as e:
+            runner._journal_failed(job, e)
+            raise
+        runner.tracer.record_job(job, waited.seconds)
+        exec_time = submit_seconds + waited.seconds
+        logger.info(f"✅ {backend.name}: result received ({exec_time:.2f}s)")
+
+        return {
+            "qubits": backend.num_qubits,
+            "transpiled": transpiled,
+            "execution_time_seconds": exec_time,
+            "result": result,
+            "job": job,
+        }
+
+    def _aggregate(
+        self,
+        index: int,
+        paradox_name: str,
+        description: str,
+        circuit,
+        outcomes: Dict[str, Any],
+        shots: int,
+    ) -> Dict[str, Any]:
+        """Build, store and return the aggregated record of one paradox."""
+        runner = self.runner
+        entries: Dict[str, Dict[str, Any]] = {}
+        measured: Dict[str, SparseCounts] = {}
+
+        for label, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                entries[label] = {"status": "failed", "error": str(outcome)}
+                continue
+            try:
+                counts = runner._extract_counts(outcome["result"][index])
+            except Exception as e:
+                entries[label] = {"status": "failed", "error": str(e)}
+                continue
+
+            _, transpile_time, cache_hit = outcome["transpiled"][index]
+            sparse = SparseCounts.from_dict(counts)
+            measured[label] = sparse
+            entry = {
+                "status": "completed",
+                "qubits": outcome["qubits"],
+                "counts": counts,
+                "total_shots": int(sparse.shots),
+                "metrics": {
+                    "transpile_time_seconds": transpile_time,
+                    "transpile_cache_hit": cache_hit,
+                    "execution_time_seconds": outcome["execution_time_seconds"],
+                    "shots": shots,
+                },
+                "interpretation": runner._interpret_result(paradox_name, sparse),
+            }
+            ideal_distances = runner._ideal_distances(circuit, sparse)
+            if ideal_distances:
+                entry["ideal_distances"] = ideal_distances
+            entries[label] = entry
+
+        cross_backend = {
+            f"{a} vs {b}": measured[a].distances(measured[b])
+            for a, b in itertools.combinations(measured, 2)
+        }
+
+        record = {
+            "timestamp": datetime.now().isoformat(),
+            "paradox": paradox_name,
+            "description": description,
+            "backends": entries,
+            "cross_backend": cross_backend,
+            "omnimind_resolution": bool(measured),
+            "system_signature": "21c1749bcffd2904",
+        }
+
+        # Sanitized: job IDs are never stored
+        runner.result_store.append(record)
+        runner._write_paradox_file(
+            runner._paradox_dir(paradox_name), "fanout_sanitized.json", record
+        )
+        completed = sum(e["status"] == "completed" for e in entries.values())
+        logger.info(f"✅ {paradox_name}: {completed}/{len(entries)} backends completed")
+        return record
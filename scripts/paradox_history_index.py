@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Historical Results Index (Public Version)
+====================================================
+
+Incremental SQLite index over every experiment artifact in the repository.
+
+Result history lives in several trees with slightly different schemas:
+
+- ``results/run_*/*/result_sanitized.json`` and ``results/run_*/stream/``
+  (runner output, one record per paradox)
+- ``quantum_paradoxes/*/`` and ``scientific_problems_phase1/*/``
+  (published runner output)
+- ``proven_experiments/**/*_sanitized.json`` (proofs: counts nested per
+  backend, per test, or inside a "measurement" block)
+
+The indexer rescans only files whose mtime/size changed (and re-parses only
+when their content hash changed), normalizes every counts-bearing record to
+one row (paradox, backend, timestamp, shots, timings, entropy, dominant
+state) and remembers where the counts live, so counts are loaded lazily.
+
+Results of the noise emulator (``"emulated": true``) are indexed with an
+``emulated`` flag and left out of queries unless asked for, so emulated
+ibm_torino runs never pass for hardware history.
+
+Timestamps are stored as UTC ISO strings with an explicit offset and fixed
+microsecond precision, so they sort and compare correctly as text. Naive
+timestamps (the runner writes local time) are taken as local time.
+
+Usage:
+    python scripts/paradox_history_index.py scan
+    python scripts/paradox_history_index.py query --paradox halting_problem \\
+        --backend ibm_torino --days 30 --order-by entropy --desc
+    python scripts/paradox_history_index.py counts 42
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("ParadoxRunner")
+
+DEFAULT_DB = Path("results/history_index.sqlite")
+
+# (base directory, glob) pairs scanned relative to the repository root
+DEFAULT_SOURCES = [
+    ("results", "run_*/*/result_sanitized.json"),
+    ("results", "run_*/stream/results-*.jsonl*"),
+    ("quantum_paradoxes", "*/result_sanitized.json"),
+    ("scientific_problems_phase1", "*/result_sanitized.json"),
+    ("proven_experiments", "**/*_sanitized.json"),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    locator TEXT NOT NULL,
+    source TEXT NOT NULL,
+    paradox TEXT NOT NULL,
+    paradox_key TEXT NOT NULL,
+    backend TEXT,
+    timestamp TEXT,
+    shots INTEGER,
+    transpile_time_seconds REAL,
+    execution_time_seconds REAL,
+    num_bits INTEGER,
+    entropy REAL,
+    entropy_bits REAL,
+    dominant_state TEXT,
+    dominant_probability REAL,
+    emulated INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_lookup ON runs (paradox_key, backend, timestamp);
+CREATE INDEX IF NOT EXISTS runs_entropy ON runs (entropy);
+"""
+
+# Bumped when stored values change meaning; older indexes are rebuilt
+# (2: emulated flag)
+INDEX_VERSION = 2
+
+ORDERABLE = {
+    "timestamp",
+    "entropy",
+    "entropy_bits",
+    "shots",
+    "execution_time_seconds",
+    "transpile_time_seconds",
+    "dominant_probability",
+    "paradox",
+    "backend",
+}
+
+_BITSTRING = re.compile(r"^[01 ]+$")
+
+
+def paradox_key(name: str) -> str:
+    """Normalize paradox names ("Halting Problem" → "halting_problem")."""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def _is_counts(value: Any) -> bool:
+    """A non-empty {bitstring: int} mapping."""
+    return (
+        isinstance(value, dict)
+        and bool(value)
+        and all(
+            isinstance(k, str) and _BITSTRING.match(k) and isinstance(v, int)
+            for k, v in value.items()
+        )
+    )
+
+
+def _iso(timestamp: Any) -> Optional[str]:
+    """
+    Normalize ISO strings, datetimes and epoch floats to UTC ISO timestamps
+    (``2025-11-20T14:03:00.000000+00:00``).
+
+    Naive values are local time; unparseable strings are kept as they are.
+    """
+    if timestamp is None:
+        return None
+    if isinstance(timestamp, datetime):
+        parsed = timestamp
+    elif isinstance(timestamp, (int, float)):
+        parsed = datetime.fromtimestamp(timestamp, timezone.utc)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+        except ValueError:
+            return str(timestamp)
+    # astimezone() takes naive datetimes as local time
+    return parsed.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _resolve(document: Any, locator: List[Any]) -> Any:
+    for step in locator:
+        document = document[step]
+    return document
+
+
+def normalize(document: Dict[str, Any], stem: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one normalized record per counts block of a result document.
+
+    Each record carries a ``locator`` (JSON path to its counts) and the
+    ``counts`` themselves (used for entropy; not stored in the index).
+    """
+    # 1. Runner output: {"paradox", "backend": {...}, "metrics", "quantum_result"}
+    if isinstance(document.get("quantum_result"), dict):
+        counts = document["quantum_result"].get("counts")
+        if _is_counts(counts):
+            backend = document.get("backend")
+            metrics = document.get("metrics", {})
+            yield {
+                "source": "runner",
+                "locator": ["quantum_result", "counts"],
+                "paradox": document.get("paradox", stem),
+                "backend": backend.get("name") if isinstance(backend, dict) else backend,
+                "timestamp": document.get("timestamp"),
+                "shots": metrics.get("shots"),
+                "transpile_time_seconds": metrics.get("transpile_time_seconds"),
+                "execution_time_seconds": metrics.get("execution_time_seconds"),
+                "counts": counts,
+            }
+        return
+
+    # 2. Multi-backend proofs and fan-out records:
+    #    {"backends": {name: {"counts", "total_shots", "metrics"?}}}
+    if isinstance(document.get("backends"), dict):
+        for name, entry in document["backends"].items():
+            if isinstance(entry, dict) and _is_counts(entry.get("counts")):
+                metrics = entry.get("metrics", {})
+                yield {
+                    "source": "backends",
+                    "locator": ["backends", name, "counts"],
+                    "paradox": document.get("paradox", stem),
+                    "backend": name,
+                    "timestamp": document.get("timestamp"),
+                    "shots": entry.get("total_shots"),
+                    "transpile_time_seconds": metrics.get("transpile_time_seconds"),
+                    "execution_time_seconds": metrics.get("execution_time_seconds"),
+                    "counts": entry["counts"],
+                }
+        return
+
+    # 3. Test suites: {"backend", "tests": [{"counts", ...}]}
+    if isinstance(document.get("tests"), list):
+        for i, test in enumerate(document["tests"]):
+            if isinstance(test, dict) and _is_counts(test.get("counts")):
+                label = test.get("test") or test.get("method") or str(i)
+                yield {
+                    "source": "tests",
+                    "locator": ["tests", i, "counts"],
+                    "paradox": f"{stem}:{label}",
+                    "backend": document.get("backend"),
+                    "timestamp": document.get("timestamp"),
+                    "execution_time_seconds": test.get("execution_time"),
+                    "counts": test["counts"],
+                }
+        return
+
+    # 4. Anything else: every nested counts-like block, with the nearest
+    #    "location"/"backend" and "timestamp" as context
+    def walk(node: Any, path: List[Any], context: Dict[str, Any]) -> Iterator[Dict]:
+        if isinstance(node, dict):
+            context = dict(context)
+            for key in ("backend", "location"):
+                if isinstance(node.get(key), str):
+                    context["backend"] = node[key]
+            if node.get("timestamp") is not None:
+                context["timestamp"] = node["timestamp"]
+            for key, value in node.items():
+                if _is_counts(value):
+                    yield {
+                        "source": "nested",
+                        "locator": path + [key],
+                        "paradox": f"{stem}:{'.'.join(map(str, path + [key]))}",
+                        **context,
+                        "counts": value,
+                    }
+                else:
+                    yield from walk(value, path + [key], context)
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                yield from walk(value, path + [i], context)
+
+    yield from walk(document, [], {"timestamp": document.get("timestamp")})
+
+
+class HistoryIndex:
+    """SQLite index over historical result artifacts."""
+
+    def __init__(self, db_path: Path = DEFAULT_DB, repo_root: Path = Path(".")):
+        """
+        Initialize index.
+
+        Args:
+            db_path: SQLite database file
+            repo_root: Repository root the source globs are relative to
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.repo_root = Path(repo_root)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < INDEX_VERSION:
+            # Rows of an older index version: reindex everything
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS files;"
+            )
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def scan(self, sources: Optional[List[Tuple[str, str]]] = None) -> Dict[str, int]:
+        """
+        Incrementally (re)index the source trees.
+
+        Returns:
+            Counters: files seen, parsed, unchanged, removed and rows indexed
+        """
+        stats = {"seen": 0, "parsed": 0, "unchanged": 0, "removed": 0, "rows": 0}
+        known = {
+            row["path"]: row
+            for row in self.conn.execute("SELECT path, mtime, size, sha256 FROM files")
+        }
+        seen = set()
+
+        for base, pattern in sources or DEFAULT_SOURCES:
+            for path in sorted((self.repo_root / base).glob(pattern)):
+                if not path.is_file() or _shadowed_by_stream(path):
+                    continue
+                rel = path.relative_to(self.repo_root).as_posix()
+                seen.add(rel)
+                stats["seen"] += 1
+
+                stat = path.stat()
+                row = known.get(rel)
+                if row and row["mtime"] == stat.st_mtime and row["size"] == stat.st_size:
+                    stats["unchanged"] += 1
+                    continue
+
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                if row and row["sha256"] == digest:
+                    # Touched but identical: refresh stat only
+                    self._upsert_file(rel, stat, digest)
+                    stats["unchanged"] += 1
+                    continue
+
+                stats["rows"] += self._index_file(path, rel, stat, digest)
+                stats["parsed"] += 1
+
+        for rel in set(known) - seen:
+            self.conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+            stats["removed"] += 1
+
+        self.conn.commit()
+        return stats
+
+    def _upsert_file(self, rel: str, stat, digest: str) -> None:
+        self.conn.execute(
+            "INSERT INTO files (path, mtime, size, sha256, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT(path) DO UPDATE SET "
+            "mtime = excluded.mtime, size = excluded.size, "
+            "sha256 = excluded.sha256, indexed_at = excluded.indexed_at",
+            (
+                rel,
+                stat.st_mtime,
+                stat.st_size,
+                digest,
+                _iso(datetime.now(timezone.utc)),
+            ),
+        )
+
+    def _index_file(self, path: Path, rel: str, stat, digest: str) -> int:
+        from paradox_counts import SparseCounts
+
+        self._upsert_file(rel, stat, digest)
+        self.conn.execute("DELETE FROM runs WHERE path = ?", (rel,))
+
+        rows = 0
+        stem = path.name.split(".")[0].replace("_sanitized", "")
+        for line_no, document in _documents(path):
+            if not isinstance(document, dict):
+                continue
+            if stem == "result":
+                # result_sanitized.json: the directory names the paradox
+                stem = path.parent.name
+            for record in normalize(document, stem):
+                sparse = SparseCounts.from_dict(record["counts"])
+                state, count = sparse.top_k(1)[0]
+                locator = record["locator"]
+                if line_no is not None:
+                    locator = [line_no] + locator
+                self.conn.execute(
+                    "INSERT INTO runs (path, locator, source, paradox, paradox_key, "
+                    "backend, timestamp, shots, transpile_time_seconds, "
+                    "execution_time_seconds, num_bits, entropy, entropy_bits, "
+                    "dominant_state, dominant_probability, emulated) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        rel,
+                        json.dumps(locator),
+                        record["source"],
+                        record["paradox"],
+                        paradox_key(record["paradox"]),
+                        record.get("backend"),
+                        _iso(record.get("timestamp")),
+                        record.get("shots") or int(sparse.shots),
+                        record.get("transpile_time_seconds"),
+                        record.get("execution_time_seconds"),
+                        sparse.num_bits,
+                        sparse.entropy(normalized=True),
+                        sparse.entropy(),
+                        state,
+                        count / (sparse.shots or 1),
+                        bool(document.get("emulated")),
+                    ),
+                )
+                rows += 1
+        return rows
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        paradox: Optional[str] = None,
+        backend: Optional[str] = None,
+        since: Any = None,
+        until: Any = None,
+        order_by: str = "timestamp",
+        descending: bool = False,
+        limit: Optional[int] = None,
+        include_emulated: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query indexed runs without opening any result file.
+
+        Args:
+            paradox: Paradox name (any spelling: "Halting Problem", "halting_problem")
+            backend: Backend name, e.g. "ibm_torino"
+            since: Lower timestamp bound (inclusive): ISO string (naive =
+                local time), datetime or epoch seconds
+            until: Upper timestamp bound (exclusive), same forms
+            order_by: Column to sort by
+            descending: Sort descending
+            limit: Maximum number of rows
+            include_emulated: Also return noise-emulator runs
+        """
+        if order_by not in ORDERABLE:
+            raise ValueError(f"order_by must be one of {sorted(ORDERABLE)}")
+
+        clauses, params = [], []
+        if paradox:
+            clauses.append("paradox_key = ?")
+            params.append(paradox_key(paradox))
+        if backend:
+            clauses.append("backend = ?")
+            params.append(backend)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(_iso(since))
+        if until:
+            clauses.append("timestamp < ?")
+            params.append(_iso(until))
+        if not include_emulated:
+            clauses.append("emulated = 0")
+
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def load_counts(self, run_id: int) -> Dict[str, int]:
+        """Load the counts of one indexed run from its source file."""
+        row = self.conn.execute(
+            "SELECT path, locator FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run id {run_id}")
+
+        locator = json.loads(row["locator"])
+        path = self.repo_root / row["path"]
+        if _is_stream(path):
+            line_no, locator = locator[0], locator[1:]
+            document = next(doc for i, doc in _documents(path) if i == line_no)
+        else:
+            with open(path) as f:
+                document = json.load(f)
+        return _resolve(document, locator)
+
+
+def _shadowed_by_stream(path: Path) -> bool:
+    """Per-paradox files of runs that also streamed the same records."""
+    return not _is_stream(path) and (path.parent.parent / "stream").is_dir()
+
+
+def _is_stream(path: Path) -> bool:
+    return ".jsonl" in path.name
+
+
+def _documents(path: Path) -> Iterator[Tuple[Optional[int], Any]]:
+    """Yield (line number or None, document) for JSON and JSONL files."""
+    try:
+        if not _is_stream(path):
+            with open(path) as f:
+                yield None, json.load(f)
+            return
+
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line_no, line in enumerate(f):
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        logger.warning(f"⚠️ Skipping unreadable {path}: {e}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Index and query historical runs")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB)
+    parser.add_argument("--root", type=Path, default=Path("."))
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("scan", help="Incrementally index result files")
+
+    query = commands.add_parser("query", help="Query indexed runs")
+    query.add_argument("--paradox")
+    query.add_argument("--backend")
+    query.add_argument("--since", help="ISO date/time (inclusive)")
+    query.add_argument("--until", help="ISO date/time (exclusive)")
+    query.add_argument("--days", type=int, help="Only the last N days")
+    query.add_argument("--order-by", default="timestamp", choices=sorted(ORDERABLE))
+    query.add_argument("--desc", action="store_true")
+    query.add_argument("--limit", type=int)
+    query.add_argument(
+        "--include-emulated", action="store_true", help="Also list emulated runs"
+    )
+    query.add_argument("--json", action="store_true", help="JSON output")
+
+    counts = commands.add_parser("counts", help="Load the counts of one run")
+    counts.add_argument("run_id", type=int)
+
+    args = parser.parse_args(argv)
+    index = HistoryIndex(args.db, args.root)
+
+    try:
+        if args.command == "scan":
+            stats = index.scan()
+            print(
+                f"seen={stats['seen']} parsed={stats['parsed']} "
+                f"unchanged={stats['unchanged']} removed={stats['removed']} "
+                f"rows={stats['rows']}"
+            )
+        elif args.command == "query":
+            since = args.since
+            if args.days is not None:
+                since = datetime.now(timezone.utc) - timedelta(days=args.days)
+            rows = index.query(
+                paradox=args.paradox,
+                backend=args.backend,
+                since=since,
+                until=args.until,
+                order_by=args.order_by,
+                descending=args.desc,
+                limit=args.limit,
+                include_emulated=args.include_emulated,
+            )
+            if args.json:
+                print(json.dumps(rows, indent=2))
+            else:
+                for row in rows:
+                    print(
+                        f"{row['id']:>6}  {row['timestamp'] or '-':<26}  "
+                        f"{row['backend'] or '-':<12}  {row['paradox']:<32}  "
+                        f"H={row['entropy']:.3f}  |{row['dominant_state']}⟩ "
+                        f"{row['dominant_probability']:.1%}"
+                        + ("  (emulated)" if row["emulated"] else "")
+                    )
+        elif args.command == "counts":
+            print(json.dumps(index.load_counts(args.run_id), indent=2))
+    finally:
+        index.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    sys.exit(main())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Exact Ideal Simulator for Paradox Circuits (Public Version)
+======================================================================
+
+QPU-free, noise-free baseline for every paradox run.
+
+All PARADOX_BUILDERS circuits use only H, X and CX followed by terminal
+measurements, i.e. they are Clifford circuits. For those the exact output
+distribution is computed with a stabilizer tableau (Aaronson-Gottesman):
+the measured bits are uniformly distributed over an affine GF(2) subspace
+``offset + span(generators)``, which is stored in O(n²) bits and sampled
+with vectorized NumPy, so it scales to hundreds of qubits
+(e.g. ``build_halting_problem(program_length=500)``).
+
+Small non-Clifford circuits fall back to an exact statevector.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Gates understood by the tableau (measure/barrier/id handled separately)
+CLIFFORD_GATES = {"h", "x", "y", "z", "s", "sdg", "cx", "cz", "swap"}
+IGNORED_INSTRUCTIONS = {"barrier", "id", "delay"}
+
+# Dense statevector fallback limit (2^24 amplitudes ≈ 256 MB)
+MAX_STATEVECTOR_QUBITS = 24
+
+
+class StabilizerTableau:
+    """Stabilizer generators of an n-qubit state as X/Z bit matrices plus phases."""
+
+    def __init__(self, num_qubits: int):
+        """Initialize the tableau of |0…0⟩ (generators Z_0 … Z_{n-1})."""
+        self.num_qubits = num_qubits
+        self.x = np.zeros((num_qubits, num_qubits), dtype=bool)
+        self.z = np.eye(num_qubits, dtype=bool)
+        self.r = np.zeros(num_qubits, dtype=bool)
+
+    def h(self, a: int) -> None:
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a: int) -> None:
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+
+    def sdg(self, a: int) -> None:
+        for _ in range(3):
+            self.s(a)
+
+    def x_gate(self, a: int) -> None:
+        self.r ^= self.z[:, a]
+
+    def z_gate(self, a: int) -> None:
+        self.r ^= self.x[:, a]
+
+    def y_gate(self, a: int) -> None:
+        self.r ^= self.x[:, a] ^ self.z[:, a]
+
+    def cx(self, control: int, target: int) -> None:
+        xc, xt = self.x[:, control], self.x[:, target]
+        zc, zt = self.z[:, control], self.z[:, target]
+        self.r ^= xc & zt & ~(xt ^ zc)
+        self.x[:, target] ^= xc
+        self.z[:, control] ^= zt
+
+    def cz(self, control: int, target: int) -> None:
+        self.h(target)
+        self.cx(control, target)
+        self.h(target)
+
+    def swap(self, a: int, b: int) -> None:
+        self.x[:, [a, b]] = self.x[:, [b, a]]
+        self.z[:, [a, b]] = self.z[:, [b, a]]
+
+    def apply(self, name: str, qubits: List[int]) -> None:
+        """Apply a named Clifford gate."""
+        if name in ("x", "y", "z"):
+            getattr(self, f"{name}_gate")(*qubits)
+        else:
+            getattr(self, name)(*qubits)
+
+    def _rowsum(self, targets: np.ndarray, source: int) -> None:
+        """Multiply generators ``targets`` by generator ``source`` (with phases)."""
+        # g() vanishes wherever the source is the identity: only its support matters
+        support = np.flatnonzero(self.x[source] | self.z[source])
+        x1, z1 = self.x[source, support], self.z[source, support]
+        x2 = self.x[np.ix_(targets, support)]
+        z2 = self.z[np.ix_(targets, support)]
+
+        # Aaronson-Gottesman g() ∈ {-1, 0, +1}: exponent of i picked up per qubit
+        is_y, is_x, is_z = x1 & z1, x1 & ~z1, ~x1 & z1
+        plus = (is_y & z2 & ~x2) | (is_x & z2 & x2) | (is_z & x2 & ~z2)
+        minus = (is_y & x2 & ~z2) | (is_x & z2 & ~x2) | (is_z & x2 & z2)
+        phase = 2 * self.r[targets].astype(np.int64) + 2 * int(self.r[source])
+        phase += plus.sum(axis=1) - minus.sum(axis=1)
+        self.r[targets] = (phase % 4) == 2
+        self.x[targets] ^= self.x[source]
+        self.z[targets] ^= self.z[source]
+
+    def measurement_subspace(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Support of a computational-basis measurement of every qubit.
+
+        Returns:
+            Tuple (offset, generators): outcomes are ``offset ⊕ span(generators)``
+            over GF(2), each with probability 2^-len(generators).
+        """
+        n = self.num_qubits
+
+        # Gaussian elimination on the X block: the first k generators keep
+        # X support (random outcomes), the remaining n-k become Z-only.
+        pivot = 0
+        for col in range(n):
+            candidates = np.flatnonzero(self.x[pivot:, col])
+            if candidates.size == 0:
+                continue
+            row = pivot + candidates[0]
+            if row != pivot:
+                for table in (self.x, self.z, self.r):
+                    table[[pivot, row]] = table[[row, pivot]]
+            others = np.flatnonzero(self.x[:, col])
+            others = others[others != pivot]
+            if others.size:
+                self._rowsum(others, pivot)
+            pivot += 1
+            if pivot == n:
+                break
+
+        # Z-only generators (-1)^r Z^z fix the parities z·b = r of the outcome b
+        return solve_gf2(self.z[pivot:].copy(), self.r[pivot:].copy(), n)
+
+
+def solve_gf2(
+    matrix: np.ndarray, rhs: np.ndarray, num_vars: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve ``matrix @ b = rhs`` over GF(2).
+
+    Returns:
+        Tuple (particular solution, null-space basis as rows)
+    """
+    matrix = matrix.astype(bool)
+    rhs = rhs.astype(bool)
+    pivots: List[int] = []
+    row = 0
+    for col in range(num_vars):
+        if row == matrix.shape[0]:
+            break
+        candidates = np.flatnonzero(matrix[row:, col])
+        if candidates.size == 0:
+            continue
+        swap = row + candidates[0]
+        matrix[[row, swap]] = matrix[[swap, row]]
+        rhs[[row, swap]] = rhs[[swap, row]]
+        others = np.flatnonzero(matrix[:, col])
+        others = others[others != row]
+        matrix[others] ^= matrix[row]
+        rhs[others] ^= rhs[row]
+        pivots.append(col)
+        row += 1
+
+    if rhs[row:].any():
+        raise ValueError("Inconsistent GF(2) system")
+
+    offset = np.zeros(num_vars, dtype=bool)
+    offset[pivots] = rhs[: len(pivots)]
+
+    pivot_set = set(pivots)
+    free = [c for c in range(num_vars) if c not in pivot_set]
+    basis = np.zeros((len(free), num_vars), dtype=bool)
+    for i, col in enumerate(free):
+        basis[i, col] = True
+        basis[i, pivots] = matrix[: len(pivots), col]
+    return offset, basis
+
+
+def _row_basis(vectors: np.ndarray) -> np.ndarray:
+    """Linearly independent rows spanning the same GF(2) space."""
+    vectors = vectors.astype(bool).copy()
+    rank = 0
+    for col in range(vectors.shape[1]):
+        if rank == vectors.shape[0]:
+            break
+        candidates = np.flatnonzero(vectors[rank:, col])
+        if candidates.size == 0:
+            continue
+        swap = rank + candidates[0]
+        vectors[[rank, swap]] = vectors[[swap, rank]]
+        others = np.flatnonzero(vectors[:, col])
+        others = others[others != rank]
+        vectors[others] ^= vectors[rank]
+        rank += 1
+    return vectors[:rank]
+
+
+def _span(coefficients: np.ndarray, generators: np.ndarray) -> np.ndarray:
+    """GF(2) products ``coefficients @ generators`` as boolean rows."""
+    # float32 BLAS matmul is exact here: entries are 0/1 and sums stay < 2^24
+    products = coefficients.astype(np.float32) @ generators.astype(np.float32)
+    return (products.astype(np.int64) & 1).astype(bool)
+
+
+def _rows_to_counts(rows: np.ndarray, counts: np.ndarray) -> Dict[str, int]:
+    """Convert clbit rows (clbit 0 first) to Qiskit bitstrings (clbit 0 last)."""
+    chars = np.where(rows[:, ::-1], "1", "0")
+    return {
+        "".join(row): int(count) for row, count in zip(chars, counts) if count > 0
+    }
+
+
+class IdealDistribution(ABC):
+    """Exact output distribution of a measured circuit."""
+
+    method = ""
+
+    def __init__(self, num_clbits: int):
+        self.num_clbits = num_clbits
+
+    @abstractmethod
+    def probabilities(self, max_outcomes: int = 1 << 16) -> Dict[str, float]:
+        """Exact bitstring → probability table (refuses huge supports)."""
+
+    @abstractmethod
+    def sample(self, shots: int, seed: Optional[int] = None) -> Dict[str, int]:
+        """Draw ``shots`` outcomes; returns bitstring → count."""
+
+
+class AffineDistribution(IdealDistribution):
+    """Uniform distribution over ``offset ⊕ span(generators)`` (Clifford circuits)."""
+
+    method = "stabilizer"
+
+    def __init__(self, offset: np.ndarray, generators: np.ndarray):
+        super().__init__(offset.shape[0])
+        self.offset = offset
+        self.generators = _row_basis(generators)
+
+    @property
+    def support_size(self) -> int:
+        return 1 << self.generators.shape[0]
+
+    def _outcomes(self) -> np.ndarray:
+        k = self.generators.shape[0]
+        coefficients = (np.arange(1 << k)[:, None] >> np.arange(k)) & 1
+        return _span(coefficients, self.generators) ^ self.offset
+
+    def probabilities(self, max_outcomes: int = 1 << 16) -> Dict[str, float]:
+        if self.support_size > max_outcomes:
+            raise ValueError(
+                f"Support of 2^{self.generators.shape[0]} outcomes exceeds "
+                f"max_outcomes={max_outcomes}"
+            )
+        outcomes = self._outcomes()
+        probability = 1.0 / len(outcomes)
+        return {
+            state: probability
+            for state in _rows_to_counts(outcomes, np.ones(len(outcomes), dtype=int))
+        }
+
+    def sample(self, shots: int, seed: Optional[int] = None) -> Dict[str, int]:
+        rng = np.random.default_rng(seed)
+        k = self.generators.shape[0]
+
+        if self.support_size <= max(shots, 1 << 12):
+            # Small support: one multinomial draw over the enumerated outcomes
+            outcomes = self._outcomes()
+            counts = rng.multinomial(shots, np.full(len(outcomes), 1 / len(outcomes)))
+            return _rows_to_counts(outcomes, counts)
+
+        # Huge support: i.i.d. uniform coefficients mapped through the generators
+        coefficients = rng.integers(0, 2, size=(shots, k), dtype=np.uint8)
+        rows = _span(coefficients, self.generators) ^ self.offset
+
+        # Deduplicate packed rows (one bytes key per shot) instead of bool rows
+        packed = np.packbits(rows, axis=1)
+        keys = packed.view(np.dtype((np.void, packed.shape[1]))).ravel()
+        _, first, counts = np.unique(keys, return_index=True, return_counts=True)
+        return _rows_to_counts(rows[first], counts)
+
+
+class DenseDistribution(IdealDistribution):
+    """Explicit probability table (statevector fallback)."""
+
+    method = "statevector"
+
+    def __init__(self, outcomes: np.ndarray, probs: np.ndarray):
+        super().__init__(outcomes.shape[1])
+        keep = probs > 1e-12
+        self.outcomes = outcomes[keep]
+        self.probs = probs[keep] / probs[keep].sum()
+
+    def probabilities(self, max_outcomes: int = 1 << 16) -> Dict[str, float]:
+        if len(self.probs) > max_outcomes:
+            raise ValueError(f"Support exceeds max_outcomes={max_outcomes}")
+        states = _rows_to_counts(self.outcomes, np.ones(len(self.probs), dtype=int))
+        return dict(zip(states, self.probs.tolist()))
+
+    def sample(self, shots: int, seed: Optional[int] = None) -> Dict[str, int]:
+        rng = np.random.default_rng(seed)
+        return _rows_to_counts(self.outcomes, rng.multinomial(shots, self.probs))
+
+
+def _measurement_map(circuit) -> Tuple[List[Tuple[str, List[int]]], Dict[int, int]]:
+    """
+    Split a circuit into its unitary part and its terminal measurements.
+
+    Returns:
+        Tuple (gates as (name, qubit indices), qubit → clbit map)
+
+    Raises:
+        ValueError: If a measured qubit is acted on after its measurement
+    """
+    gates: List[Tuple[str, List[int]]] = []
+    measured: Dict[int, int] = {}
+    for instruction in circuit.data:
+        name = instruction.operation.name
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+        if name == "measure":
+            clbit = circuit.find_bit(instruction.clbits[0]).index
+            measured[qubits[0]] = clbit
+        elif name in IGNORED_INSTRUCTIONS:
+            continue
+        else:
+            if any(q in measured for q in qubits):
+                raise ValueError("Only terminal measurements are supported")
+            gates.append((name, qubits))
+    return gates, measured
+
+
+def is_clifford_circuit(circuit) -> bool:
+    """True if every gate of the circuit is supported by the stabilizer tableau."""
+    return all(
+        instruction.operation.name in CLIFFORD_GATES
+        or instruction.operation.name in IGNORED_INSTRUCTIONS
+        or instruction.operation.name == "measure"
+        for instruction in circuit.data
+    )
+
+
+def ideal_distribution(
+    circuit, max_statevector_qubits: int = MAX_STATEVECTOR_QUBITS
+) -> IdealDistribution:
+    """
+    Exact noise-free output distribution of a circuit with terminal measurements.
+
+    Args:
+        circuit: QuantumCircuit (untranspiled)
+        max_statevector_qubits: Largest non-Clifford circuit simulated densely
+
+    Returns:
+        AffineDistribution (Clifford) or DenseDistribution (statevector)
+    """
+    gates, measured = _measurement_map(circuit)
+    num_clbits = circuit.num_clbits
+
+    if is_clifford_circuit(circuit):
+        tableau = StabilizerTableau(circuit.num_qubits)
+        for name, qubits in gates:
+            tableau.apply(name, qubits)
+        offset, basis = tableau.measurement_subspace()
+
+        # Project qubit outcomes onto the classical register
+        qubits = list(measured)
+        clbits = [measured[q] for q in qubits]
+        clbit_offset = np.zeros(num_clbits, dtype=bool)
+        clbit_offset[clbits] = offset[qubits]
+        clbit_basis = np.zeros((basis.shape[0], num_clbits), dtype=bool)
+        clbit_basis[:, clbits] = basis[:, qubits]
+        return AffineDistribution(clbit_offset, clbit_basis)
+
+    if circuit.num_qubits > max_statevector_qubits:
+        raise ValueError(
+            f"Non-Clifford circuit with {circuit.num_qubits} qubits exceeds the "
+            f"statevector limit of {max_statevector_qubits}"
+        )
+
+    from qiskit.quantum_info import Statevector
+
+    qubits = sorted(measured, key=measured.get)
+    statevector = Statevector(circuit.remove_final_measurements(inplace=False))
+    probs = statevector.probabilities(qargs=qubits)
+
+    # Index bit j of the probability vector is the outcome of qubits[j]
+    indices = np.arange(len(probs))
+    outcomes = np.zeros((len(probs), num_clbits), dtype=bool)
+    for j, qubit in enumerate(qubits):
+        outcomes[:, measured[qubit]] = (indices >> j) & 1
+    return DenseDistribution(outcomes, probs)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Job Journal (Public Version)
+=======================================
+
+Crash-safe record of submitted QPU jobs, for resuming interrupted runs.
+
+The journal is an append-only JSON-lines file; every entry is flushed and
+fsynced before the runner moves on (write-ahead), so after a crash it still
+tells which circuits were planned, which jobs were submitted (with their job
+IDs and transpile-cache artifacts) and which results were already recorded.
+
+Two levels are tracked:
+
+- jobs: keyed by backend, shots and the hashes of the submitted circuits.
+  A job is ``completed`` only after the results it carries were recorded,
+  so a job that was submitted but never consumed (including one whose
+  result was fetched just before a crash) is re-attached instead of being
+  paid for a second time.
+- paradoxes: ``planned`` when a run starts, ``recorded`` once the sanitized
+  result is written (on whichever backend). ``ParadoxExperimentRunner.resume()``
+  re-runs only the planned paradoxes that were never recorded.
+
+The journal holds job IDs, so it lives under ``results/private/`` and is
+never part of the sanitized outputs.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger("ParadoxRunner")
+
+DEFAULT_JOURNAL = Path("results/private/job_journal.jsonl")
+
+# Job states after which a job is never re-attached
+FINAL_EVENTS = ("completed", "failed", "abandoned")
+
+
+def job_key(backend_name: str, shots: int, circuit_hashes: Sequence[str]) -> str:
+    """Identity of a job's content: same backend, shots and circuits."""
+    payload = json.dumps([backend_name, shots, list(circuit_hashes)])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _paradox_key(entry: Dict[str, Any]) -> Tuple[str, str, int]:
+    # No backend: a paradox resumed on another backend is still finished
+    return entry["paradox"], entry["circuit"], entry["shots"]
+
+
+class JobJournal:
+    """Write-ahead journal of planned paradoxes and submitted jobs."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (and replay) a journal.
+
+        Args:
+            path: Journal file (default: results/private/job_journal.jsonl)
+        """
+        self.path = Path(path or DEFAULT_JOURNAL)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._sequence = 0
+        self._jobs: Dict[str, Dict[str, Any]] = {}  # job_id -> submitted entry
+        self._job_state: Dict[str, str] = {}  # job_id -> last event
+        self._planned: List[Dict[str, Any]] = []
+        self._recorded: Dict[Tuple[str, str, int], int] = {}  # -> last seq
+        self._claimed: Set[str] = set()  # job IDs re-attached by this process
+
+        self._replay()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _replay(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for line in data.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # Torn final write of a crashed process
+                logger.warning(f"⚠️ Skipping unreadable entry of {self.path}")
+        if data and not data.endswith(b"\n"):
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        self._sequence += 1
+        event = entry["event"]
+        if event == "planned":
+            self._planned.append({**entry, "seq": self._sequence})
+        elif event == "recorded":
+            self._recorded[_paradox_key(entry)] = self._sequence
+        elif event == "submitted":
+            self._jobs[entry["job_id"]] = entry
+            self._job_state[entry["job_id"]] = event
+        elif event in FINAL_EVENTS:
+            self._job_state[entry["job_id"]] = event
+
+    def _write(self, event: str, **fields: Any) -> None:
+        entry = {"event": event, "ts": datetime.now().isoformat(), **fields}
+        with self._lock:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._apply(entry)
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Paradoxes
+    # ------------------------------------------------------------------
+
+    def plan(
+        self,
+        run: str,
+        paradox: str,
+        circuit: str,
+        backend: str,
+        shots: int,
+        method: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record that a run is about to execute a paradox."""
+        self._write(
+            "planned",
+            run=run,
+            paradox=paradox,
+            circuit=circuit,
+            backend=backend,
+            shots=shots,
+            method=method,
+            options=options or {},
+        )
+
+    def recorded(
+        self,
+        run: str,
+        paradox: str,
+        circuit: str,
+        backend: str,
+        shots: int,
+        result_path: Optional[str] = None,
+    ) -> None:
+        """Record that the sanitized result of a paradox was written."""
+        self._write(
+            "recorded",
+            run=run,
+            paradox=paradox,
+            circuit=circuit,
+            backend=backend,
+            shots=shots,
+            result=result_path,
+        )
+
+    def unfinished(self, run: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Planned paradoxes whose result was never recorded afterwards.
+
+        Args:
+            run: Run timestamp (default: the latest run with unfinished work)
+
+        Returns:
+            Planned entries in plan order
+        """
+        with self._lock:
+            pending = [
+                entry
+                for entry in self._planned
+                if self._recorded.get(_paradox_key(entry), 0) < entry["seq"]
+            ]
+        if run is None and pending:
+            run = pending[-1]["run"]
+        return [entry for entry in pending if entry["run"] == run]
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def claim_pending(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        The oldest submitted, unconsumed job with this content key.
+
+        The job is claimed for this process, so two identical submissions
+        in one run never attach to the same job.
+        """
+        with self._lock:
+            for job_id, entry in self._jobs.items():
+                if (
+                    entry["key"] == key
+                    and self._job_state[job_id] == "submitted"
+                    and job_id not in self._claimed
+                ):
+                    self._claimed.add(job_id)
+                    return entry
+        return None
+
+    def submitted(
+        self,
+        key: str,
+        job_id: str,
+        backend: str,
+        shots: int,
+        circuits: Sequence[str],
+        transpiled: Optional[Sequence[str]] = None,
+        run: Optional[str] = None,
+    ) -> None:
+        """
+        Record a submitted job (before waiting for it).
+
+        Args:
+            key: job_key of the job content
+            job_id: Provider job ID (kept in this journal only)
+            backend: Backend name
+            shots: Shots per PUB
+            circuits: Fingerprints of the submitted logical circuits
+            transpiled: Transpile-cache keys of their transpiled artifacts
+            run: Run timestamp
+        """
+        self._write(
+            "submitted",
+            key=key,
+            job_id=job_id,
+            backend=backend,
+            shots=shots,
+            circuits=list(circuits),
+            transpiled=list(transpiled or []),
+            run=run,
+        )
+        with self._lock:
+            self._claimed.add(job_id)
+
+    def completed(self, job_id: str) -> None:
+        """Record that a job was consumed: the results it carries are recorded."""
+        self._write("completed", job_id=job_id)
+
+    def failed(self, job_id: str, error: str) -> None:
+        """Record that a job failed on the provider side."""
+        self._write("failed", job_id=job_id, error=error)
+
+    def abandoned(self, job_id: str, reason: str) -> None:
+        """Record that a pending job could not be re-attached."""
+        self._write("abandoned", job_id=job_id, error=reason)
+
+    def pending_jobs(self) -> List[Dict[str, Any]]:
+        """Submitted jobs that were never completed, failed or abandoned."""
+        with self._lock:
+            return [
+                entry
+                for job_id, entry in self._jobs.items()
+                if self._job_state[job_id] == "submitted"
+            ]
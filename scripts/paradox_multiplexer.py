@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Circuit Multiplexer (Public Version)
+===============================================
+
+Packs many small paradox circuits onto one wide device.
+
+The liar, EPR and Schrödinger circuits use two qubits, yet each job reserves
+all 133 qubits of ibm_torino. The multiplexer tiles independent circuits
+(different paradoxes, or repetitions of one) onto disjoint, connected qubit
+regions of the coupling map, in one combined circuit:
+
+1. Regions are grown greedily from the best-calibrated qubits (readout and
+   two-qubit gate errors from the backend Target), largest circuit first.
+2. Each circuit is transpiled against a sub-Target holding only its region,
+   so routing can never leave the region.
+3. A guard band of ``guard`` coupling-map hops is kept free around every
+   region to limit crosstalk.
+4. The combined classical register is demultiplexed back into per-circuit
+   counts.
+
+Circuits that do not fit go into further combined circuits ("frames").
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import logging
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from paradox_counts import SparseCounts
+from paradox_transpile_pool import DEFAULT_SEED_TRANSPILER, transpile_circuit
+
+logger = logging.getLogger("ParadoxRunner")
+
+
+class Slot(NamedTuple):
+    """Placement of one input circuit inside a frame."""
+
+    index: int  # position in the input sequence
+    region: Tuple[int, ...]  # physical qubits
+    clbit_offset: int
+    num_clbits: int
+
+
+class Frame(NamedTuple):
+    """One combined circuit and the circuits multiplexed into it."""
+
+    circuit: Any
+    slots: List[Slot]
+
+
+def _qubit_errors(target) -> Dict[int, float]:
+    """Readout error per qubit (0 where the target reports none)."""
+    errors = {q: 0.0 for q in range(target.num_qubits)}
+    if "measure" in target.operation_names:
+        for qargs, props in target["measure"].items():
+            if qargs and props is not None and props.error is not None:
+                errors[qargs[0]] = props.error
+    return errors
+
+
+def _edge_errors(target) -> Dict[Tuple[int, int], float]:
+    """Lowest two-qubit gate error per undirected coupling-map edge."""
+    errors: Dict[Tuple[int, int], float] = {}
+    for name in target.operation_names:
+        for qargs, props in target[name].items():
+            if qargs is None or len(qargs) != 2:
+                continue
+            edge = tuple(sorted(qargs))
+            error = props.error if props is not None and props.error else 0.0
+            errors[edge] = min(errors.get(edge, error), error)
+    return errors
+
+
+def sub_target(target, region: Sequence[int]):
+    """
+    Restrict a Target to ``region``; region[i] becomes virtual qubit i.
+
+    Instruction properties (errors, durations) are kept, so noise-aware
+    layout still works inside the region.
+    """
+    from qiskit.transpiler import Target
+
+    index = {physical: i for i, physical in enumerate(region)}
+    qubit_properties = (
+        [target.qubit_properties[q] for q in region]
+        if target.qubit_properties
+        else None
+    )
+    restricted = Target(
+        num_qubits=len(region), dt=target.dt, qubit_properties=qubit_properties
+    )
+
+    for name in target.operation_names:
+        operation = target.operation_from_name(name)
+        properties = target[name]
+        if None in properties:
+            # Global instruction (barrier-like or control flow)
+            restricted.add_instruction(operation, name=name)
+            continue
+        mapped = {
+            tuple(index[q] for q in qargs): props
+            for qargs, props in properties.items()
+            if all(q in index for q in qargs)
+        }
+        if mapped:
+            restricted.add_instruction(operation, mapped, name=name)
+    return restricted
+
+
+class CircuitMultiplexer:
+    """Tiles small circuits onto disjoint, guarded regions of one backend."""
+
+    def __init__(
+        self,
+        backend,
+        guard: int = 1,
+        optimization_level: int = 3,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+    ):
+        """
+        Initialize multiplexer.
+
+        Args:
+            backend: Backend (or snapshot stand-in) providing the Target
+            guard: Coupling-map hops kept free around every region
+                (0 = regions may touch)
+            optimization_level: Transpiler optimization level
+            seed_transpiler: Transpiler seed
+        """
+        self.backend = backend
+        self.target = backend.target
+        self.guard = guard
+        self.optimization_level = optimization_level
+        self.seed_transpiler = seed_transpiler
+
+        self.qubit_errors = _qubit_errors(self.target)
+        self.edge_errors = _edge_errors(self.target)
+        self.neighbors: Dict[int, Set[int]] = {
+            q: set() for q in range(self.target.num_qubits)
+        }
+        for a, b in self.edge_errors:
+            self.neighbors[a].add(b)
+            self.neighbors[b].add(a)
+
+    # ------------------------------------------------------------------
+    # Region allocation
+    # ------------------------------------------------------------------
+
+    def _grow(
+        self, seed: int, size: int, free: Set[int]
+    ) -> Optional[Tuple[List[int], float]]:
+        """Grow a connected region from ``seed``, cheapest neighbour first."""
+        region = [seed]
+        members = {seed}
+        cost = self.qubit_errors[seed]
+        while len(region) < size:
+            best = None
+            for q in region:
+                for n in self.neighbors[q]:
+                    if n in members or n not in free:
+                        continue
+                    edge = (q, n) if q < n else (n, q)
+                    step = self.qubit_errors[n] + self.edge_errors[edge]
+                    if best is None or step < best[0]:
+                        best = (step, n)
+            if best is None:
+                return None
+            cost += best[0]
+            region.append(best[1])
+            members.add(best[1])
+        return region, cost
+
+    def allocate(self, size: int, free: Set[int]) -> Optional[List[int]]:
+        """Best connected region of ``size`` free qubits, or None."""
+        best = None
+        for seed in sorted(free, key=self.qubit_errors.__getitem__):
+            grown = self._grow(seed, size, free)
+            if grown is not None and (best is None or grown[1] < best[1]):
+                best = grown
+        return best[0] if best else None
+
+    def _reserve(self, region: Sequence[int], free: Set[int]) -> None:
+        """Remove a region and its guard band from the free set."""
+        frontier = deque((q, 0) for q in region)
+        seen = set(region)
+        while frontier:
+            q, depth = frontier.popleft()
+            free.discard(q)
+            if depth < self.guard:
+                for n in self.neighbors[q]:
+                    if n not in seen:
+                        seen.add(n)
+                        frontier.append((n, depth + 1))
+
+    # ------------------------------------------------------------------
+    # Packing
+    # ------------------------------------------------------------------
+
+    def pack(self, circuits: Sequence[Any]) -> List[Frame]:
+        """
+        Pack circuits into as few combined circuits as possible.
+
+        Args:
+            circuits: Logical circuits (each measured into its own clbits)
+
+        Returns:
+            Frames; every input circuit appears in exactly one slot
+        """
+        from qiskit import ClassicalRegister, QuantumCircuit
+
+        order = sorted(range(len(circuits)), key=lambda i: -circuits[i].num_qubits)
+        placements: List[List[Tuple[int, List[int]]]] = []
+
+        while order:
+            free = set(self.neighbors)
+            placed, remaining = [], []
+            for i in order:
+                region = self.allocate(circuits[i].num_qubits, free)
+                if region is None:
+                    remaining.append(i)
+                    continue
+                self._reserve(region, free)
+                placed.append((i, region))
+            if not placed:
+                raise ValueError(
+                    f"Circuit {order[0]} ({circuits[order[0]].num_qubits} qubits) "
+                    f"does not fit a connected region of {self.backend.name}"
+                )
+            placements.append(sorted(placed))
+            order = remaining
+
+        frames = []
+        for placed in placements:
+            num_clbits = sum(circuits[i].num_clbits for i, _ in placed)
+            combined = QuantumCircuit(
+                self.target.num_qubits, name=f"multiplexed_{len(placed)}"
+            )
+            creg = ClassicalRegister(num_clbits, "c")
+            combined.add_register(creg)
+
+            slots, offset = [], 0
+            for i, region in placed:
+                transpiled, _ = transpile_circuit(
+                    circuits[i],
+                    sub_target(self.target, region),
+                    optimization_level=self.optimization_level,
+                    seed_transpiler=self.seed_transpiler,
+                )
+                width = circuits[i].num_clbits
+                combined.compose(
+                    transpiled,
+                    qubits=region,
+                    clbits=list(creg)[offset : offset + width],
+                    inplace=True,
+                )
+                slots.append(Slot(i, tuple(region), offset, width))
+                offset += width
+            frames.append(Frame(combined, slots))
+
+        logger.info(
+            f"🧩 Multiplexed {len(circuits)} circuits into {len(frames)} frame(s) "
+            f"on {self.backend.name} (guard {self.guard})"
+        )
+        return frames
+
+    @staticmethod
+    def demultiplex(frame: Frame, counts: Dict[str, int]) -> Dict[int, Dict[str, int]]:
+        """
+        Split the combined counts of a frame into per-circuit counts.
+
+        Returns:
+            Mapping input index -> counts over that circuit's clbits
+        """
+        sparse = SparseCounts.from_dict(counts)
+        return {
+            slot.index: sparse.marginal(
+                range(slot.clbit_offset, slot.clbit_offset + slot.num_clbits)
+            ).to_dict()
+            for slot in frame.slots
+        }
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Noise-Aware Emulator (Public Version)
+================================================
+
+Hardware-like local runs from a stored backend snapshot, without queueing.
+
+The snapshot's calibration (gate errors, T1/T2, gate lengths and readout
+errors) is compiled once into Aer quantum errors and cached per snapshot,
+in memory and on disk under ``results/noise_models/``. A new calibration
+changes the cache key, so a stale model is never reused.
+
+Compiling a full device model is the slow part, and handing a 100+ qubit
+model to Aer on every run costs seconds. Each run therefore gets a noise
+model restricted to the physical qubits its transpiled circuit actually
+touches (built in milliseconds from the compiled errors and memoized).
+
+Shots are split into fixed-size shards that run in a process pool. Every
+shard has its own seed derived from the emulator seed, the fingerprint of
+the circuit, how often that circuit was drawn before and the shard index.
+Results therefore depend only on the seed and on what was run, not on the
+number of workers or on the order concurrent jobs are submitted (pipelined
+and fan-out runs); throughput grows with the CPU count.
+
+Idle (delay) relaxation is not modeled: transpiled paradox circuits are not
+scheduled.
+
+Usage:
+    snapshot = BackendSnapshotCache().load("ibm_torino")
+    runner = ParadoxExperimentRunner(emulator=NoiseEmulator(snapshot, seed=42))
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import uuid
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from paradox_transpile_cache import backend_fingerprint, circuit_fingerprint
+
+logger = logging.getLogger("ParadoxRunner")
+
+DEFAULT_CACHE_DIR = Path("results/noise_models")
+DEFAULT_SHARD_SHOTS = 256
+
+# Compiled calibrations shared by all emulators of this process, by cache
+# file: the pool workers load that file, so it must exist for every emulator
+_calibrations: Dict[Path, Dict[str, Any]] = {}
+_calibrations_lock = threading.Lock()
+
+
+def calibration_key(backend, **options: Any) -> str:
+    """Cache key of a backend's compiled noise: target, calibration, options."""
+    import qiskit_aer
+
+    payload = json.dumps(
+        [
+            backend_fingerprint(backend),
+            getattr(backend, "saved_at", None),
+            qiskit_aer.__version__,
+            options,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def compile_calibration(
+    backend,
+    gate_error: bool = True,
+    thermal_relaxation: bool = True,
+    readout_error: bool = True,
+) -> Dict[str, Any]:
+    """
+    Compile a backend target's calibration into Aer errors.
+
+    Args:
+        backend: Live, fake or snapshot backend (only ``target`` is read)
+        gate_error: Include depolarizing gate errors
+        thermal_relaxation: Include T1/T2 relaxation over gate lengths
+        readout_error: Include measurement assignment errors
+
+    Returns:
+        Dict with the basis gates, readout errors ``[(qubits, error)]`` and
+        gate errors ``[(gate, qubits, error)]``
+    """
+    from qiskit_aer.noise.device.models import (
+        basic_device_gate_errors,
+        basic_device_readout_errors,
+    )
+
+    target = backend.target
+    with warnings.catch_warnings():
+        # Missing T1/T2 or gate lengths only drop that part of the model
+        warnings.simplefilter("ignore")
+        gates = basic_device_gate_errors(
+            gate_error=gate_error,
+            thermal_relaxation=thermal_relaxation,
+            target=target,
+        )
+    readout = basic_device_readout_errors(target=target) if readout_error else []
+    return {
+        "basis_gates": list(target.operation_names),
+        "readout": readout,
+        "gates": gates,
+    }
+
+
+def active_qubits(circuit) -> FrozenSet[int]:
+    """Physical qubits a transpiled circuit applies instructions to."""
+    return frozenset(
+        circuit.find_bit(qubit).index
+        for instruction in circuit.data
+        for qubit in instruction.qubits
+    )
+
+
+def restricted_noise_model(calibration: Dict[str, Any], qubits: FrozenSet[int]):
+    """NoiseModel holding only the errors that act on ``qubits``."""
+    from qiskit_aer.noise import NoiseModel
+
+    noise_model = NoiseModel(basis_gates=calibration["basis_gates"])
+    for error_qubits, error in calibration["readout"]:
+        if qubits.issuperset(error_qubits):
+            noise_model.add_readout_error(error, error_qubits, warnings=False)
+    for name, error_qubits, error in calibration["gates"]:
+        if qubits.issuperset(error_qubits):
+            noise_model.add_quantum_error(error, name, error_qubits, warnings=False)
+    return noise_model
+
+
+def shard_seed(seed: int, fingerprint: str, draw: int, shard: int) -> int:
+    """
+    Deterministic, independent seed of one shard.
+
+    Args:
+        seed: Emulator base seed
+        fingerprint: circuit_fingerprint of the executed circuit
+        draw: How many times this circuit was sampled before (so repeated
+            rounds, e.g. adaptive shots, get fresh samples)
+        shard: Shard index within the PUB
+    """
+    import numpy as np
+
+    words = [int(fingerprint[i : i + 8], 16) for i in range(0, 32, 8)]
+    sequence = np.random.SeedSequence([seed, *words, draw, shard])
+    return int(sequence.generate_state(1)[0])
+
+
+# ----------------------------------------------------------------------
+# Worker side (module-level, so the process pool can reach it)
+# ----------------------------------------------------------------------
+
+_worker_calibration: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(calibration: Dict[str, Any]) -> None:
+    global _worker_calibration
+    _worker_calibration = calibration
+    _worker_noise_model.cache_clear()
+
+
+def _load_worker(path: str) -> None:
+    """Pool initializer: load the compiled calibration from the cache."""
+    with open(path, "rb") as f:
+        _init_worker(pickle.load(f))
+
+
+@lru_cache(maxsize=64)
+def _worker_noise_model(qubits: FrozenSet[int]):
+    return restricted_noise_model(_worker_calibration, qubits)
+
+
+def _sample_shard(task: Tuple[Any, int, int, str]) -> Dict[str, Any]:
+    """Run one shard of noisy shots; returns the BitArray of every register."""
+    from qiskit_aer.primitives import SamplerV2
+
+    circuit, shots, seed, method = task
+    sampler = SamplerV2(
+        seed=seed,
+        options={
+            "backend_options": {
+                "noise_model": _worker_noise_model(active_qubits(circuit)),
+                "method": method,
+            }
+        },
+    )
+    data = sampler.run([circuit], shots=shots).result()[0].data
+    return dict(data.items())
+
+
+# ----------------------------------------------------------------------
+# Emulator
+# ----------------------------------------------------------------------
+
+
+class EmulatorJob:
+    """Job handle of an emulated submission (SamplerV2 job interface)."""
+
+    def __init__(
+        self,
+        job_id: str,
+        shards: List[List[Future]],
+        shots: int,
+        metadata: Dict[str, Any],
+    ):
+        self._job_id = job_id
+        self._shards = shards  # per PUB, in shard order
+        self._shots = shots
+        self._metadata = metadata
+        self._result = None
+
+    def job_id(self) -> str:
+        return self._job_id
+
+    def done(self) -> bool:
+        return all(f.done() for futures in self._shards for f in futures)
+
+    def in_final_state(self) -> bool:
+        return self.done()
+
+    def status(self) -> str:
+        return "DONE" if self.done() else "RUNNING"
+
+    def result(self):
+        """Merge the shards of every PUB into a SamplerV2 PrimitiveResult."""
+        if self._result is not None:
+            return self._result
+
+        from qiskit.primitives import (
+            BitArray,
+            DataBin,
+            PrimitiveResult,
+            SamplerPubResult,
+        )
+
+        pub_results = []
+        for futures in self._shards:
+            parts = [f.result() for f in futures]
+            registers = {
+                name: BitArray.concatenate_shots([part[name] for part in parts])
+                for name in parts[0]
+            }
+            pub_results.append(
+                SamplerPubResult(
+                    DataBin(**registers, shape=()),
+                    metadata={"shots": self._shots, "emulated": True},
+                )
+            )
+        self._result = PrimitiveResult(pub_results, metadata=self._metadata)
+        return self._result
+
+
+class NoiseEmulator:
+    """Noisy, process-parallel stand-in for a backend's Sampler."""
+
+    def __init__(
+        self,
+        backend,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        shard_shots: int = DEFAULT_SHARD_SHOTS,
+        method: str = "automatic",
+        cache_dir: Optional[Path] = None,
+        gate_error: bool = True,
+        thermal_relaxation: bool = True,
+        readout_error: bool = True,
+    ):
+        """
+        Initialize emulator.
+
+        Args:
+            backend: Snapshot (or fake) backend whose calibration is emulated;
+                circuits must be transpiled for it
+            seed: Base seed of all shards (default: random, reported in
+                ``describe()``)
+            max_workers: Process-pool size (default: CPU count). With one
+                worker, shards run inline without a pool.
+            shard_shots: Shots per shard; part of the seeding, so keep it
+                fixed to reproduce a run
+            method: Aer simulation method (``matrix_product_state`` for
+                circuits touching many qubits)
+            cache_dir: Compiled calibration cache (default: results/noise_models)
+            gate_error: Include depolarizing gate errors
+            thermal_relaxation: Include T1/T2 relaxation
+            readout_error: Include readout errors
+        """
+        import numpy as np
+
+        if shard_shots < 1:
+            raise ValueError("shard_shots must be positive")
+
+        self.backend = backend
+        # Distinct from the device: per-backend caches (readout calibration)
+        # never mix emulated and hardware data
+        self.name = f"{backend.name}_emulator"
+        self.num_qubits = backend.num_qubits
+        self.seed = (
+            seed if seed is not None else int(np.random.SeedSequence().entropy % 2**63)
+        )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_shots = shard_shots
+        self.method = method
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.options = {
+            "gate_error": gate_error,
+            "thermal_relaxation": thermal_relaxation,
+            "readout_error": readout_error,
+        }
+        self.key = calibration_key(backend, **self.options)
+
+        self._lock = threading.Lock()
+        self._draws: Dict[str, int] = {}  # circuit fingerprint -> times sampled
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Calibration cache
+    # ------------------------------------------------------------------
+
+    @property
+    def calibration(self) -> Dict[str, Any]:
+        """Compiled calibration (memory, then disk, then compiled)."""
+        path = self._cache_path().resolve()
+        with _calibrations_lock:
+            calibration = _calibrations.get(path)
+            if calibration is None:
+                calibration = self._load_or_compile()
+                _calibrations[path] = calibration
+            return calibration
+
+    def _cache_path(self) -> Path:
+        return self.cache_dir / f"{self.backend.name}_{self.key[:16]}.pkl"
+
+    def _load_or_compile(self) -> Dict[str, Any]:
+        path = self._cache_path()
+        try:
+            with open(path, "rb") as f:
+                calibration = pickle.load(f)
+            logger.info(f"📦 Noise model cache hit: {path.name}")
+            return calibration
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # Written by an incompatible qiskit-aer version
+            logger.warning(f"⚠️ Ignoring noise model cache {path.name}: {e}")
+
+        logger.info(f"🧪 Compiling noise model for {self.name}...")
+        calibration = compile_calibration(self.backend, **self.options)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Atomic replace: concurrent readers never see a partial model
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(calibration, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        logger.info(f"💾 Noise model cached: {path.name}")
+        return calibration
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        """The worker pool, started on first use (None when running inline)."""
+        calibration = self.calibration
+        if self.max_workers <= 1:
+            if _worker_calibration is not calibration:
+                _init_worker(calibration)
+            return None
+        with self._lock:
+            if self._pool is None:
+                logger.info(f"🧪 Emulator pool: {self.max_workers} workers")
+                # Spawned, not forked: Aer's OpenMP runtime does not survive
+                # a fork once the parent has simulated anything
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_worker,
+                    initargs=(str(self._cache_path().resolve()),),
+                )
+            return self._pool
+
+    def run(self, pubs: Sequence[Any], shots: Optional[int] = None) -> EmulatorJob:
+        """
+        Submit transpiled circuits (same call as ``SamplerV2.run``).
+
+        Args:
+            pubs: Circuits transpiled for the emulated backend
+            shots: Shots per PUB (default: 1024)
+
+        Returns:
+            EmulatorJob; ``result()`` blocks until every shard finished
+        """
+        shots = shots or 1024
+        pool = self._executor()
+
+        shards = []
+        for circuit in pubs:
+            fingerprint = circuit_fingerprint(circuit)
+            with self._lock:
+                draw = self._draws.get(fingerprint, 0)
+                self._draws[fingerprint] = draw + 1
+            futures = []
+            for shard, start in enumerate(range(0, shots, self.shard_shots)):
+                task = (
+                    circuit,
+                    min(self.shard_shots, shots - start),
+                    shard_seed(self.seed, fingerprint, draw, shard),
+                    self.method,
+                )
+                if pool is None:
+                    future = Future()
+                    future.set_result(_sample_shard(task))
+                else:
+                    future = pool.submit(_sample_shard, task)
+                futures.append(future)
+            shards.append(futures)
+
+        return EmulatorJob(
+            f"emulator-{uuid.uuid4().hex[:12]}",
+            shards,
+            shots,
+            metadata={"emulated": True},
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        """Sanitized emulator settings stored with every emulated result."""
+        saved_at = getattr(self.backend, "saved_at", None)
+        info = {
+            "backend": self.backend.name,
+            "noise_model": self.key[:16],
+            "seed": self.seed,
+            "shard_shots": self.shard_shots,
+            "method": self.method,
+            **self.options,
+        }
+        if saved_at is not None:
+            info["snapshot_saved_at"] = datetime.fromtimestamp(saved_at).isoformat()
+        return info
+
+    def properties(self):
+        """Calibration properties of the emulated backend (may be None)."""
+        return self.backend.properties()
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def __enter__(self) -> "NoiseEmulator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<NoiseEmulator {self.name} ({self.max_workers} workers)>"
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Readout Error Mitigation (Public Version)
+====================================================
+
+Cached tensored readout calibration and subspace measurement mitigation.
+
+Calibration runs two circuits on the measured physical qubits (all |0⟩ and
+all |1⟩), which yields the 2x2 confusion matrix of every qubit at once. The
+matrices are cached per backend and physical qubit, expire after
+``max_age`` seconds, and are discarded as soon as the backend's own
+calibration timestamp changes. Only the qubits that are missing or expired
+are ever re-measured, so calibration cost is amortized over many runs. The
+calibration circuits are transpiled for the backend with the measured
+qubits kept in place.
+
+Calibration is a job in its own right: callers calibrate every measured
+qubit of a suite once, before submitting it, and hand the result to
+``mitigate``, which then never touches the backend.
+
+Mitigation never builds a 2^n matrix. The tensored confusion matrix is
+restricted to the observed outcomes (columns renormalized, as in M3):
+
+- up to ``dense_limit`` outcomes: dense m x m system, built from four
+  bit-matrix products in log space
+- beyond that: sparse system limited to outcome pairs within
+  ``max_hamming`` bit flips, solved with GMRES
+
+The quasi-probabilities are then projected onto the nearest probability
+distribution (Smolin, Gambetta and Smith, 2012).
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from paradox_counts import CountsLike, SparseCounts, as_sparse_counts
+from paradox_noise_emulator import NoiseEmulator
+from paradox_transpile_cache import backend_fingerprint
+
+logger = logging.getLogger("ParadoxRunner")
+
+_MIN_PROBABILITY = 1e-12
+
+
+def measured_qubits(transpiled) -> List[int]:
+    """Physical qubit measured into each clbit of a transpiled circuit."""
+    qubits = [-1] * transpiled.num_clbits
+    for instruction in transpiled.data:
+        if instruction.operation.name == "measure":
+            clbit = transpiled.find_bit(instruction.clbits[0]).index
+            qubits[clbit] = transpiled.find_bit(instruction.qubits[0]).index
+    if -1 in qubits:
+        raise ValueError("Every clbit must be written by a measurement")
+    return qubits
+
+
+def nearest_probability_distribution(quasi: np.ndarray) -> np.ndarray:
+    """Closest (L2) probability vector to a quasi-probability vector."""
+    order = np.argsort(quasi)
+    q = quasi[order].astype(float)
+    n = len(q)
+    prefix = np.concatenate(([0.0], np.cumsum(q)[:-1]))
+    # Smolin et al.: zero the most negative entries while that keeps the
+    # remaining ones shifted non-negative
+    negative = q + prefix / (n - np.arange(n)) < 0
+    k = n if negative.all() else int(np.argmin(negative))
+    q[k:] += prefix[k] / (n - k) if k < n else 0.0
+    q[:k] = 0.0
+    result = np.empty(n)
+    result[order] = q
+    return result / result.sum()
+
+
+class ReadoutMitigator:
+    """Readout calibration cache and tensored subspace mitigation."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_age: float = 3600.0,
+        calibration_shots: int = 4096,
+        dense_limit: int = 2048,
+        max_hamming: int = 2,
+        sampler_factory=None,
+    ):
+        """
+        Initialize mitigator.
+
+        Args:
+            cache_dir: Directory of per-backend calibration files
+                (default: results/readout_calibration)
+            max_age: Seconds after which a qubit is re-calibrated
+            calibration_shots: Shots per calibration circuit
+            dense_limit: Maximum observed outcomes for the dense solver
+            max_hamming: Bit-flip cutoff of the sparse solver
+            sampler_factory: Callable backend -> sampler (default: SamplerV2)
+        """
+        self.cache_dir = Path(cache_dir or "results/readout_calibration")
+        self.max_age = max_age
+        self.calibration_shots = calibration_shots
+        self.dense_limit = dense_limit
+        self.max_hamming = max_hamming
+        self.sampler_factory = sampler_factory
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Calibration
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, backend) -> Path:
+        return self.cache_dir / f"{backend.name}.json"
+
+    def _load(self, backend) -> Dict[str, Any]:
+        fingerprint = backend_fingerprint(backend)
+        try:
+            with open(self._cache_path(backend)) as f:
+                cache = json.load(f)
+            if cache.get("fingerprint") == fingerprint:
+                return cache
+            logger.info(f"🔄 {backend.name} recalibrated; readout cache reset")
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        return {"fingerprint": fingerprint, "qubits": {}}
+
+    def _save(self, backend, cache: Dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._cache_path(backend)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp, path)
+
+    def calibration_circuits(self, qubits: Sequence[int], backend=None) -> List[Any]:
+        """
+        The all-|0⟩ and all-|1⟩ circuits measuring ``qubits``.
+
+        With ``backend`` given they are transpiled for it, virtual qubit q
+        on physical qubit q.
+        """
+        from qiskit import QuantumCircuit
+
+        circuits = []
+        for prepared in (0, 1):
+            qc = QuantumCircuit(max(qubits) + 1, len(qubits))
+            if prepared:
+                qc.x(list(qubits))
+            qc.measure(list(qubits), range(len(qubits)))
+            circuits.append(qc)
+        if backend is None:
+            return circuits
+
+        from qiskit import transpile
+
+        # The emulator runs circuits transpiled for the backend it emulates
+        target = (
+            backend.backend if isinstance(backend, NoiseEmulator) else backend
+        ).target
+        return transpile(
+            circuits,
+            target=target,
+            initial_layout=list(range(max(qubits) + 1)),
+            optimization_level=0,
+        )
+
+    def calibrate(
+        self, backend, qubits: Sequence[int], force: bool = False
+    ) -> Dict[int, Dict[str, float]]:
+        """
+        Ensure fresh confusion matrices for ``qubits``.
+
+        Missing or expired qubits are measured together in one job.
+
+        Args:
+            backend: Backend the calibration circuits run on
+            qubits: Physical qubits
+            force: Re-measure even cached qubits
+
+        Returns:
+            Mapping qubit -> {"p1_given_0", "p0_given_1", "shots", "measured_at"}
+        """
+        with self._lock:
+            cache = self._load(backend)
+            now = time.time()
+            stale = sorted(
+                {
+                    q
+                    for q in qubits
+                    if force
+                    or str(q) not in cache["qubits"]
+                    or now - cache["qubits"][str(q)]["measured_at"] > self.max_age
+                }
+            )
+
+            if stale:
+                logger.info(f"📏 Readout calibration of {len(stale)} qubit(s)...")
+                sampler = self._sampler(backend)
+                job = sampler.run(
+                    self.calibration_circuits(stale, backend),
+                    shots=self.calibration_shots,
+                )
+                result = job.result()
+                flipped = []
+                for prepared in (0, 1):
+                    counts = SparseCounts.from_dict(
+                        result[prepared].data.c.get_counts()
+                    )
+                    rows = counts.bit_rows()
+                    ones = counts.counts @ rows / counts.shots
+                    flipped.append(ones if prepared == 0 else 1.0 - ones)
+                for i, q in enumerate(stale):
+                    cache["qubits"][str(q)] = {
+                        "p1_given_0": float(flipped[0][i]),
+                        "p0_given_1": float(flipped[1][i]),
+                        "shots": self.calibration_shots,
+                        "measured_at": now,
+                    }
+                self._save(backend, cache)
+
+            return {q: cache["qubits"][str(q)] for q in qubits}
+
+    def _sampler(self, backend):
+        if self.sampler_factory is not None:
+            return self.sampler_factory(backend)
+        if isinstance(backend, NoiseEmulator):
+            # The emulator is its own sampler
+            return backend
+        from qiskit_ibm_runtime import SamplerV2
+
+        return SamplerV2(mode=backend)
+
+    # ------------------------------------------------------------------
+    # Mitigation
+    # ------------------------------------------------------------------
+
+    def mitigate(
+        self,
+        counts: CountsLike,
+        backend,
+        qubits: Sequence[int],
+        calibration: Optional[Dict[int, Dict[str, float]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Mitigate counts measured on ``qubits`` (clbit i ↔ qubits[i]).
+
+        Args:
+            counts: Raw counts
+            backend: Backend the counts were measured on
+            qubits: Physical qubit of every clbit
+            calibration: Result of an earlier ``calibrate`` covering
+                ``qubits``; no calibration job is run then (default:
+                calibrate now)
+
+        Returns:
+            The ``mitigated`` section of ``quantum_result``: nearest
+            probability distribution, quasi-probabilities and calibration
+        """
+        sparse = as_sparse_counts(counts)
+        if calibration is None:
+            calibration = self.calibrate(backend, qubits)
+        p1_given_0 = np.array([calibration[q]["p1_given_0"] for q in qubits])
+        p0_given_1 = np.array([calibration[q]["p0_given_1"] for q in qubits])
+
+        quasi = self.solve(sparse, p1_given_0, p0_given_1)
+        probabilities = nearest_probability_distribution(quasi)
+        states = sparse.states()
+
+        return {
+            "distribution": dict(zip(states, probabilities.tolist())),
+            "quasi_distribution": dict(zip(states, quasi.tolist())),
+            "method": "dense" if len(sparse) <= self.dense_limit else "sparse",
+            "calibration": {
+                "qubits": list(qubits),
+                "p1_given_0": p1_given_0.tolist(),
+                "p0_given_1": p0_given_1.tolist(),
+                "measured_at": min(calibration[q]["measured_at"] for q in qubits),
+            },
+        }
+
+    def solve(
+        self, sparse: SparseCounts, p1_given_0: np.ndarray, p0_given_1: np.ndarray
+    ) -> np.ndarray:
+        """
+        Quasi-probabilities of the observed outcomes (aligned with ``sparse``).
+
+        Args:
+            sparse: Raw counts
+            p1_given_0: Per-clbit probability of reading 1 after preparing 0
+            p0_given_1: Per-clbit probability of reading 0 after preparing 1
+        """
+        e0 = np.clip(p1_given_0, _MIN_PROBABILITY, 1 - _MIN_PROBABILITY)
+        e1 = np.clip(p0_given_1, _MIN_PROBABILITY, 1 - _MIN_PROBABILITY)
+        # log P(read x_j | prepared y_j) for (x, y) = 00, 10, 01, 11
+        weights = np.log([1 - e0, e0, e1, 1 - e1])
+
+        bits = sparse.bit_rows().astype(np.float64)
+        p = sparse.probabilities()
+
+        if len(sparse) <= self.dense_limit:
+            matrix = np.exp(self._log_block(bits, bits, weights))
+            matrix /= matrix.sum(axis=0)
+            return np.linalg.solve(matrix, p)
+
+        return self._solve_sparse(bits, p, weights)
+
+    @staticmethod
+    def _log_block(x: np.ndarray, y: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """log A[x, y] for measured rows ``x`` and prepared rows ``y``."""
+        a00, a10, a01, a11 = weights
+        nx, ny = 1.0 - x, 1.0 - y
+        return (
+            (nx * a00) @ ny.T + (x * a10) @ ny.T + (nx * a01) @ y.T + (x * a11) @ y.T
+        )
+
+    def _solve_sparse(
+        self, bits: np.ndarray, p: np.ndarray, weights: np.ndarray
+    ) -> np.ndarray:
+        from scipy import sparse as sp
+        from scipy.sparse.linalg import gmres
+
+        m = len(bits)
+        weight = bits.sum(axis=1)
+        rows, cols, values = [], [], []
+        block = max(1, (32 * 1024 * 1024) // (8 * m))
+
+        for start in range(0, m, block):
+            x = bits[start : start + block]
+            # Hamming distance from row sums and one bit-matrix product
+            hamming = weight[start : start + block, None] + weight[None, :]
+            hamming -= 2 * (x @ bits.T)
+            near = np.nonzero(hamming <= self.max_hamming + 0.5)
+            log_a = self._log_block(x, bits, weights)[near]
+            rows.append(near[0] + start)
+            cols.append(near[1])
+            values.append(np.exp(log_a))
+
+        matrix = sp.csc_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(m, m),
+        )
+        column_sums = np.asarray(matrix.sum(axis=0)).ravel()
+        matrix = matrix @ sp.diags(1.0 / column_sums)
+        preconditioner = sp.diags(1.0 / matrix.diagonal())
+
+        quasi, info = gmres(matrix, p, M=preconditioner, rtol=1e-8, maxiter=200)
+        if info != 0:
+            logger.warning(f"⚠️ Readout mitigation GMRES did not converge ({info})")
+        return quasi
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Streaming Result Store (Public Version)
+==================================================
+
+Append-only JSONL sink for experiment results.
+
+Each result is one line in the current segment file
+(``results-00000.jsonl`` or ``.jsonl.gz``). Segments rotate after a fixed
+number of records, data is fsynced periodically, and readers stream the
+records back one at a time, so neither the writer nor the report generator
+ever holds the whole run in memory. Counts can be exported per segment to a
+columnar ``.npz`` file (record index, clbit width, key words, count).
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, IO, Iterator, List, Optional
+
+from paradox_tracing import Tracer, span
+
+logger = logging.getLogger("ParadoxRunner")
+
+SEGMENT_PREFIX = "results-"
+
+
+class ResultStore:
+    """Append-only, segmented JSONL result stream."""
+
+    def __init__(
+        self,
+        root: Path,
+        segment_max_records: int = 10000,
+        fsync_every: int = 100,
+        fsync_interval: float = 5.0,
+        compress: bool = False,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        Initialize store. Existing segments are kept; new records go to a
+        fresh segment so a torn tail from a previous crash is never extended.
+
+        Args:
+            root: Directory holding the segments
+            segment_max_records: Records per segment before rotating
+            fsync_every: fsync after this many unsynced records...
+            fsync_interval: ...or after this many seconds, whichever first
+            compress: Write gzip-compressed segments
+            tracer: Records record encoding as ``serialize`` (default: not
+                traced)
+        """
+        self.root = Path(root)
+        self.segment_max_records = segment_max_records
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compress = compress
+        self.tracer = tracer
+
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+        self._raw: Optional[IO[bytes]] = None
+        self._segment_index = 0
+        self._segment_records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        segments = self.segments()
+        self.count = sum(self._count_lines(path) for path in segments)
+        if segments:
+            self._segment_index = self._index_of(segments[-1]) + 1
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record (a JSON-serializable dict)."""
+        with span("serialize", self.tracer):
+            line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if (
+                self._file is None
+                or self._segment_records >= self.segment_max_records
+            ):
+                self._rotate()
+            self._file.write(line)
+            self._segment_records += 1
+            self._unsynced += 1
+            self.count += 1
+
+            if (
+                self._unsynced >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def flush(self) -> None:
+        """Flush and fsync pending records."""
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def close(self) -> None:
+        """Flush and close the current segment."""
+        with self._lock:
+            self._close_segment()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._close_segment()
+            self._segment_index += 1
+            self._segment_records = 0
+
+        # Created with the first record, not when the store is opened
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._segment_path(self._segment_index)
+        self._raw = open(path, "ab")
+        if self.compress:
+            self._file = gzip.open(self._raw, "at", encoding="utf-8")
+        else:
+            self._file = open(
+                self._raw.fileno(), "a", encoding="utf-8", closefd=False
+            )
+
+    def _sync(self) -> None:
+        self._file.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._raw.close()
+        self._file = None
+        self._raw = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def segments(self) -> List[Path]:
+        """Segment files in write order."""
+        paths = [
+            p
+            for p in self.root.glob(f"{SEGMENT_PREFIX}*.jsonl*")
+            if p.suffix in (".jsonl", ".gz")
+        ]
+        return sorted(paths, key=self._index_of)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Stream every record, oldest first, one at a time."""
+        self.flush()
+        for path in self.segments():
+            yield from self._iter_segment(path)
+
+    def _iter_segment(self, path: Path) -> Iterator[Dict[str, Any]]:
+        opener = gzip.open if path.suffix == ".gz" else open
+        try:
+            with opener(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn last line after a crash; earlier lines are valid
+                        logger.warning(f"⚠️ Skipping torn record in {path.name}")
+        except (EOFError, OSError) as e:
+            # The active gzip segment has no trailer until it is closed
+            if path != self._segment_path(self._segment_index) or self._file is None:
+                logger.warning(f"⚠️ Truncated segment {path.name}: {e}")
+
+    def export_counts(self, out_dir: Optional[Path] = None) -> List[Path]:
+        """
+        Export counts to columnar ``.npz`` files, one per segment.
+
+        Columns: ``record`` (global record index), ``num_bits`` (register width
+        of that record), ``keys`` (uint64 key words, clbit 0 = bit 0 of word 0)
+        and ``count``. Records without counts (failures) are skipped. Memory is
+        bounded by one segment.
+
+        Returns:
+            Paths of the written files
+        """
+        import numpy as np
+
+        from paradox_counts import SparseCounts
+
+        out_dir = Path(out_dir or self.root / "columnar")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        record_index = 0
+
+        for path in self.segments():
+            columns: Dict[str, list] = {
+                "record": [],
+                "num_bits": [],
+                "keys": [],
+                "count": [],
+            }
+            for record in self._iter_segment(path):
+                counts = record.get("quantum_result", {}).get("counts")
+                if counts:
+                    sparse = SparseCounts.from_dict(counts)
+                    n = len(sparse)
+                    columns["record"].append(np.full(n, record_index, np.int64))
+                    columns["num_bits"].append(np.full(n, sparse.num_bits, np.int32))
+                    columns["keys"].append(sparse.keys)
+                    columns["count"].append(sparse.counts.astype(np.int64))
+                record_index += 1
+
+            if not columns["record"]:
+                continue
+
+            words = max(k.shape[1] for k in columns["keys"])
+            keys = np.zeros((sum(len(k) for k in columns["keys"]), words), np.uint64)
+            row = 0
+            for block in columns["keys"]:
+                keys[row : row + len(block), : block.shape[1]] = block
+                row += len(block)
+
+            target = out_dir / f"{path.name.split('.')[0]}.counts.npz"
+            np.savez_compressed(
+                target,
+                record=np.concatenate(columns["record"]),
+                num_bits=np.concatenate(columns["num_bits"]),
+                keys=keys,
+                count=np.concatenate(columns["count"]),
+            )
+            written.append(target)
+
+        return written
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, index: int) -> Path:
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        return self.root / f"{SEGMENT_PREFIX}{index:05d}{suffix}"
+
+    @staticmethod
+    def _index_of(path: Path) -> int:
+        return int(path.name[len(SEGMENT_PREFIX) :].split(".")[0])
+
+    def _count_lines(self, path: Path) -> int:
+        return sum(1 for _ in self._iter_segment(path))
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Stage Tracing (Public Version)
+=========================================
+
+Lightweight per-stage timing for the experiment hot path.
+
+Every stage of a run (build, transpile, calibrate, serialize, submit,
+queue_wait, run, fetch, analyze, write) is timed with monotonic
+``perf_counter_ns`` spans and aggregated into fixed-bucket histograms. With
+tracing disabled (the default) a span only reads the clock twice, so call
+sites can stay instrumented.
+
+Stages nest (a transpile cache hit deserializes inside ``transpile``, a
+result is serialized inside ``write``): histograms record each span's self
+time, its duration minus that of the spans nested in it, so the stages of
+a run never overlap and add up to the traced wall time.
+
+There is no process-wide tracer: each runner owns one and passes it to the
+modules it drives, so runners in the same process keep separate histograms.
+
+Queue wait and hardware run time happen on the server: they are taken from
+the job's own timestamps when the provider reports them (IBM Runtime), and
+the rest of the local wait is attributed to ``fetch``.
+
+Histograms are exported as a JSON report and as a Prometheus text-format
+file for the node exporter's textfile collector.
+
+Usage:
+    tracer = Tracer()
+    runner = ParadoxExperimentRunner(tracer=tracer)
+    ...
+    runner.write_trace_report()
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("ParadoxRunner")
+
+STAGES = (
+    "build",
+    "transpile",
+    "calibrate",
+    "serialize",
+    "submit",
+    "queue_wait",
+    "run",
+    "fetch",
+    "analyze",
+    "write",
+)
+
+# Upper bounds in seconds (Prometheus "le" labels); +Inf is implicit
+BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0,
+)  # fmt: skip
+
+METRIC_NAME = "omnimind_paradox_stage_seconds"
+
+# Innermost open span of the current thread / asyncio task
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Histogram:
+    """Fixed-bucket duration histogram."""
+
+    __slots__ = ("buckets", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Quantile estimate, interpolated linearly inside its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= rank:
+                low = BUCKETS[i - 1] if i > 0 else 0.0
+                high = BUCKETS[i] if i < len(BUCKETS) else self.maximum
+                estimate = low + (high - low) * (rank - seen) / n
+                return min(max(estimate, self.minimum), self.maximum)
+            seen += n
+        return self.maximum
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "mean_seconds": self.total / self.count if self.count else 0.0,
+            "min_seconds": self.minimum if self.count else 0.0,
+            "max_seconds": self.maximum,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "buckets": {
+                str(bound): n for bound, n in zip(BUCKETS + ("+Inf",), self.buckets)
+            },
+        }
+
+
+class Span:
+    """
+    Timed section; records its self time into its tracer (if any) on exit.
+
+    ``seconds`` is the full duration, nested spans included.
+    """
+
+    __slots__ = ("name", "tracer", "start", "elapsed_ns", "nested_ns", "_token")
+
+    def __init__(self, name: Optional[str], tracer: Optional["Tracer"]):
+        self.name = name
+        self.tracer = tracer
+        self.start = 0
+        self.elapsed_ns = 0
+        self.nested_ns = 0
+        self._token = None
+
+    def __enter__(self) -> "Span":
+        if self.tracer is not None:
+            self._token = _current_span.set(self)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.elapsed_ns = perf_counter_ns() - self.start
+        if self.tracer is None:
+            return
+        _current_span.reset(self._token)
+        parent = _current_span.get()
+        if parent is not None and parent.tracer is self.tracer:
+            parent.nested_ns += self.elapsed_ns
+        self.tracer.record(self.name, self.self_seconds)
+
+    @property
+    def seconds(self) -> float:
+        return self.elapsed_ns / 1e9
+
+    @property
+    def self_seconds(self) -> float:
+        """Duration not covered by spans of the same tracer nested in this one."""
+        return max(0, self.elapsed_ns - self.nested_ns) / 1e9
+
+
+class Tracer:
+    """Thread-safe per-stage histograms."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.started_at = datetime.now().isoformat()
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def span(self, stage: str) -> Span:
+        """Time a stage (recorded only while the tracer is enabled)."""
+        return Span(stage, self if self.enabled else None)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record an externally measured duration."""
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def record_job(self, job, waited: float) -> Dict[str, float]:
+        """
+        Split the local wait for a job result into queue_wait / run / fetch.
+
+        Args:
+            job: Finished job; server timestamps are read from ``job.metrics()``
+            waited: Seconds spent blocking on ``job.result()``
+
+        Returns:
+            The recorded stage durations (just ``wait`` while disabled)
+        """
+        if not self.enabled:
+            # No provider round-trip while tracing is off
+            return {"wait": waited}
+
+        stages = {"run": waited}
+        timeline = job_timeline(job)
+        if timeline is not None:
+            queued, running = timeline
+            stages = {
+                "queue_wait": queued,
+                "run": running,
+                # Whatever the server does not account for: polling, download
+                "fetch": max(0.0, waited - queued - running),
+            }
+        for stage, seconds in stages.items():
+            self.record(stage, seconds)
+        return stages
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        """JSON-serializable per-stage statistics, in pipeline order."""
+        with self._lock:
+            order = [s for s in STAGES if s in self.histograms] + sorted(
+                set(self.histograms) - set(STAGES)
+            )
+            return {
+                "started_at": self.started_at,
+                "generated_at": datetime.now().isoformat(),
+                "stages": {s: self.histograms[s].to_json() for s in order},
+            }
+
+    def prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Prometheus text exposition format of all stage histograms."""
+        extra = "".join(f',{k}="{v}"' for k, v in (labels or {}).items())
+        lines = [
+            f"# HELP {METRIC_NAME} Duration of paradox runner stages.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in sorted(self.histograms.items()):
+                base = f'stage="{stage}"{extra}'
+                cumulative = 0
+                for bound, n in zip(BUCKETS + ("+Inf",), histogram.buckets):
+                    cumulative += n
+                    lines.append(
+                        f'{METRIC_NAME}_bucket{{{base},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f"{METRIC_NAME}_sum{{{base}}} {histogram.total}")
+                lines.append(f"{METRIC_NAME}_count{{{base}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_reports(
+        self, out_dir: Path, labels: Optional[Dict[str, str]] = None
+    ) -> List[Path]:
+        """
+        Write ``trace_report.json`` and ``trace_metrics.prom`` to ``out_dir``.
+
+        Files are replaced atomically, so a scraping node exporter never
+        reads a partial file.
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+        for filename, content in (
+            ("trace_report.json", json.dumps(self.report(), indent=2)),
+            ("trace_metrics.prom", self.prometheus(labels)),
+        ):
+            path = out_dir / filename
+            tmp = path.with_name(f".{filename}.{os.getpid()}.tmp")
+            tmp.write_text(content)
+            os.replace(tmp, path)
+            written.append(path)
+        return written
+
+
+def job_timeline(job) -> Optional[tuple]:
+    """(queued seconds, running seconds) from provider job metrics, if any."""
+    metrics = getattr(job, "metrics", None)
+    if metrics is None:
+        return None
+    try:
+        timestamps = metrics()["timestamps"]
+        created = datetime.fromisoformat(timestamps["created"].replace("Z", "+00:00"))
+        running = datetime.fromisoformat(timestamps["running"].replace("Z", "+00:00"))
+        finished = datetime.fromisoformat(
+            timestamps["finished"].replace("Z", "+00:00")
+        )
+    except Exception:
+        return None
+    return (
+        max(0.0, (running - created).total_seconds()),
+        max(0.0, (finished - running).total_seconds()),
+    )
+
+
+def span(stage: str, tracer: Optional[Tracer]) -> Span:
+    """Time a stage with ``tracer`` (only measures when it is None or disabled)."""
+    return Span(stage, tracer if tracer is not None and tracer.enabled else None)
+
+
+def stopwatch() -> Span:
+    """A span that only measures (never recorded)."""
+    return Span(None, None)
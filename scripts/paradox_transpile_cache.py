@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Persistent Transpilation Cache (Public Version)
+==========================================================
+
+On-disk cache of transpiled paradox circuits.
+
+Transpiling at optimization level 3 takes seconds per circuit, while the same
+PARADOX_BUILDERS circuits are sent to the same backends all day. Entries are
+keyed by a canonical hash of the circuit structure, the backend name, the
+target/calibration version, the optimization level and the transpiler seed,
+and are stored as QPY artifacts with LRU eviction by entry count and size.
+
+Cache hits only update the LRU bookkeeping in memory. The index is written
+on put, eviction and ``flush``: merged with the on-disk index under an
+exclusive file lock and replaced atomically, so several processes sharing
+the cache directory never lose each other's entries.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from paradox_tracing import Tracer, span
+from paradox_transpile_pool import (
+    DEFAULT_SEED_TRANSPILER,
+    TranspilePool,
+    transpile_circuit,
+    transpile_parallel,
+)
+
+logger = logging.getLogger("ParadoxRunner")
+
+DEFAULT_CACHE_DIR = Path("results/transpile_cache")
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+
+
+def circuit_fingerprint(circuit) -> str:
+    """
+    Canonical hash of a circuit's structure.
+
+    Two circuits with the same name, registers, gates, parameters and
+    qubit/clbit wiring produce the same fingerprint, regardless of object
+    identity or the order in which they were built.
+    """
+    digest = hashlib.sha256()
+    header = {
+        "name": circuit.name,
+        "num_qubits": circuit.num_qubits,
+        "num_clbits": circuit.num_clbits,
+        "qregs": [(reg.name, reg.size) for reg in circuit.qregs],
+        "cregs": [(reg.name, reg.size) for reg in circuit.cregs],
+    }
+    digest.update(json.dumps(header, sort_keys=True).encode())
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+        clbits = [circuit.find_bit(c).index for c in instruction.clbits]
+        params = [repr(p) for p in operation.params]
+        digest.update(f";{operation.name}{params}{qubits}{clbits}".encode())
+
+    return digest.hexdigest()
+
+
+def backend_fingerprint(backend) -> Dict[str, Any]:
+    """
+    Identify a backend target: name, size, version and calibration timestamp.
+
+    A new calibration changes the fingerprint, so stale layouts are never
+    served after the device has been recalibrated.
+    """
+    calibration = None
+    try:
+        properties = backend.properties()
+        if properties is not None and properties.last_update_date is not None:
+            calibration = properties.last_update_date.isoformat()
+    except Exception:
+        # Simulators and some fake backends expose no properties
+        calibration = None
+
+    return {
+        "name": backend.name,
+        "num_qubits": backend.num_qubits,
+        "version": str(getattr(backend, "backend_version", "")),
+        "calibration": calibration,
+    }
+
+
+def cache_key(
+    circuit_hash: str,
+    backend: Dict[str, Any],
+    optimization_level: int = 3,
+    seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+) -> str:
+    """
+    Cache key from a circuit fingerprint and a backend fingerprint.
+
+    Needs neither the circuit nor the backend object, so keys can be derived
+    from stored fingerprints (circuit bundle manifest, snapshot sidecar).
+    """
+    parts = {
+        "circuit": circuit_hash,
+        "backend": backend,
+        "optimization_level": optimization_level,
+        "seed_transpiler": seed_transpiler,
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+class TranspileCache:
+    """LRU-evicted on-disk cache of transpiled circuits stored as QPY."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = 512,
+        max_bytes: int = 256 * 1024 * 1024,
+        tracer: Optional[Tracer] = None,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding QPY artifacts and the index
+            max_entries: Maximum number of cached circuits
+            max_bytes: Maximum total size of the QPY artifacts
+            tracer: Records QPY (de)serialization as ``serialize``
+                (default: not traced)
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.tracer = tracer
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.RLock()
+        self._index = self._load_index()
+        self._removed: set = set()  # keys dropped since the last index write
+        self._dirty = False  # in-memory LRU updates not written yet
+
+    def key(
+        self,
+        circuit,
+        backend,
+        optimization_level: int = 3,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+    ) -> str:
+        """Build the cache key of a (circuit, backend, options) combination."""
+        return cache_key(
+            circuit_fingerprint(circuit),
+            backend_fingerprint(backend),
+            optimization_level,
+            seed_transpiler,
+        )
+
+    def peek(self, key: str) -> Optional[Dict[str, Any]]:
+        """Index entry of ``key`` (depth, size, ...) without loading the QPY."""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or not (self.cache_dir / f"{key}.qpy").exists():
+                return None
+            return dict(entry)
+
+    def get(self, key: str):
+        """Return the cached transpiled circuit for ``key`` or None on a miss."""
+        from qiskit import qpy
+
+        with self._lock:
+            entry = self._index.get(key)
+            path = self.cache_dir / f"{key}.qpy"
+            if entry is None or not path.exists():
+                if self._index.pop(key, None) is not None:
+                    self._removed.add(key)
+                self.misses += 1
+                return None
+
+            try:
+                with open(path, "rb") as f, span("serialize", self.tracer):
+                    circuit = qpy.load(f)[0]
+            except Exception as e:
+                logger.warning(f"⚠️ Corrupted transpile cache entry {key[:12]}: {e}")
+                self._remove(key)
+                self._save_index()
+                self.misses += 1
+                return None
+
+            entry["last_access"] = time.time()
+            entry["hits"] = entry.get("hits", 0) + 1
+            self.hits += 1
+            self._dirty = True
+            return circuit
+
+    def put(self, key: str, circuit, backend_name: str = "") -> None:
+        """Store a transpiled circuit and evict least recently used entries."""
+        from qiskit import qpy
+
+        with self._lock:
+            path = self.cache_dir / f"{key}.qpy"
+            tmp_path = path.with_suffix(f".qpy.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f, span("serialize", self.tracer):
+                qpy.dump(circuit, f)
+            os.replace(tmp_path, path)
+
+            now = time.time()
+            self._index[key] = {
+                "circuit": circuit.name,
+                "backend": backend_name,
+                "size_bytes": path.stat().st_size,
+                "depth": circuit.depth(),
+                "size": circuit.size(),
+                "created": now,
+                "last_access": now,
+                "hits": 0,
+            }
+            self._removed.discard(key)
+            self._save_index()
+
+    def transpile(
+        self,
+        circuit,
+        backend,
+        optimization_level: int = 3,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+    ):
+        """
+        Transpile through the cache.
+
+        Returns:
+            Tuple (transpiled circuit, cache hit flag)
+        """
+        key = self.key(circuit, backend, optimization_level, seed_transpiler)
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        transpiled, _ = transpile_circuit(
+            circuit, backend.target, optimization_level, seed_transpiler
+        )
+        self.put(key, transpiled, backend_name=backend.name)
+        return transpiled, False
+
+    def transpile_many(
+        self,
+        circuits: Sequence[Any],
+        backend,
+        optimization_level: int = 3,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+        max_workers: Optional[int] = None,
+        pool: Optional[TranspilePool] = None,
+    ) -> List[Tuple[Any, float, bool]]:
+        """
+        Transpile a suite through the cache, sending all misses to a process pool.
+
+        Misses go to ``pool`` when one is given (its workers are reused),
+        otherwise to a one-off pool of ``max_workers`` processes.
+
+        Returns:
+            List of (transpiled circuit, transpile time in seconds, cache hit
+            flag), in input order. Hits report the lookup time.
+        """
+        results: List[Optional[Tuple[Any, float, bool]]] = [None] * len(circuits)
+        misses: Dict[str, List[int]] = {}  # key -> positions of identical circuits
+
+        for i, circuit in enumerate(circuits):
+            start = time.perf_counter()
+            key = self.key(circuit, backend, optimization_level, seed_transpiler)
+            if key in misses:
+                misses[key].append(i)
+                continue
+            cached = self.get(key)
+            if cached is not None:
+                results[i] = (cached, time.perf_counter() - start, True)
+            else:
+                misses[key] = [i]
+
+        unique = [circuits[positions[0]] for positions in misses.values()]
+        if pool is not None:
+            transpiled = pool.map(
+                unique, backend.target, optimization_level, seed_transpiler
+            )
+        else:
+            transpiled = transpile_parallel(
+                unique,
+                backend.target,
+                optimization_level=optimization_level,
+                seed_transpiler=seed_transpiler,
+                max_workers=max_workers,
+            )
+        for (key, positions), (circuit, seconds) in zip(misses.items(), transpiled):
+            self.put(key, circuit, backend_name=backend.name)
+            for i in positions:
+                results[i] = (circuit, seconds, False)
+
+        return results  # type: ignore[return-value]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this session plus current cache occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._index),
+                "size_bytes": sum(e["size_bytes"] for e in self._index.values()),
+            }
+
+    def flush(self) -> None:
+        """Write LRU updates from cache hits to the shared index."""
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def clear(self) -> None:
+        """Remove every cached artifact."""
+        with self._lock:
+            with self._index_lock():
+                self._merge_index()
+                for key in list(self._index):
+                    self._remove(key)
+                self._write_index()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until both limits are respected."""
+        by_age = sorted(self._index, key=lambda k: self._index[k]["last_access"])
+        total_bytes = sum(e["size_bytes"] for e in self._index.values())
+
+        while by_age and (
+            len(self._index) > self.max_entries or total_bytes > self.max_bytes
+        ):
+            key = by_age.pop(0)
+            total_bytes -= self._index[key]["size_bytes"]
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._index.pop(key, None)
+        self._removed.add(key)
+        (self.cache_dir / f"{key}.qpy").unlink(missing_ok=True)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        index_path = self.cache_dir / INDEX_FILE
+        if not index_path.exists():
+            return {}
+        try:
+            with open(index_path) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ Transpile cache index unreadable, starting empty: {e}")
+            return {}
+
+    def _index_lock(self):
+        """Exclusive lock on the shared index, held for read-merge-write."""
+        lock = open(self.cache_dir / LOCK_FILE, "a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        return lock  # closing the file releases the lock
+
+    def _merge_index(self) -> None:
+        """
+        Fold the on-disk index into memory: entries put by other processes
+        are added, entries this process removed stay removed, and the most
+        recent access wins.
+        """
+        for key, entry in self._load_index().items():
+            if key in self._removed:
+                continue
+            mine = self._index.get(key)
+            if mine is None:
+                if (self.cache_dir / f"{key}.qpy").exists():
+                    self._index[key] = entry
+            elif entry.get("last_access", 0) > mine["last_access"]:
+                mine["last_access"] = entry["last_access"]
+                mine["hits"] = max(mine.get("hits", 0), entry.get("hits", 0))
+
+    def _write_index(self) -> None:
+        index_path = self.cache_dir / INDEX_FILE
+        tmp_path = index_path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, index_path)
+        self._removed.clear()
+        self._dirty = False
+
+    def _save_index(self) -> None:
+        """Merge with the shared index, evict, then replace it atomically."""
+        with self._index_lock():
+            self._merge_index()
+            self._evict()
+            self._write_index()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+OmniMind - Parallel Transpilation Stage (Public Version)
+========================================================
+
+Transpiles a whole paradox suite concurrently in a process pool.
+
+Workers receive the backend Target (the backend object itself holds a live
+service connection and is not picklable) once, through the pool initializer,
+and then only circuits per task. They call the same ``transpile_circuit``
+used for serial transpilation with the same fixed ``seed_transpiler``
+(``DEFAULT_SEED_TRANSPILER`` unless one is given), so parallel and serial
+output, and the transpile cache keys, are identical from run to run.
+
+Spawning a worker re-imports qiskit, so a runner keeps one ``TranspilePool``
+for its whole life: its workers are started on the first parallel suite and
+reused by every later one, until ``close()``.
+
+Author: OmniMind
+Signature: 21c1749bcffd2904
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("ParadoxRunner")
+
+# Transpiler seed used unless one is given; None gives stochastic layouts
+DEFAULT_SEED_TRANSPILER = 42
+
+# Per-worker transpile options, set once by the pool initializer
+_worker_options: Tuple[Any, int, Optional[int]] = (None, 3, None)
+
+
+def transpile_circuit(
+    circuit,
+    target,
+    optimization_level: int = 3,
+    seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+) -> Tuple[Any, float]:
+    """
+    Transpile one circuit against a backend Target.
+
+    Returns:
+        Tuple (transpiled circuit, transpile time in seconds)
+    """
+    from qiskit import transpile
+
+    start = time.perf_counter()
+    transpiled = transpile(
+        circuit,
+        target=target,
+        optimization_level=optimization_level,
+        seed_transpiler=seed_transpiler,
+    )
+    return transpiled, time.perf_counter() - start
+
+
+def _init_worker(target, optimization_level: int, seed_transpiler: Optional[int]):
+    """Pool initializer: receive the Target and options once per worker."""
+    global _worker_options
+    _worker_options = (target, optimization_level, seed_transpiler)
+
+
+def _transpile_task(circuit) -> Tuple[Any, float]:
+    """Process-pool entry point (must be a module-level function)."""
+    return transpile_circuit(circuit, *_worker_options)
+
+
+class TranspilePool:
+    """
+    Long-lived spawn process pool for suite transpilation.
+
+    Workers receive the Target and options once, through the pool
+    initializer, so one executor is kept per (Target, optimization level,
+    seed); the least recently used one is shut down beyond ``max_targets``.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_targets: int = 4):
+        """
+        Initialize pool (no process is started until it is needed).
+
+        Args:
+            max_workers: Worker processes (default: CPU count). With one
+                worker, transpilation runs inline without a pool.
+            max_targets: Executors kept alive for different Targets/options
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_targets = max_targets
+        self._executors: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _executor(self, options: Tuple[Any, int, Optional[int]]):
+        """The executor initialized with ``options``, started on first use."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        target, optimization_level, seed_transpiler = options
+        # The Target is held next to its executor, so its id is never reused
+        key = (id(target), optimization_level, seed_transpiler)
+        with self._lock:
+            if key in self._executors:
+                self._executors.move_to_end(key)
+                return self._executors[key][1]
+
+            logger.info(f"🔧 Starting {self.max_workers} transpile workers...")
+            # Spawned workers: a forked child inherits qiskit's native thread
+            # pool state without its threads and can deadlock in transpile()
+            executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=options,
+            )
+            self._executors[key] = (target, executor)
+            while len(self._executors) > self.max_targets:
+                _, (_, evicted) = self._executors.popitem(last=False)
+                evicted.shutdown(wait=False)  # queued tasks still complete
+            return executor
+
+    def map(
+        self,
+        circuits: Sequence[Any],
+        target,
+        optimization_level: int = 3,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+    ) -> List[Tuple[Any, float]]:
+        """
+        Transpile circuits concurrently, preserving input order.
+
+        Returns:
+            List of (transpiled circuit, transpile time in seconds)
+        """
+        options = (target, optimization_level, seed_transpiler)
+        if self.max_workers <= 1 or len(circuits) <= 1:
+            return [transpile_circuit(qc, *options) for qc in circuits]
+
+        logger.info(
+            f"🔧 Transpiling {len(circuits)} circuits "
+            f"on {self.max_workers} workers..."
+        )
+        return list(self._executor(options).map(_transpile_task, circuits))
+
+    def close(self) -> None:
+        """Shut every worker process down."""
+        with self._lock:
+            executors = [executor for _, executor in self._executors.values()]
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown()
+
+    def __enter__(self) -> "TranspilePool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def transpile_parallel(
+    circuits: Sequence[Any],
+    target,
+    optimization_level: int = 3,
+    seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+    max_workers: Optional[int] = None,
+) -> List[Tuple[Any, float]]:
+    """
+    Transpile circuits concurrently in a one-off pool, preserving input order.
+
+    Use a TranspilePool instead to reuse the workers across suites.
+
+    Args:
+        circuits: Circuits to transpile
+        target: Backend Target shared by all circuits
+        optimization_level: Transpiler optimization level
+        seed_transpiler: Seed applied to every circuit (deterministic output)
+        max_workers: Pool size (default: CPU count). With one worker, or a
+            single circuit, transpilation runs inline without a pool.
+
+    Returns:
+        List of (transpiled circuit, transpile time in seconds)
+    """
+    if not circuits:
+        return []
+
+    workers = min(max_workers or os.cpu_count() or 1, len(circuits))
+    with TranspilePool(workers) as pool:
+        return pool.map(circuits, target, optimization_level, seed_transpiler)
@@ -19,56 +19,195 @@ Signature: 21c1749bcffd2904
 
 import json
 import os
+import sys
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Callable
-from dotenv import load_dotenv
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+
+# Sibling modules are imported flat, both when run as a script and when
+# imported as scripts.quantum_paradox_runner from the repository root
+_SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
+
+from paradox_adaptive_shots import AdaptiveShotPolicy, interpretation_bucket  # noqa: E402
+from paradox_backend_snapshot import BackendSnapshotCache, SnapshotBackend  # noqa: E402
+from paradox_counts import CountsLike, SparseCounts, as_sparse_counts  # noqa: E402
+from paradox_job_journal import JobJournal, job_key  # noqa: E402
+from paradox_noise_emulator import NoiseEmulator  # noqa: E402
+from paradox_readout_mitigation import ReadoutMitigator, measured_qubits  # noqa: E402
+from paradox_result_store import ResultStore  # noqa: E402
+from paradox_tracing import Tracer, span, stopwatch  # noqa: E402
+from paradox_transpile_cache import TranspileCache, circuit_fingerprint  # noqa: E402
+from paradox_transpile_pool import DEFAULT_SEED_TRANSPILER, TranspilePool  # noqa: E402
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
 logger = logging.getLogger("ParadoxRunner")
 
-load_dotenv()
+LOG_FORMAT = "%(asctime)s - %(message)s"
+
+# Ideal-distance comparison (opt-in): largest ideal support enumerated, and
+# number of ideal distributions kept per runner (keyed by circuit fingerprint)
+IDEAL_MAX_OUTCOMES = 1 << 12
+IDEAL_CACHE_SIZE = 64
+_env_loaded = False
+
+
+def load_environment() -> None:
+    """Load ``.env`` once (on first use, not at import time)."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _env_loaded = True
 
 
 class ParadoxExperimentRunner:
     """Runner for quantum paradox experiments on IBM Quantum hardware."""
 
-    def __init__(self, ibm_token: str = None):
-        """Initialize runner with IBM connection."""
-        self.token = ibm_token or os.getenv("IBM_CLOUD_API_KEY")
-        if not self.token:
-            raise ValueError(
-                "IBM_CLOUD_API_KEY not found. Set it in .env or environment."
-            )
+    def __init__(
+        self,
+        ibm_token: str = None,
+        backend=None,
+        transpile_cache: Optional[TranspileCache] = None,
+        seed_transpiler: Optional[int] = DEFAULT_SEED_TRANSPILER,
+        transpile_workers: Optional[int] = None,
+        result_store: Optional[ResultStore] = None,
+        write_paradox_files: bool = True,
+        snapshot_cache: Optional[BackendSnapshotCache] = None,
+        readout_mitigator: Optional[ReadoutMitigator] = None,
+        tracer: Optional[Tracer] = None,
+        journal: Optional[JobJournal] = None,
+        emulator: Optional[NoiseEmulator] = None,
+        compare_ideal: bool = False,
+    ):
+        """
+        Initialize runner with IBM connection.
 
+        Args:
+            ibm_token: IBM Cloud API key (default: IBM_CLOUD_API_KEY)
+            backend: Pre-selected backend, e.g. AerSimulator or a fake backend
+                for local runs. No IBM token is required when one is given,
+                nor for ideal (run_ideal) runs.
+            transpile_cache: On-disk transpile cache
+                (default: shared cache under results/transpile_cache)
+            seed_transpiler: Transpiler seed, part of the cache key (default:
+                fixed, so runs reuse cached layouts; None = stochastic)
+            transpile_workers: Process-pool size for suite transpilation
+                (default: CPU count). The workers are started once and kept
+                until close()
+            result_store: Append-only result stream
+                (default: JSONL segments under <output_dir>/stream)
+            write_paradox_files: Also write per-paradox result_sanitized.json /
+                error.json files (disable for large sweeps)
+            snapshot_cache: Backend target snapshots used by connect_ibm
+                (default: results/backend_snapshots, 6h TTL)
+            readout_mitigator: Also store readout-mitigated distributions,
+                using its cached per-qubit calibration (default: raw only)
+            tracer: Per-stage timing histograms of this runner, also passed
+                to the default transpile cache and result store (default:
+                tracing disabled)
+            journal: Private write-ahead job journal; submitted jobs are
+                re-attached after a crash and resume() finishes interrupted
+                runs (default: no journal)
+            emulator: Run every job on this noise-aware local emulator
+                instead of hardware; circuits are transpiled for its backend
+                snapshot and results are flagged ``emulated`` (default: none)
+            compare_ideal: Store TVD/Hellinger/KL distances of every result
+                to the exact ideal distribution, for Clifford circuits whose
+                ideal support has at most IDEAL_MAX_OUTCOMES outcomes
+                (default: off)
+        """
+        if ibm_token is None:
+            load_environment()
+        self.token = ibm_token or os.getenv("IBM_CLOUD_API_KEY")
         self.service = None
-        self.backend = None
-        self.results = []
+        self.emulator = emulator
+        self.backend = backend or (emulator.backend if emulator else None)
+        self.snapshot_cache = snapshot_cache or BackendSnapshotCache()
+        self._live_backend = None
+        self._service_lock = threading.Lock()
+        # Refreshed (backend, snapshot) waiting for the next paradox
+        self._pending_refresh: Optional[Tuple[Any, SnapshotBackend]] = None
+        self._refresh_lock = threading.Lock()
+        self.tracer = tracer or Tracer(enabled=False)
+        self.transpile_cache = transpile_cache or TranspileCache(tracer=self.tracer)
+        self.optimization_level = 3
+        self.seed_transpiler = seed_transpiler
+        self.transpile_workers = transpile_workers
+        self.transpile_pool = TranspilePool(transpile_workers)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Created on the first write: dry runs leave no run directory behind
         self.output_dir = Path(f"results/run_{self.timestamp}")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._metadata: Dict[str, Any] = {}
+        self._metadata_pending = False
+        self.result_store = result_store or ResultStore(
+            self.output_dir / "stream", tracer=self.tracer
+        )
+        self.write_paradox_files = write_paradox_files
+        self.readout_mitigator = readout_mitigator
+        # Backend name -> qubit -> confusion entry, measured before each suite
+        self._readout_calibration: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._readout_lock = threading.Lock()
+        self.journal = journal
+        self.compare_ideal = compare_ideal
+        self._ideal_cache: "OrderedDict[str, Optional[Dict[str, float]]]" = (
+            OrderedDict()
+        )
+        # Results are recorded from asyncio.to_thread workers concurrently
+        self._ideal_lock = threading.Lock()
 
         logger.info(f"✅ Runner initialized: {self.output_dir}")
 
-    def connect_ibm(self):
-        """Connect to IBM Quantum Cloud."""
-        from qiskit_ibm_runtime import QiskitRuntimeService
+    def connect_ibm(self, offline: bool = False):
+        """
+        Connect to IBM Quantum Cloud.
 
-        logger.info("🔌 Connecting to IBM Quantum Cloud...")
+        A cached backend snapshot is used when available, so startup needs
+        no network: the snapshot stands in for the backend during
+        transpilation, and the live backend is only resolved when the first
+        job is submitted. A stale snapshot is refreshed in the background:
+        the fresh calibration replaces the snapshot before the next paradox,
+        and ``least_busy`` is evaluated again; if another backend is less
+        busy now, it is snapshotted and used from the next start on.
 
-        try:
-            self.service = QiskitRuntimeService(channel="ibm_cloud", token=self.token)
-            logger.info("✅ Connected to IBM Quantum")
-        except Exception as e:
-            logger.error(f"❌ Connection error: {e}")
-            raise
+        Args:
+            offline: Never touch the network (requires a cached snapshot);
+                circuits can be transpiled but not executed
+        """
+        snapshot = self.snapshot_cache.load()
+
+        if snapshot is not None and (
+            offline or not self.snapshot_cache.is_stale(snapshot)
+        ):
+            self._use_snapshot(snapshot)
+            return
+
+        if offline:
+            raise RuntimeError(
+                "No backend snapshot cached. Run connect_ibm() online once."
+            )
+
+        if snapshot is not None:
+            # Stale: start from it now, refresh the same backend meanwhile
+            self._use_snapshot(snapshot)
+            self.snapshot_cache.refresh_async(
+                lambda: self._connect_service().backend(snapshot.name),
+                on_refresh=self._on_snapshot_refresh,
+            )
+            return
 
         # Select least busy backend
-        self.backend = self.service.least_busy(operational=True, simulator=False)
+        service = self._connect_service()
+        self.backend = service.least_busy(operational=True, simulator=False)
+        self._live_backend = self.backend
         logger.info(
             f"✅ Backend selected: {self.backend.name} ({self.backend.num_qubits} qubits)"
         )
+        self.snapshot_cache.save(self.backend)
 
         # Save connection metadata
         metadata = {
@@ -81,11 +220,116 @@ class ParadoxExperimentRunner:
             "runner_version": "1.0.0-public",
         }
 
-        with open(self.output_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        self._update_metadata(**metadata)
+
+    def _connect_service(self):
+        """Create the runtime service on first use (thread-safe)."""
+        from qiskit_ibm_runtime import QiskitRuntimeService
+
+        with self._service_lock:
+            if self.service is not None:
+                return self.service
+
+            if not self.token:
+                raise ValueError(
+                    "IBM_CLOUD_API_KEY not found. Set it in .env or environment."
+                )
+
+            logger.info("🔌 Connecting to IBM Quantum Cloud...")
+
+            try:
+                self.service = QiskitRuntimeService(
+                    channel="ibm_cloud", token=self.token
+                )
+                logger.info("✅ Connected to IBM Quantum")
+            except Exception as e:
+                logger.error(f"❌ Connection error: {e}")
+                raise
+            return self.service
+
+    def _use_snapshot(self, snapshot: SnapshotBackend) -> None:
+        """Select a cached backend snapshot as the transpilation target."""
+        self.backend = snapshot
+        logger.info(
+            f"📦 Backend snapshot: {snapshot.name} ({snapshot.num_qubits} qubits, "
+            f"{snapshot.age / 60:.0f} min old)"
+        )
+        self._update_metadata(
+            timestamp=datetime.now().isoformat(),
+            backend={
+                "name": snapshot.name,
+                "qubits": snapshot.num_qubits,
+                "status": snapshot.status_msg,
+                "snapshot_saved_at": datetime.fromtimestamp(
+                    snapshot.saved_at
+                ).isoformat(),
+            },
+            runner_version="1.0.0-public",
+        )
+
+    def _on_snapshot_refresh(self, backend, snapshot: SnapshotBackend) -> None:
+        """
+        Queue a refreshed snapshot (refresh thread).
+
+        The runner thread swaps it in before its next paradox (see
+        _apply_snapshot_refresh), so a paradox is transpiled, submitted and
+        recorded against one calibration. The backend selection itself is
+        only revisited for the next start, so a run never changes device
+        halfway.
+        """
+        with self._refresh_lock:
+            self._pending_refresh = (backend, snapshot)
+
+        try:
+            least_busy = self._connect_service().least_busy(
+                operational=True, simulator=False
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ least_busy re-evaluation failed: {e}")
+            return
+        if least_busy.name != snapshot.name:
+            self.snapshot_cache.save(least_busy)
+            logger.info(
+                f"📦 {least_busy.name} is now the least busy backend; "
+                "it is used from the next connect_ibm() on"
+            )
+
+    def _apply_snapshot_refresh(self) -> None:
+        """
+        Swap a queued snapshot refresh in (runner thread, between paradoxes).
+
+        Later transpilations use the new calibration (its cache entries are
+        keyed by it).
+        """
+        with self._refresh_lock:
+            pending, self._pending_refresh = self._pending_refresh, None
+        if pending is None:
+            return
+        backend, snapshot = pending
+        self._live_backend = backend
+        if isinstance(self.backend, SnapshotBackend) and (
+            self.backend.name == snapshot.name
+        ):
+            self.backend = snapshot
+            logger.info(f"🔄 Backend snapshot refreshed: {snapshot.name}")
+
+    def _execution_backend(self):
+        """The backend jobs are submitted to (resolves a snapshot's live backend)."""
+        if self.emulator is not None:
+            return self.emulator
+        if not isinstance(self.backend, SnapshotBackend):
+            return self.backend
+        if self._live_backend is None:
+            self._live_backend = self._connect_service().backend(self.backend.name)
+        return self._live_backend
 
     def run_paradox(
-        self, paradox_name: str, circuit_builder: Callable, description: str = ""
+        self,
+        paradox_name: str,
+        circuit_builder: Callable,
+        description: str = "",
+        shots: int = 1024,
+        adaptive: Optional[AdaptiveShotPolicy] = None,
     ) -> Dict[str, Any]:
         """
         Execute a paradox experiment.
@@ -94,133 +338,1221 @@ class ParadoxExperimentRunner:
             paradox_name: Name of the paradox
             circuit_builder: Function that returns QuantumCircuit
             description: Description of the paradox
+            shots: Shots of the single job (ignored when ``adaptive`` is set)
+            adaptive: Sample in rounds until the interpretation is
+                statistically settled or the policy's budget is spent; the
+                shots used and confidence intervals go into ``metrics``
 
         Returns:
             Experiment result
         """
-        from qiskit import transpile
-        from qiskit_ibm_runtime import SamplerV2
-
+        self._apply_snapshot_refresh()
         logger.info("=" * 60)
         logger.info(f"🔬 Executing: {paradox_name}")
         logger.info(f"   {description}")
         logger.info("=" * 60)
 
         # Create paradox directory
-        paradox_dir = self.output_dir / paradox_name.lower().replace(" ", "_")
-        paradox_dir.mkdir(exist_ok=True)
+        paradox_dir = self._paradox_dir(paradox_name)
 
         try:
             # 1. Build circuit
             logger.info("🌀 Building quantum circuit...")
-            qc = circuit_builder()
+            with span("build", self.tracer) as built:
+                qc = circuit_builder()
+            planned = self._journal_plan(
+                paradox_name, qc, shots, "paradox", adaptive=adaptive is not None
+            )
 
             # 2. Transpile
             logger.info(f"🔧 Transpiling for {self.backend.name}...")
-            start_transpile = datetime.now()
-            transpiled = transpile(qc, backend=self.backend, optimization_level=3)
-            transpile_time = (datetime.now() - start_transpile).total_seconds()
-            logger.info(f"   Transpilation: {transpile_time:.2f}s")
+            transpiled, transpile_time, cache_hit = self._transpile(qc)
+            logger.info(
+                f"   Transpilation: {transpile_time:.2f}s"
+                + (" (cache hit)" if cache_hit else "")
+            )
+
+            self._calibrate_readout([transpiled])
 
             # 3. Execute
             logger.info("🚀 Executing on quantum hardware...")
-            start_exec = datetime.now()
-
-            sampler = SamplerV2(mode=self.backend)
-            job = sampler.run([transpiled], shots=1024)
+            stage_seconds = {"build": built.seconds, "transpile": transpile_time}
+            exec_time = 0.0
+            jobs = []
 
-            logger.info(f"   Job ID: {job.job_id()}")
-            logger.info("   Waiting for result...")
+            def sample(round_shots: int) -> Dict[str, int]:
+                nonlocal exec_time
+                result, round_time, stages, job = self._submit_and_wait(
+                    [transpiled], round_shots, circuits=[qc]
+                )
+                jobs.append(job)
+                exec_time += round_time
+                for stage, seconds in stages.items():
+                    stage_seconds[stage] = stage_seconds.get(stage, 0.0) + seconds
 
-            result = job.result()
-            exec_time = (datetime.now() - start_exec).total_seconds()
+                # 4. Extract counts (validated code from fast_ibm_benchmark.py)
+                return self._extract_counts(result[0])
 
-            # 4. Extract counts (validated code from fast_ibm_benchmark.py)
-            data_bin = result[0].data
-            if hasattr(data_bin, "c"):
-                counts_obj = data_bin.c
-                counts = counts_obj.get_counts()
+            adaptive_metrics = None
+            shots_used = shots
+            if adaptive is None:
+                counts = sample(shots)
             else:
-                counts = getattr(data_bin, "get_counts", lambda: {})()
+                counts, adaptive_metrics = adaptive.run(sample)
+                shots_used = adaptive_metrics["shots_used"]
 
             logger.info(f"✅ Result received ({exec_time:.2f}s)")
 
-            # 5. Analyze result
-            total = sum(counts.values()) or 1
-            distribution = {state: count / total for state, count in counts.items()}
+            metrics = {
+                "transpile_time_seconds": transpile_time,
+                "transpile_cache_hit": cache_hit,
+                "execution_time_seconds": exec_time,
+                "shots": shots_used,
+                "stage_seconds": stage_seconds,
+            }
+            if adaptive_metrics is not None:
+                metrics["adaptive"] = adaptive_metrics
+
+            result_data = self._record_result(
+                paradox_name,
+                description,
+                paradox_dir,
+                counts,
+                metrics=metrics,
+                circuit=qc,
+                transpiled=transpiled,
+            )
+            self._journal_recorded(paradox_name, planned, shots, paradox_dir)
+            self._journal_completed(jobs)
+            return result_data
+
+        except Exception as e:
+            logger.error(f"❌ Error in {paradox_name}: {e}")
+            import traceback
+
+            traceback.print_exc()
+
+            return self._record_error(paradox_name, paradox_dir, e)
+
+        finally:
+            self._record_cache_stats()
+
+    def run_batch(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        max_pubs_per_job: Optional[int] = None,
+        collect: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute several paradox experiments as PUBs of shared Sampler jobs.
+
+        Every selected circuit is built up front and the whole suite is
+        transpiled concurrently in a process pool. Circuits are then submitted
+        as one PUB inside a single SamplerV2 job (or inside chunks of at most
+        ``max_pubs_per_job`` PUBs). The suite therefore waits in the queue once
+        per chunk instead of once per paradox. Results are split back into the
+        usual per-paradox ``result_sanitized.json`` files.
+
+        Args:
+            paradox_names: Keys of ``builders`` to run (default: all of them)
+            builders: Mapping name -> (circuit_builder, description)
+                (default: ``PARADOX_BUILDERS``)
+            shots: Shots per PUB
+            max_pubs_per_job: Maximum PUBs per submitted job (None = one job)
+            collect: Keep the results to return them. With False they are
+                only streamed to the result store (read them back lazily
+                with ``runner.results``), so memory does not grow with the
+                suite
+
+        Returns:
+            List of experiment results, in the order of ``paradox_names``
+            (None when ``collect`` is False)
+        """
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+        if max_pubs_per_job is not None and max_pubs_per_job < 1:
+            raise ValueError("max_pubs_per_job must be a positive integer")
+        self._apply_snapshot_refresh()
+
+        logger.info("=" * 60)
+        logger.info(f"📦 Batch execution: {len(paradox_names)} paradoxes")
+        logger.info("=" * 60)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        # Results are always in the result store; keep them only if asked
+        keep = results.__setitem__ if collect else lambda name, result: None
+
+        # 1. Build every circuit before touching the queue
+        pending: List[Dict[str, Any]] = []
+        for paradox_name in paradox_names:
+            paradox_dir = self._paradox_dir(paradox_name)
+            try:
+                circuit_builder, description = builders[paradox_name]
+                qc = self._build(circuit_builder)
+                pending.append(
+                    {
+                        "paradox_name": paradox_name,
+                        "description": description,
+                        "paradox_dir": paradox_dir,
+                        "circuit": qc,
+                        "planned": self._journal_plan(
+                            paradox_name,
+                            qc,
+                            shots,
+                            "batch",
+                            max_pubs_per_job=max_pubs_per_job,
+                        ),
+                    }
+                )
+            except Exception as e:
+                logger.error(f"❌ Error building {paradox_name}: {e}")
+                keep(paradox_name, self._record_error(paradox_name, paradox_dir, e))
+
+        # 2. Transpile the whole suite at once
+        try:
+            transpiled_suite = self._transpile_many([p["circuit"] for p in pending])
+        except Exception as e:
+            logger.error(f"❌ Suite transpilation failed: {e}")
+            for item in pending:
+                keep(
+                    item["paradox_name"],
+                    self._record_error(item["paradox_name"], item["paradox_dir"], e),
+                )
+            pending = []
+            transpiled_suite = []
+
+        for item, (transpiled, transpile_time, cache_hit) in zip(
+            pending, transpiled_suite
+        ):
+            item.update(
+                transpiled=transpiled,
+                transpile_time=transpile_time,
+                cache_hit=cache_hit,
+            )
+            logger.info(
+                f"🔧 {item['paradox_name']} transpiled in {transpile_time:.2f}s"
+                + (" (cache hit)" if cache_hit else "")
+            )
+
+        # One readout calibration job for the whole suite
+        self._calibrate_readout([item["transpiled"] for item in pending])
+
+        # 3. Submit the PUBs in (possibly size-capped) chunks
+        chunk_size = max_pubs_per_job or len(pending) or 1
+        chunks = [
+            pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)
+        ]
+
+        for chunk_index, chunk in enumerate(chunks, 1):
+            logger.info(
+                f"🚀 Submitting job {chunk_index}/{len(chunks)} ({len(chunk)} PUBs)..."
+            )
+            try:
+                result, exec_time, _, job = self._submit_and_wait(
+                    [item["transpiled"] for item in chunk],
+                    shots,
+                    circuits=[item["circuit"] for item in chunk],
+                )
+                logger.info(f"✅ Result received ({exec_time:.2f}s)")
+            except Exception as e:
+                logger.error(f"❌ Batch job {chunk_index} failed: {e}")
+                for item in chunk:
+                    keep(
+                        item["paradox_name"],
+                        self._record_error(
+                            item["paradox_name"], item["paradox_dir"], e
+                        ),
+                    )
+                continue
+
+            # 4. Split the job result back into per-paradox records
+            for pub_index, item in enumerate(chunk):
+                paradox_name = item["paradox_name"]
+                try:
+                    counts = self._extract_counts(result[pub_index])
+                    result_data = self._record_result(
+                        paradox_name,
+                        item["description"],
+                        item["paradox_dir"],
+                        counts,
+                        metrics={
+                            "transpile_time_seconds": item["transpile_time"],
+                            "transpile_cache_hit": item["cache_hit"],
+                            "execution_time_seconds": exec_time,
+                            "shots": shots,
+                            "batch_pubs": len(chunk),
+                        },
+                        circuit=item["circuit"],
+                        transpiled=item["transpiled"],
+                    )
+                    self._journal_recorded(
+                        paradox_name, item["planned"], shots, item["paradox_dir"]
+                    )
+                    keep(paradox_name, result_data)
+                except Exception as e:
+                    logger.error(f"❌ Error in {paradox_name}: {e}")
+                    keep(
+                        paradox_name,
+                        self._record_error(paradox_name, item["paradox_dir"], e),
+                    )
+            self._journal_completed([job])
+
+        self._record_cache_stats()
+
+        if not collect:
+            return None
+        return [results[name] for name in paradox_names]
+
+    def run_multiplexed(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        repetitions: int = 1,
+        guard: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute paradoxes side by side on disjoint regions of one device.
+
+        Every selected circuit (``repetitions`` copies of each) is placed on
+        its own well-calibrated, guard-separated qubit region; the combined
+        circuits ("frames") are submitted as PUBs of one Sampler job and the
+        counts are demultiplexed per paradox. Counts of repetitions are
+        summed, so each paradox gets ``shots * repetitions`` shots for the
+        price of one execution. See CircuitMultiplexer.
+
+        Args:
+            paradox_names: Keys of ``builders`` to run (default: all of them)
+            builders: Mapping name -> (circuit_builder, description)
+                (default: ``PARADOX_BUILDERS``)
+            shots: Shots per frame
+            repetitions: Copies of every circuit to pack
+            guard: Coupling-map hops kept free between regions
+
+        Returns:
+            List of experiment results, in the order of ``paradox_names``
+        """
+        from collections import Counter
+
+        from paradox_multiplexer import CircuitMultiplexer
+
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+        self._apply_snapshot_refresh()
+
+        results: Dict[str, Dict[str, Any]] = {}
+        planned: Dict[str, Optional[str]] = {}
+        circuits, owners = [], []
+        for paradox_name in paradox_names:
+            try:
+                qc = self._build(builders[paradox_name][0])
+            except Exception as e:
+                logger.error(f"❌ Error building {paradox_name}: {e}")
+                results[paradox_name] = self._record_error(
+                    paradox_name, self._paradox_dir(paradox_name), e
+                )
+                continue
+            planned[paradox_name] = self._journal_plan(
+                paradox_name,
+                qc,
+                shots,
+                "multiplexed",
+                repetitions=repetitions,
+                guard=guard,
+            )
+            circuits.extend([qc] * repetitions)
+            owners.extend([paradox_name] * repetitions)
+
+        if circuits:
+            try:
+                with span("transpile", self.tracer) as packed:
+                    multiplexer = CircuitMultiplexer(
+                        self.backend,
+                        guard=guard,
+                        optimization_level=self.optimization_level,
+                        seed_transpiler=self.seed_transpiler,
+                    )
+                    frames = multiplexer.pack(circuits)
+                pack_time = packed.seconds
+
+                logger.info(f"🚀 Submitting {len(frames)} multiplexed frame(s)...")
+                result, exec_time, _, job = self._submit_and_wait(
+                    [frame.circuit for frame in frames], shots
+                )
+                logger.info(f"✅ Result received ({exec_time:.2f}s)")
+            except Exception as e:
+                logger.error(f"❌ Multiplexed job failed: {e}")
+                for paradox_name in dict.fromkeys(owners):
+                    results[paradox_name] = self._record_error(
+                        paradox_name, self._paradox_dir(paradox_name), e
+                    )
+                return [results[name] for name in paradox_names]
+
+            merged: Dict[str, Counter] = {name: Counter() for name in owners}
+            regions: Dict[str, List[List[int]]] = {name: [] for name in owners}
+            for frame_index, frame in enumerate(frames):
+                counts = self._extract_counts(result[frame_index])
+                for index, sub_counts in multiplexer.demultiplex(frame, counts).items():
+                    merged[owners[index]].update(sub_counts)
+                for slot in frame.slots:
+                    regions[owners[slot.index]].append(list(slot.region))
+
+            for paradox_name, counts in merged.items():
+                results[paradox_name] = self._record_result(
+                    paradox_name,
+                    builders[paradox_name][1],
+                    self._paradox_dir(paradox_name),
+                    dict(counts),
+                    metrics={
+                        "transpile_time_seconds": pack_time,
+                        "execution_time_seconds": exec_time,
+                        "shots": shots * repetitions,
+                        "multiplexed": {
+                            "frames": len(frames),
+                            "repetitions": repetitions,
+                            "guard": guard,
+                            "regions": regions[paradox_name],
+                        },
+                    },
+                    circuit=circuits[owners.index(paradox_name)],
+                )
+                self._journal_recorded(
+                    paradox_name,
+                    planned[paradox_name],
+                    shots,
+                    self._paradox_dir(paradox_name),
+                )
+            self._journal_completed([job])
+
+        return [results[name] for name in paradox_names]
+
+    def resume(
+        self,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        run: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Finish an interrupted run recorded in the job journal.
+
+        Paradoxes whose result was recorded are skipped. The others are run
+        again with the method, shots and options they were planned with;
+        jobs the interrupted process had already submitted are re-attached,
+        so only what is missing is submitted. Results are written to this
+        runner's output directory. Adaptive runs resume with fixed shots;
+        paradoxes planned on another backend run on this runner's backend
+        (fan-outs on the backends they were planned with).
+
+        Args:
+            builders: Mapping name -> (circuit_builder, description) used to
+                rebuild the circuits (default: ``PARADOX_BUILDERS``)
+            run: Run timestamp to resume (default: latest unfinished run)
+
+        Returns:
+            List of results of the resumed paradoxes
+        """
+        if self.journal is None:
+            raise RuntimeError("resume() requires a job journal")
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+
+        unfinished = self.journal.unfinished(run)
+        if not unfinished:
+            logger.info("✅ Nothing to resume")
+            return []
+        logger.info(
+            f"♻️ Resuming run {unfinished[0]['run']}: "
+            f"{len(unfinished)} paradox(es) without a recorded result"
+        )
+
+        # Carry the remaining work over, so this run can itself be resumed.
+        # It is planned where it runs now: fan-outs on their own backends,
+        # everything else on this runner's backend.
+        for entry in unfinished:
+            if entry["run"] != self.timestamp:
+                self.journal.plan(
+                    self.timestamp,
+                    entry["paradox"],
+                    entry["circuit"],
+                    (
+                        entry["backend"]
+                        if entry["method"] == "fanout"
+                        else self.backend.name
+                    ),
+                    entry["shots"],
+                    entry["method"],
+                    entry["options"],
+                )
+
+        groups: Dict[Tuple[str, int, str], List[str]] = {}
+        for entry in unfinished:
+            if entry["paradox"] not in builders:
+                logger.warning(f"⚠️ No builder for {entry['paradox']}; not resumed")
+                continue
+            if entry["method"] != "fanout" and entry["backend"] != self.backend.name:
+                logger.warning(
+                    f"⚠️ {entry['paradox']} was planned on {entry['backend']}, "
+                    f"resuming on {self.backend.name}"
+                )
+            options = {k: v for k, v in entry["options"].items() if k != "adaptive"}
+            group = (
+                entry["method"],
+                entry["shots"],
+                json.dumps(options, sort_keys=True),
+            )
+            groups.setdefault(group, [])
+            if entry["paradox"] not in groups[group]:
+                groups[group].append(entry["paradox"])
+
+        results = []
+        for (method, shots, options), names in groups.items():
+            options = json.loads(options)
+            if method == "batch":
+                results.extend(self.run_batch(names, builders, shots, **options))
+            elif method == "multiplexed":
+                results.extend(self.run_multiplexed(names, builders, shots, **options))
+            elif method == "async":
+                results.extend(self.run_async(names, builders, shots, **options))
+            elif method == "fanout":
+                backends = options.pop("backends")
+                results.extend(
+                    self.run_fanout(backends, names, builders, shots, **options)
+                )
+            else:
+                # One circuit per run_paradox: transpile them all in parallel
+                # first, so each run_paradox hits the cache
+                self._pretranspile(names, builders)
+                for name in names:
+                    builder, description = builders[name]
+                    results.append(
+                        self.run_paradox(name, builder, description, shots=shots)
+                    )
+        return results
+
+    def run_ideal(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        seed: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute paradox experiments on the exact local ideal simulator.
+
+        Clifford circuits (all of PARADOX_BUILDERS) are solved with a
+        stabilizer tableau, small non-Clifford circuits with a statevector;
+        shots are then sampled from the exact distribution. No QPU, backend
+        or IBM token is needed, which makes this an instant baseline.
+
+        Args:
+            paradox_names: Keys of ``builders`` to run (default: all of them)
+            builders: Mapping name -> (circuit_builder, description)
+                (default: ``PARADOX_BUILDERS``)
+            shots: Shots sampled per circuit
+            seed: Sampling seed (reproducible counts)
+
+        Returns:
+            List of experiment results, in the order of ``paradox_names``
+        """
+        import time
+
+        from paradox_ideal_simulator import ideal_distribution
+
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+
+        results = []
+        for paradox_name in paradox_names:
+            paradox_dir = self._paradox_dir(paradox_name)
+            try:
+                circuit_builder, description = builders[paradox_name]
+                qc = circuit_builder()
+
+                start_sim = time.perf_counter()
+                distribution = ideal_distribution(qc)
+                counts = distribution.sample(shots, seed=seed)
+                sim_time = time.perf_counter() - start_sim
+                logger.info(
+                    f"🧮 {paradox_name} simulated ({distribution.method}) "
+                    f"in {sim_time:.3f}s"
+                )
+
+                results.append(
+                    self._record_result(
+                        paradox_name,
+                        description,
+                        paradox_dir,
+                        counts,
+                        metrics={
+                            "transpile_time_seconds": 0.0,
+                            "execution_time_seconds": sim_time,
+                            "shots": shots,
+                        },
+                        backend_info={
+                            "name": "ideal_simulator",
+                            "qubits": qc.num_qubits,
+                            "method": distribution.method,
+                        },
+                    )
+                )
+            except Exception as e:
+                logger.error(f"❌ Error in {paradox_name}: {e}")
+                results.append(self._record_error(paradox_name, paradox_dir, e))
+
+        return results
+
+    def run_async(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        max_in_flight: int = 4,
+        collect: bool = True,
+        **executor_options: Any,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Execute paradox experiments through the pipelined asyncio executor.
+
+        The next circuit is transpiled while earlier jobs wait in the queue,
+        up to ``max_in_flight`` jobs are polled concurrently, and results are
+        written as they complete. See AsyncParadoxExecutor for the options.
+
+        Returns:
+            List of experiment results, in the order of ``paradox_names``
+            (None when ``collect`` is False: results are only streamed to
+            the result store, see run_batch)
+        """
+        import asyncio
+
+        from paradox_async_executor import AsyncParadoxExecutor
+
+        self._apply_snapshot_refresh()
+        if self.emulator is not None:
+            executor_options.setdefault("sampler_factory", lambda emulator: emulator)
+        executor = AsyncParadoxExecutor(
+            self, max_in_flight=max_in_flight, **executor_options
+        )
+        return asyncio.run(
+            executor.run(paradox_names, builders, shots=shots, collect=collect)
+        )
+
+    def run_fanout(
+        self,
+        backends: List[Any],
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+        shots: int = 1024,
+        max_workers: Optional[int] = None,
+        **fanout_options: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the same paradoxes on several backends concurrently.
+
+        Each backend transpiles (with its own cache entries) and runs the
+        suite in its own thread; a failing backend does not block the
+        others. Writes one aggregated ``fanout_sanitized.json`` per paradox
+        with per-backend counts, timings and cross-backend distances.
+
+        Args:
+            backends: Backend objects (e.g. several fake backends) or names
+                such as ``["ibm_fez", "ibm_torino"]``; a backend given twice
+                is reported as ``name#2``
+            paradox_names: Keys of ``builders`` to run (default: all of them)
+            builders: Mapping name -> (circuit_builder, description)
+                (default: ``PARADOX_BUILDERS``)
+            shots: Shots per circuit and backend
+            max_workers: Concurrent backends (default: all of them)
+
+        Returns:
+            One aggregated record per paradox, in the order of ``paradox_names``
+        """
+        from paradox_fanout import MultiBackendFanout
+
+        fanout = MultiBackendFanout(
+            self, backends, max_workers=max_workers, **fanout_options
+        )
+        results = fanout.run(paradox_names, builders, shots=shots)
+        self._record_cache_stats()
+        return results
+
+    def dry_run(
+        self,
+        paradox_names: Optional[List[str]] = None,
+        builders: Optional[Dict[str, Tuple[Callable, str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build and transpile paradoxes without submitting anything.
+
+        Works against a backend snapshot (``connect_ibm(offline=True)``), so
+        circuits can be prepared, and the transpile cache warmed, while the
+        service is unreachable.
+
+        Returns:
+            One summary per paradox (transpiled depth/size, transpile time,
+            cache hit), in the order of ``paradox_names``
+        """
+        if builders is None:
+            from paradox_circuit_builders import PARADOX_BUILDERS
+
+            builders = PARADOX_BUILDERS
+        if paradox_names is None:
+            paradox_names = list(builders)
+        self._apply_snapshot_refresh()
+
+        circuits = [builders[name][0]() for name in paradox_names]
+        summaries = []
+        for paradox_name, (transpiled, transpile_time, cache_hit) in zip(
+            paradox_names, self._transpile_many(circuits)
+        ):
+            summaries.append(
+                {
+                    "paradox": paradox_name,
+                    "backend": self.backend.name,
+                    "depth": transpiled.depth(),
+                    "size": transpiled.size(),
+                    "transpile_time_seconds": transpile_time,
+                    "transpile_cache_hit": cache_hit,
+                }
+            )
+            logger.info(
+                f"🔧 {paradox_name}: depth {transpiled.depth()}, "
+                f"{transpiled.size()} ops ({transpile_time:.2f}s"
+                + (", cache hit)" if cache_hit else ")")
+            )
+
+        self._record_cache_stats()
+        return summaries
+
+    def _pretranspile(
+        self, paradox_names: List[str], builders: Dict[str, Tuple[Callable, str]]
+    ) -> None:
+        """
+        Warm the transpile cache for a suite before per-paradox runs.
+
+        Build errors are skipped here; run_paradox records them.
+        """
+        circuits = []
+        for name in paradox_names:
+            try:
+                circuits.append(builders[name][0]())
+            except Exception:
+                continue
+        if len(circuits) > 1:
+            self._transpile_many(circuits)
+
+    def _transpile(self, qc) -> Tuple[Any, float, bool]:
+        """
+        Transpile a circuit for the current backend through the cache.
+
+        Returns:
+            Tuple (transpiled circuit, transpile time in seconds, cache hit flag)
+        """
+        with span("transpile", self.tracer) as timed:
+            transpiled, cache_hit = self.transpile_cache.transpile(
+                qc,
+                self.backend,
+                optimization_level=self.optimization_level,
+                seed_transpiler=self.seed_transpiler,
+            )
+        return transpiled, timed.seconds, cache_hit
+
+    def _transpile_many(self, circuits: List[Any]) -> List[Tuple[Any, float, bool]]:
+        """
+        Transpile a suite concurrently through the cache.
+
+        Returns:
+            List of (transpiled circuit, transpile time in seconds, cache hit
+            flag), in input order
+        """
+        with span("transpile", self.tracer):
+            return self.transpile_cache.transpile_many(
+                circuits,
+                self.backend,
+                optimization_level=self.optimization_level,
+                seed_transpiler=self.seed_transpiler,
+                pool=self.transpile_pool,
+            )
+
+    def _build(self, circuit_builder: Callable):
+        """Build a circuit inside a ``build`` span."""
+        with span("build", self.tracer):
+            return circuit_builder()
+
+    def _submit_and_wait(
+        self, pubs: List[Any], shots: int, circuits: Optional[List[Any]] = None
+    ) -> Tuple[Any, float, Dict[str, float], Any]:
+        """
+        Submit PUBs as one Sampler job and block until its result arrives.
+
+        With a journal, the job is journaled before waiting, and a job with
+        the same content that an interrupted process submitted but never
+        consumed is re-attached instead of being submitted (and paid) again.
+        The job only counts as consumed once the caller has recorded its
+        results and passed it to _journal_completed. Emulated jobs cost
+        nothing and are never journaled.
+
+        Args:
+            pubs: Transpiled circuits
+            shots: Shots per PUB
+            circuits: Logical circuits the PUBs were transpiled from; they
+                identify the job in the journal (default: the PUBs)
+
+        Returns:
+            Tuple (primitive result, seconds from submission to result,
+            per-stage seconds: submit plus queue_wait/run/fetch when traced,
+            the job)
+        """
+        from qiskit_ibm_runtime import SamplerV2
+
+        job, submit_seconds = self._submit(
+            lambda: self.emulator or SamplerV2(mode=self._execution_backend()),
+            pubs,
+            shots,
+            circuits=circuits,
+        )
+
+        logger.info(f"   Job ID: {job.job_id()}")
+        logger.info("   Waiting for result...")
+
+        try:
+            with stopwatch() as waited:
+                result = job.result()
+        except Exception as e:
+            self._journal_failed(job, e)
+            raise
+
+        stages = {"submit": submit_seconds}
+        stages.update(self.tracer.record_job(job, waited.seconds))
+        return result, submit_seconds + waited.seconds, stages, job
+
+    def _submit(
+        self,
+        make_sampler: Callable[[], Any],
+        pubs: List[Any],
+        shots: int,
+        circuits: Optional[List[Any]] = None,
+        backend=None,
+    ) -> Tuple[Any, float]:
+        """
+        Submit a job, or re-attach the journaled job with the same content.
+
+        A new job is journaled as ``submitted`` before anyone waits for it.
+
+        Args:
+            make_sampler: Callable () -> sampler, only called to submit
+            pubs: Transpiled circuits
+            shots: Shots per PUB
+            circuits: Logical circuits of the PUBs (the job's journal identity)
+            backend: Backend the job runs on (default: the runner's)
+
+        Returns:
+            Tuple (job, submission seconds; 0 for a re-attached job)
+        """
+        backend = backend or self.backend
+        journal = self.journal if self.emulator is None else None
+        if journal is not None:
+            hashes = [circuit_fingerprint(c) for c in circuits or pubs]
+            key = job_key(backend.name, shots, hashes)
+            job = self._reattach(key)
+            if job is not None:
+                return job, 0.0
+
+        sampler = make_sampler()
+        with span("submit", self.tracer) as submitted:
+            job = sampler.run(pubs, shots=shots)
+        if journal is not None:
+            journal.submitted(
+                key,
+                job.job_id(),
+                backend.name,
+                shots,
+                hashes,
+                transpiled=[
+                    self.transpile_cache.key(
+                        c,
+                        backend,
+                        self.optimization_level,
+                        self.seed_transpiler,
+                    )
+                    for c in circuits or []
+                ],
+                run=self.timestamp,
+            )
+        return job, submitted.seconds
+
+    def _reattach(self, key: str):
+        """Retrieve a journaled, unconsumed job with this content, if any."""
+        pending = self.journal.claim_pending(key)
+        if pending is None:
+            return None
+        try:
+            job = self._connect_service().job(pending["job_id"])
+        except Exception as e:
+            # Local simulator jobs do not outlive their process
+            logger.warning(f"⚠️ Journaled job cannot be re-attached: {e}")
+            self.journal.abandoned(pending["job_id"], str(e))
+            return None
+        logger.info("🔗 Re-attached to a journaled job (not resubmitted)")
+        return job
+
+    @staticmethod
+    def _job_finished(job) -> bool:
+        try:
+            return bool(job.in_final_state())
+        except Exception:
+            return False
+
+    def _journal_plan(
+        self,
+        paradox_name: str,
+        qc,
+        shots: int,
+        method: str,
+        backend_name: Optional[str] = None,
+        **options: Any,
+    ) -> Optional[str]:
+        """Journal a planned paradox; returns its circuit hash (None: no journal)."""
+        if self.journal is None:
+            return None
+        circuit_hash = circuit_fingerprint(qc)
+        self.journal.plan(
+            self.timestamp,
+            paradox_name,
+            circuit_hash,
+            backend_name or self.backend.name,
+            shots,
+            method,
+            options,
+        )
+        return circuit_hash
+
+    def _journal_completed(self, jobs: List[Any]) -> None:
+        """
+        Journal jobs as consumed, once the results they carry are recorded.
+
+        Until then a crash leaves them ``submitted``, and resume() re-attaches
+        them instead of paying for them again.
+        """
+        if self.journal is None or self.emulator is not None:
+            return
+        for job in jobs:
+            self.journal.completed(job.job_id())
+
+    def _journal_failed(self, job, error: Exception) -> None:
+        """Journal a job whose result could not be fetched, if it is settled."""
+        # Only a finished job is settled; otherwise resume re-attaches it
+        if (
+            self.journal is not None
+            and self.emulator is None
+            and self._job_finished(job)
+        ):
+            self.journal.failed(job.job_id(), str(error))
+
+    def _journal_recorded(
+        self,
+        paradox_name: str,
+        circuit_hash: Optional[str],
+        shots: int,
+        paradox_dir: Path,
+        backend_name: Optional[str] = None,
+        filename: str = "result_sanitized.json",
+    ) -> None:
+        """Journal that a planned paradox's sanitized result was written."""
+        if self.journal is None or circuit_hash is None:
+            return
+        self.journal.recorded(
+            self.timestamp,
+            paradox_name,
+            circuit_hash,
+            backend_name or self.backend.name,
+            shots,
+            str(paradox_dir / filename),
+        )
+
+    def _update_metadata(self, **sections: Any) -> None:
+        """
+        Merge sections into the run's metadata.json.
+
+        Sections are kept in memory until the run directory exists (first
+        result, report), so runs that record nothing leave no directory.
+        """
+        self._metadata.update(sections)
+        if self.output_dir.exists():
+            self._write_metadata()
+        else:
+            self._metadata_pending = True
+
+    def _record_cache_stats(self) -> None:
+        """Write cache LRU updates to the shared index and log the counters."""
+        self.transpile_cache.flush()
+        self._update_metadata(transpile_cache=self.transpile_cache.stats())
+
+    def _ensure_output_dir(self) -> None:
+        """Create the run directory and write any pending metadata."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self._metadata_pending:
+            self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        metadata_path = self.output_dir / "metadata.json"
+        metadata = {}
+        if metadata_path.exists():
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+        metadata.update(self._metadata)
+
+        with open(metadata_path, "w") as f:
+            json.dump(metadata, f, indent=2)
+        self._metadata_pending = False
+
+    @property
+    def results(self) -> Iterator[Dict[str, Any]]:
+        """
+        All results of this run, streamed lazily from the result store
+        (``list(runner.results)`` loads them all).
+        """
+        return self.result_store.iter_records()
+
+    def _paradox_dir(self, paradox_name: str) -> Path:
+        """Output directory of a paradox (created when a file is written)."""
+        return self.output_dir / paradox_name.lower().replace(" ", "_")
+
+    def _write_paradox_file(
+        self, paradox_dir: Path, filename: str, data: Dict[str, Any]
+    ) -> None:
+        """Write a per-paradox JSON file, if enabled."""
+        self._ensure_output_dir()
+        if not self.write_paradox_files:
+            return
+        paradox_dir.mkdir(parents=True, exist_ok=True)
+        with open(paradox_dir / filename, "w") as f:
+            json.dump(data, f, indent=2)
+
+    @staticmethod
+    def _extract_counts(pub_result) -> Dict[str, int]:
+        """Extract bitstring counts from a SamplerV2 PUB result."""
+        data_bin = pub_result.data
+        if hasattr(data_bin, "c"):
+            counts_obj = data_bin.c
+            return counts_obj.get_counts()
+        return getattr(data_bin, "get_counts", lambda: {})()
+
+    def _record_result(
+        self,
+        paradox_name: str,
+        description: str,
+        paradox_dir: Path,
+        counts: Dict[str, int],
+        metrics: Dict[str, Any],
+        backend_info: Optional[Dict[str, Any]] = None,
+        circuit=None,
+        transpiled=None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze, interpret and save the counts of a finished experiment.
+
+        With ``compare_ideal`` and the (untranspiled) circuit given,
+        TVD/Hellinger/KL distances to its exact ideal distribution are stored
+        as well. When the executed
+        circuit is given and a readout mitigator is configured, the mitigated
+        distribution is stored next to the raw one; it uses the calibration
+        measured before the circuit was submitted (``_calibrate_readout``),
+        so analysis never waits for a job.
+        """
+        # 5. Analyze result
+        with span("analyze", self.tracer) as analyzed:
+            sparse = SparseCounts.from_dict(counts)
+            quantum_result = {
+                "counts": counts,
+                "distribution": sparse.to_json()["distribution"],
+            }
+            total = sparse.shots or 1
 
             # Log top 5 states
-            top_states = sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5]
             logger.info("📊 Top 5 states:")
-            for state, count in top_states:
+            for state, count in sparse.top_k(5):
                 logger.info(f"   |{state}⟩: {count} ({count/total:.1%})")
 
+            if circuit is not None:
+                ideal_distances = self._ideal_distances(circuit, sparse)
+                if ideal_distances:
+                    quantum_result["ideal_distances"] = ideal_distances
+
+            if self.readout_mitigator is not None and transpiled is not None:
+                mitigated = self._mitigate(sparse, transpiled)
+                if mitigated:
+                    if circuit is not None:
+                        distances = self._ideal_distances(
+                            circuit, SparseCounts.from_dict(mitigated["distribution"])
+                        )
+                        if distances:
+                            mitigated["ideal_distances"] = distances
+                    quantum_result["mitigated"] = mitigated
+
             # 6. Interpret
-            interpretation = self._interpret_result(paradox_name, distribution)
+            interpretation = self._interpret_result(paradox_name, sparse)
             logger.info(f"💡 Interpretation: {interpretation['conclusion']}")
+        if "stage_seconds" in metrics:
+            metrics["stage_seconds"]["analyze"] = analyzed.seconds
 
-            # 7. Save result (SANITIZED - no job_id)
-            result_data = {
-                "timestamp": datetime.now().isoformat(),
-                "paradox": paradox_name,
-                "description": description,
-                "backend": {
-                    "name": self.backend.name,
-                    "qubits": self.backend.num_qubits,
-                },
-                "metrics": {
-                    "transpile_time_seconds": transpile_time,
-                    "execution_time_seconds": exec_time,
-                    "shots": 1024,
-                },
-                "quantum_result": {"counts": counts, "distribution": distribution},
-                "interpretation": interpretation,
-                "omnimind_resolution": True,
-                "system_signature": "21c1749bcffd2904",
-            }
+        # 7. Save result (SANITIZED - no job_id)
+        result_data = {
+            "timestamp": datetime.now().isoformat(),
+            "paradox": paradox_name,
+            "description": description,
+            "backend": backend_info
+            or {
+                "name": self.backend.name,
+                "qubits": self.backend.num_qubits,
+            },
+            "metrics": metrics,
+            "quantum_result": quantum_result,
+            "interpretation": interpretation,
+            "omnimind_resolution": True,
+            "system_signature": "21c1749bcffd2904",
+        }
+        if self.emulator is not None:
+            # Same schema, but never to be mistaken for hardware data
+            result_data["emulated"] = True
+            result_data["emulator"] = self.emulator.describe()
 
-            # Save sanitized version only
-            with open(paradox_dir / "result_sanitized.json", "w") as f:
-                json.dump(result_data, f, indent=2)
+        # Save sanitized version only
+        with span("write", self.tracer):
+            self.result_store.append(result_data)
+            self._write_paradox_file(paradox_dir, "result_sanitized.json", result_data)
+        logger.info(f"✅ {paradox_name} completed!")
 
-            self.results.append(result_data)
-            logger.info(f"✅ {paradox_name} completed!")
+        return result_data
 
-            return result_data
+    def _record_error(
+        self, paradox_name: str, paradox_dir: Path, error: Exception
+    ) -> Dict[str, Any]:
+        """Save the error record of a failed experiment."""
+        error_data = {
+            "timestamp": datetime.now().isoformat(),
+            "paradox": paradox_name,
+            "status": "FAILED",
+            "error": str(error),
+        }
 
+        self.result_store.append(error_data)
+        self._write_paradox_file(paradox_dir, "error.json", error_data)
+
+        return error_data
+
+    def _calibrate_readout(self, transpiled: List[Any]) -> None:
+        """
+        Readout-calibrate every qubit the circuits measure, in one job.
+
+        Runs before the circuits are submitted, so recording their results
+        (``_mitigate``) stays CPU-only. Qubits with a fresh cached
+        calibration are not measured again.
+        """
+        if self.readout_mitigator is None or not transpiled:
+            return
+        try:
+            qubits = sorted({q for t in transpiled for q in measured_qubits(t)})
+            with span("calibrate", self.tracer):
+                calibration = self.readout_mitigator.calibrate(
+                    self._execution_backend(), qubits
+                )
         except Exception as e:
-            logger.error(f"❌ Error in {paradox_name}: {e}")
-            import traceback
+            logger.warning(f"⚠️ Readout calibration failed: {e}")
+            return
+        with self._readout_lock:
+            self._readout_calibration.setdefault(self.backend.name, {}).update(
+                calibration
+            )
 
-            traceback.print_exc()
+    def _mitigate(self, sparse: SparseCounts, transpiled) -> Dict[str, Any]:
+        """Readout-mitigated distribution (empty if mitigation fails)."""
+        try:
+            qubits = measured_qubits(transpiled)
+            with self._readout_lock:
+                cached = self._readout_calibration.get(self.backend.name, {})
+                calibration = {q: cached[q] for q in qubits if q in cached}
+            if len(calibration) < len(set(qubits)):
+                raise ValueError("measured qubits were not calibrated before the run")
+            return self.readout_mitigator.mitigate(
+                sparse, self._execution_backend(), qubits, calibration=calibration
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Readout mitigation skipped: {e}")
+            return {}
 
-            error_data = {
-                "timestamp": datetime.now().isoformat(),
-                "paradox": paradox_name,
-                "status": "FAILED",
-                "error": str(e),
-            }
+    def _ideal_distances(self, circuit, sparse: SparseCounts) -> Dict[str, float]:
+        """
+        Distances of measured counts to the circuit's exact ideal distribution.
 
-            with open(paradox_dir / "error.json", "w") as f:
-                json.dump(error_data, f, indent=2)
+        Empty unless ``compare_ideal`` is set and the ideal distribution is
+        available. It is computed once per circuit fingerprint, so fan-out
+        backends and mitigated results reuse it.
+        """
+        if not self.compare_ideal:
+            return {}
+        ideal = self._ideal_probabilities(circuit)
+        return sparse.distances(ideal) if ideal else {}
+
+    def _ideal_probabilities(self, circuit) -> Optional[Dict[str, float]]:
+        """Cached ideal probability table (None when unavailable)."""
+        from paradox_ideal_simulator import ideal_distribution, is_clifford_circuit
+
+        key = circuit_fingerprint(circuit)
+        with self._ideal_lock:
+            if key in self._ideal_cache:
+                self._ideal_cache.move_to_end(key)
+                return self._ideal_cache[key]
 
-            return error_data
+        # Computed outside the lock: a concurrent miss only duplicates work
+        ideal = None
+        if is_clifford_circuit(circuit):
+            try:
+                ideal = ideal_distribution(circuit).probabilities(IDEAL_MAX_OUTCOMES)
+            except ValueError as e:
+                # Support too large to enumerate, or non-terminal measurements
+                logger.debug(f"Ideal distribution unavailable: {e}")
+        with self._ideal_lock:
+            self._ideal_cache[key] = ideal
+            if len(self._ideal_cache) > IDEAL_CACHE_SIZE:
+                self._ideal_cache.popitem(last=False)
+        return ideal
 
     def _interpret_result(
-        self, paradox_name: str, distribution: Dict[str, float]
-    ) -> Dict[str, str]:
-        """Interpret quantum result of paradox."""
+        self, paradox_name: str, distribution: CountsLike
+    ) -> Dict[str, Any]:
+        """
+        Interpret quantum result of paradox.
+
+        ``entropy`` is the Shannon entropy normalized by the register width
+        (0 = single outcome, 1 = uniform over all outcomes).
+        """
 
         # Generic analysis based on distribution
-        top_state = max(distribution.items(), key=lambda x: x[1])
-        entropy = -sum(
-            p * (p and (p * (1 / p))) for p in distribution.values() if p > 0
-        )
+        sparse = as_sparse_counts(distribution)
+        state, count = sparse.top_k(1)[0]
+        top_state = (state, count / (sparse.shots or 1))
+        entropy = sparse.entropy(normalized=True)
 
-        if entropy > 0.8:
+        bucket = interpretation_bucket(entropy, top_state[1])
+        if bucket == "superposition":
             conclusion = f"{paradox_name} in QUANTUM SUPERPOSITION"
             meaning = "System maintains multiple states simultaneously"
-        elif top_state[1] > 0.7:
+        elif bucket == "resolved":
             conclusion = f"{paradox_name} RESOLVED via quantum collapse"
             meaning = f"System converged to state |{top_state[0]}⟩"
         else:
@@ -231,30 +1563,72 @@ class ParadoxExperimentRunner:
             "conclusion": conclusion,
             "meaning": meaning,
             "entropy": entropy,
+            "entropy_bits": sparse.entropy(),
             "dominant_state": top_state[0],
             "dominant_probability": top_state[1],
         }
 
+    def write_trace_report(self, labels: Optional[Dict[str, str]] = None) -> List[Path]:
+        """
+        Export the stage timings of this runner to the run directory.
+
+        Writes ``trace_report.json`` (per-stage count, mean, p50/p95, buckets)
+        and ``trace_metrics.prom`` (Prometheus text format, for the node
+        exporter's textfile collector).
+
+        Args:
+            labels: Extra Prometheus labels (default: the backend name)
+        """
+        if labels is None and self.backend is not None:
+            labels = {"backend": self.backend.name}
+        self._ensure_output_dir()
+        written = self.tracer.write_reports(self.output_dir, labels)
+        logger.info(f"⏱️ Stage timings saved: {written[0]}")
+        return written
+
     def generate_summary_report(self):
-        """Generate final report of all experiments."""
+        """
+        Generate final report of all experiments.
+
+        The report is written incrementally while streaming the result
+        store, so its memory use does not grow with the number of results.
+        """
         logger.info("📝 Generating final report...")
 
+        self._ensure_output_dir()
         report_path = self.output_dir / "summary_report.md"
 
         with open(report_path, "w") as f:
             f.write("# OmniMind - Quantum Paradox Experiments\n\n")
             f.write(f"**Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(
-                f"**Backend**: {self.backend.name} ({self.backend.num_qubits} qubits)\n\n"
-            )
-            f.write(f"**Total Experiments**: {len(self.results)}\n\n")
+            if self.backend is not None:
+                f.write(
+                    f"**Backend**: {self.backend.name} ({self.backend.num_qubits} qubits)\n\n"
+                )
+            else:
+                f.write("**Backend**: local ideal simulator\n\n")
+            f.write(f"**Total Experiments**: {self.result_store.count}\n\n")
             f.write("---\n\n")
 
-            for i, result in enumerate(self.results, 1):
+            for i, result in enumerate(self.result_store.iter_records(), 1):
                 if "error" in result:
                     f.write(f"## {i}. {result['paradox']} ❌\n\n")
                     f.write(f"**Status**: FAILED\n\n")
                     f.write(f"**Error**: {result['error']}\n\n")
+                elif "backends" in result:
+                    f.write(f"## {i}. {result['paradox']} 🌐\n\n")
+                    for name, entry in result["backends"].items():
+                        if entry["status"] == "completed":
+                            f.write(
+                                f"- **{name}**: "
+                                f"{entry['interpretation']['conclusion']} "
+                                f"({entry['metrics']['execution_time_seconds']:.2f}s)\n"
+                            )
+                        else:
+                            f.write(f"- **{name}**: FAILED ({entry['error']})\n")
+                    for pair, distances in result["cross_backend"].items():
+                        f.write(f"- {pair}: TVD {distances['tvd']:.3f}\n")
+                    f.write("\n")
                 else:
                     f.write(f"## {i}. {result['paradox']} ✅\n\n")
                     f.write(
@@ -267,15 +1641,41 @@ class ParadoxExperimentRunner:
 
                 f.write("---\n\n")
 
+            tracer = self.tracer
+            if tracer.enabled:
+                f.write("## ⏱️ Stage Timings\n\n")
+                f.write("| Stage | Count | Mean (s) | p95 (s) |\n")
+                f.write("|---|---|---|---|\n")
+                for stage, stats in tracer.report()["stages"].items():
+                    f.write(
+                        f"| {stage} | {stats['count']} | "
+                        f"{stats['mean_seconds']:.4f} | {stats['p95_seconds']:.4f} |\n"
+                    )
+                f.write("\n---\n\n")
+
             f.write("## 🎯 Mission Accomplished\n\n")
             f.write("**OmniMind resolves paradoxes that humanity cannot**\n\n")
             f.write("**THE AGE OF DARKNESS ENDS**\n")
 
         logger.info(f"✅ Report saved: {report_path}")
+        if tracer.enabled:
+            self.write_trace_report()
+
+    def close(self) -> None:
+        """Shut the transpile workers down and close the result stream."""
+        self.transpile_pool.close()
+        self.result_store.close()
+
+    def __enter__(self) -> "ParadoxExperimentRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
 
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
     print("🚀 OmniMind - Quantum Paradox Experiment System")
     print("=" * 60)
     print("This is a PUBLIC version - sanitized for sharing")
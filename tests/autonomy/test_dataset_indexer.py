@@ -0,0 +1,140 @@
+"""DatasetIndexer with the hashing encoder (no model download, no network)."""
+
+import json
+
+import numpy as np
+import pytest
+
+from dataset_indexer import (
+    DatasetIndexer,
+    HashingEncoder,
+    QdrantStore,
+    iter_records,
+    make_encoder,
+    records_from_chunk,
+)
+from streaming_ingest import StreamingIngestor
+
+
+class RecordingStore:
+    """Vector store that keeps the upserted points in memory."""
+
+    def __init__(self):
+        self.points = {}
+        self.requests = 0
+
+    def upsert(self, ids, vectors, payloads):
+        self.requests += 1
+        for point_id, vector, payload in zip(ids, vectors, payloads):
+            self.points[point_id] = (np.asarray(vector), payload)
+
+
+def chunk(text, source="data.jsonl", offset=0):
+    return {"source": source, "offset": offset, "length": len(text), "text": text}
+
+
+def test_records_are_normalized_and_hashed():
+    text = "\n".join(
+        [
+            json.dumps({"id": 1, "abstract": "Quantum  paradoxes\tresolved"}),
+            "ｆｕｌｌｗｉｄｔｈ text line here",
+            "short",
+            json.dumps({"id": 2, "title": "no text field"}),
+        ]
+    )
+    records = list(iter_records(text))
+    assert [r[1] for r in records] == [
+        "Quantum paradoxes resolved",
+        "fullwidth text line here",
+    ]
+    assert len({r[0] for r in records}) == 2
+
+
+def test_hashing_encoder_is_deterministic_and_normalized():
+    encoder = make_encoder("hashing", dim=64)
+    first = encoder.encode(["topological deglutition", "something else entirely"])
+    second = HashingEncoder(dim=64).encode(["topological deglutition"])
+    assert first.shape == (2, 64)
+    assert np.allclose(first[0], second[0])
+    assert np.allclose(np.linalg.norm(first, axis=1), 1.0)
+    assert float(first[0] @ first[1]) < 0.99
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_dedup_batching_and_report(tmp_path, pool):
+    store = RecordingStore()
+    indexer = DatasetIndexer(
+        tmp_path,
+        encoder=HashingEncoder(dim=32),
+        store=store,
+        pool=pool,
+        workers=2,
+        max_batch=7,
+        upsert_batch=10,
+    )
+    lines = [f"record number {i:04d} of the corpus" for i in range(40)]
+    text = "\n".join(lines + lines[:5])  # 5 duplicates inside the chunk
+    try:
+        assert indexer.index_chunk(chunk(text)) == 40
+        # Same records in another file: nothing new to embed
+        assert indexer.index_chunk(chunk(text, source="copy.jsonl")) == 0
+        report = indexer.report()
+    finally:
+        indexer.close()
+
+    assert len(store.points) == 40
+    assert store.requests == 4
+    assert report["records"] == 90
+    assert report["duplicates"] == 50
+    assert report["indexed"] == 40
+    assert set(report["stages"]) == {"parse", "dedup", "embed", "upsert"}
+    assert report["embed_batch_seconds"]["max"] > 0
+    assert report["records_per_second"] > 0
+
+
+def test_resumes_from_indexed_offsets(tmp_path):
+    store = RecordingStore()
+    indexer = DatasetIndexer(tmp_path, encoder=HashingEncoder(dim=16), store=store)
+    first = chunk("alpha record with enough text\n")
+    indexer.index_chunk(first, dataset="ds")
+    indexer.close()
+
+    # A restarted indexer skips chunks it already committed
+    reopened = DatasetIndexer(tmp_path, encoder=HashingEncoder(dim=16), store=store)
+    assert reopened.indexed_offset("ds/data.jsonl") == first["length"]
+    reopened.index_chunk(first, dataset="ds")
+    assert reopened.report()["chunks_skipped"] == 1
+    reopened.close()
+
+
+def test_plugs_into_streaming_ingestion(tmp_path):
+    dataset = tmp_path / "dataset"
+    dataset.mkdir()
+    with open(dataset / "papers.jsonl", "w") as f:
+        for i in range(200):
+            f.write(json.dumps({"text": f"paper {i % 150} about paradoxes"}) + "\n")
+
+    store = RecordingStore()
+    indexer = DatasetIndexer(
+        tmp_path / "index", encoder=HashingEncoder(dim=16), store=store
+    )
+    ingestor = StreamingIngestor(
+        process=records_from_chunk, chunk_size=1024, workers=0
+    )
+    ingestor.ingest(dataset, commit=indexer.index_chunk)
+    indexer.close()
+
+    assert len(store.points) == 150
+    assert not (dataset / "papers.jsonl").exists()
+
+
+def test_qdrant_local_mode(tmp_path):
+    pytest.importorskip("qdrant_client")
+    indexer = DatasetIndexer(tmp_path, encoder=HashingEncoder(dim=16))
+    try:
+        indexer.index_chunk(chunk("a record stored in local qdrant\n" * 2))
+        client = indexer.store._client
+        assert client.count(indexer.store.collection).count == 1
+    finally:
+        indexer.close()
+    assert isinstance(indexer.store, QdrantStore)
@@ -0,0 +1,182 @@
+"""DiskAdmission with synthetic torrent metadata and a fake disk."""
+
+from collections import namedtuple
+
+import pytest
+
+from disk_admission import (
+    ADMIT,
+    DEFER,
+    GB,
+    SKIP,
+    DiskAdmission,
+    bdecode,
+    torrent_payload_size,
+)
+from download_scheduler import DownloadScheduler, fetch_command
+from nutrition_state import NutritionState
+
+Usage = namedtuple("Usage", "total used free")
+
+
+def bencode(value):
+    if isinstance(value, int):
+        return b"i%de" % value
+    if isinstance(value, bytes):
+        return b"%d:%s" % (len(value), value)
+    if isinstance(value, list):
+        return b"l" + b"".join(bencode(v) for v in value) + b"e"
+    items = sorted(value.items())
+    return b"d" + b"".join(bencode(k) + bencode(v) for k, v in items) + b"e"
+
+
+def torrent(*lengths):
+    if len(lengths) == 1:
+        info = {b"name": b"single", b"length": lengths[0]}
+    else:
+        files = [{b"length": n, b"path": [b"f%d" % i]} for i, n in enumerate(lengths)]
+        info = {b"name": b"multi", b"files": files}
+    return bencode({b"announce": b"http://tracker", b"info": info})
+
+
+class FakeDisk:
+    def __init__(self, total, free):
+        self.total = total
+        self.free = free
+
+    def __call__(self, path):
+        return Usage(self.total, self.total - self.free, self.free)
+
+
+def dataset(name, size=None):
+    entry = {"title": name, "link": f"https://example.org/download/{name}.torrent"}
+    if size is not None:
+        entry["size"] = str(size)
+    return entry
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = NutritionState(tmp_path / "state.db")
+    yield state
+    state.close()
+
+
+def test_payload_size_from_metainfo():
+    assert bdecode(b"d1:ai1e1:bl2:xyee") == ({b"a": 1, b"b": [b"xy"]}, 17)
+    assert torrent_payload_size(torrent(123)) == 123
+    assert torrent_payload_size(torrent(5 * GB, 3 * GB, 1)) == 8 * GB + 1
+
+
+def test_admit_defer_skip_against_reservations(tmp_path, state):
+    metainfo = {
+        "a": torrent(30 * GB),
+        "b": torrent(25 * GB, 20 * GB),
+        "huge": torrent(500 * GB),
+    }
+    admission = DiskAdmission(
+        state,
+        tmp_path,
+        min_free_bytes=10 * GB,
+        scratch_ratio=0.0,
+        disk_usage=FakeDisk(total=200 * GB, free=80 * GB),
+        fetch=lambda link: metainfo[link.rsplit("/", 1)[1][:-8]],
+    )
+    a, b, huge = dataset("a"), dataset("b"), dataset("huge")
+
+    assert admission.decide(a, tmp_path / "a") == ADMIT  # 70 GB available
+    assert admission.decide(b, tmp_path / "b") == DEFER  # 45 GB needed, 40 GB left
+    assert admission.decide(huge, tmp_path / "huge") == SKIP  # never fits
+    assert admission.decide(dataset("unknown", None) | {"link": "x"}, tmp_path) == SKIP
+
+    # The ledger persists across instances (restarts)
+    assert [r["bytes"] for r in state.reservations()] == [30 * GB]
+
+    admission.release(a)
+    assert admission.decide(b, tmp_path / "b") == ADMIT
+
+
+def test_outstanding_counts_only_bytes_not_yet_written(tmp_path, state):
+    admission = DiskAdmission(
+        state,
+        tmp_path,
+        min_free_bytes=0,
+        disk_usage=FakeDisk(total=100, free=100),
+        fetch=None,
+    )
+    target = tmp_path / "partial"
+    target.mkdir()
+    state.reserve(dataset("p"), target, 60)
+    (target / "chunk").write_bytes(b"x" * 25)
+    assert admission.outstanding() == 35
+
+
+def test_budget_and_scratch_space(tmp_path, state):
+    admission = DiskAdmission(
+        state,
+        tmp_path,
+        min_free_bytes=0,
+        budget_bytes=10 * GB,
+        scratch_ratio=0.5,
+        disk_usage=FakeDisk(total=1000 * GB, free=1000 * GB),
+        fetch=None,
+    )
+    assert admission.decide(dataset("a", 4 * GB), tmp_path / "a") == ADMIT
+    assert admission.decide(dataset("b", 4 * GB), tmp_path / "b") == DEFER
+    assert admission.decide(dataset("c", 7 * GB), tmp_path / "c") == SKIP
+
+
+def test_reconcile_releases_finished_datasets(tmp_path, state):
+    admission = DiskAdmission(
+        state, tmp_path, disk_usage=FakeDisk(100 * GB, 100 * GB), fetch=None
+    )
+    done, running = dataset("done", 1), dataset("running", 1)
+    for entry in (done, running):
+        state.reserve(entry, tmp_path, 1)
+    state.mark(done, "cleaned")
+    state.mark(running, "downloading")
+
+    assert admission.reconcile() == 1
+    assert [r["state"] for r in state.reservations()] == ["downloading"]
+
+
+def test_orders_smallest_first_or_by_value(tmp_path, state):
+    entries = [dataset("big", 9 * GB), dataset("nosize"), dataset("small", GB)]
+    smallest = DiskAdmission(state, tmp_path, fetch=None)
+    assert [d["title"] for d in smallest.order(entries)] == ["small", "big", "nosize"]
+
+    value = {"big": 20.0, "small": 1.0}
+    by_value = DiskAdmission(
+        state, tmp_path, order="value", value=lambda d: value[d["title"]], fetch=None
+    )
+    assert [d["title"] for d in by_value.order(entries)] == ["big", "small", "nosize"]
+
+
+def test_scheduler_defers_until_space_is_released(tmp_path):
+    source = tmp_path / "payload.bin"
+    source.write_bytes(b"x" * 10)
+    free = {"slots": 1}
+    events = []
+
+    def can_start(entry):
+        if not free["slots"]:
+            events.append(("defer", entry["title"]))
+            return None
+        free["slots"] -= 1
+        return True
+
+    def on_complete(entry, path):
+        events.append(("done", entry["title"]))
+        free["slots"] += 1
+
+    scheduler = DownloadScheduler(
+        max_concurrent=2, poll_interval=0.02, command=fetch_command
+    )
+    entries = [{"title": t, "link": source.as_uri()} for t in ("A", "B")]
+    results = scheduler.run(
+        [(e, tmp_path / e["title"]) for e in entries], on_complete, can_start
+    )
+
+    assert [r["status"] for r in results] == ["completed", "completed"]
+    assert ("defer", "B") in events
+    assert events.index(("done", "A")) < events.index(("done", "B"))
@@ -0,0 +1,164 @@
+"""DownloadScheduler against file:// and local HTTP sources."""
+
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from download_scheduler import DownloadScheduler, fetch_command
+from streaming_ingest import StreamingIngestor
+
+
+@pytest.fixture
+def http_root(tmp_path):
+    root = tmp_path / "served"
+    root.mkdir()
+    handler = partial(SimpleHTTPRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def fast_scheduler(**options):
+    options.setdefault("command", fetch_command)
+    return DownloadScheduler(poll_interval=0.02, backoff=0.01, **options)
+
+
+def test_downloads_http_and_file_sources(tmp_path, http_root):
+    root, base_url = http_root
+    (root / "a.txt").write_text("alpha")
+    source = tmp_path / "b.txt"
+    source.write_text("beta")
+
+    downloads = [
+        ({"title": "A", "link": f"{base_url}/a.txt"}, tmp_path / "out" / "A"),
+        ({"title": "B", "link": source.as_uri()}, tmp_path / "out" / "B"),
+    ]
+    results = fast_scheduler().run(downloads)
+
+    assert [r["status"] for r in results] == ["completed", "completed"]
+    assert (tmp_path / "out" / "A" / "a.txt").read_text() == "alpha"
+    assert (tmp_path / "out" / "B" / "b.txt").read_text() == "beta"
+    assert results[0]["bytes"] == 5
+
+
+def test_failed_download_is_retried_then_reported(tmp_path, http_root):
+    _, base_url = http_root
+    dataset = {"title": "missing", "link": f"{base_url}/missing.bin"}
+
+    [result] = fast_scheduler(retries=2).run([(dataset, tmp_path / "missing")])
+
+    assert result["status"] == "failed"
+    assert result["attempts"] == 3
+    assert "exit code" in result["error"]
+
+
+def test_timeout_kills_the_download(tmp_path):
+    def sleeper(link, download_dir):
+        return [sys.executable, "-c", "import time; time.sleep(30)"]
+
+    scheduler = fast_scheduler(command=sleeper, timeout=0.2, retries=0)
+    started = time.monotonic()
+    [result] = scheduler.run([({"title": "slow", "link": "x"}, tmp_path / "slow")])
+
+    assert result["status"] == "failed"
+    assert "timed out" in result["error"]
+    assert time.monotonic() - started < 10
+
+
+def test_concurrency_is_bounded_and_ingestion_overlaps(tmp_path):
+    marker = tmp_path / "running"
+    marker.mkdir()
+    script = (
+        "import os, sys, time\n"
+        "path = os.path.join(sys.argv[1], str(os.getpid()))\n"
+        "open(path, 'w').close()\n"
+        "peak = len(os.listdir(sys.argv[1]))\n"
+        "time.sleep(0.3)\n"
+        "os.remove(path)\n"
+        "os.makedirs(sys.argv[2], exist_ok=True)\n"
+        "open(os.path.join(sys.argv[2], 'peak'), 'w').write(str(peak))\n"
+    )
+
+    def command(link, download_dir):
+        return [sys.executable, "-c", script, str(marker), str(download_dir)]
+
+    ingested = []
+
+    def ingest(dataset, path):
+        ingested.append((dataset["title"], time.monotonic()))
+
+    downloads = [
+        ({"title": f"d{i}", "link": "x"}, tmp_path / f"d{i}") for i in range(5)
+    ]
+    started = time.monotonic()
+    results = fast_scheduler(command=command, max_concurrent=2).run(
+        downloads, on_complete=ingest
+    )
+    finished = time.monotonic()
+
+    assert all(r["status"] == "completed" for r in results)
+    assert all(r["ingested"] for r in results)
+    peaks = [int((tmp_path / f"d{i}" / "peak").read_text()) for i in range(5)]
+    assert max(peaks) <= 2
+    # The first dataset was ingested while later ones were still downloading
+    assert min(t for _, t in ingested) < finished - 0.2
+    assert finished - started < 5
+
+
+def test_can_start_skips_downloads(tmp_path):
+    downloads = [({"title": "A", "link": "x"}, tmp_path / "A")]
+    [result] = fast_scheduler().run(downloads, can_start=lambda dataset: False)
+    assert result["status"] == "skipped"
+
+
+def test_on_start_streams_files_while_downloading(tmp_path):
+    # Writes three files one after another, then keeps "downloading"
+    script = (
+        "import os, sys, time\n"
+        "for i in range(3):\n"
+        "    path = os.path.join(sys.argv[1], f'part{i}.txt')\n"
+        "    open(path + '.part', 'w').write(f'line {i}\\n')\n"
+        "    os.replace(path + '.part', path)\n"
+        "    time.sleep(0.2)\n"
+        "time.sleep(1.0)\n"
+    )
+
+    def command(link, download_dir):
+        return [sys.executable, "-c", script, str(download_dir)]
+
+    seen = []
+    ingestor = StreamingIngestor(
+        commit=lambda result: seen.append((result["text"], time.monotonic())),
+        workers=0,
+        poll_interval=0.02,
+        settle_seconds=0.1,
+    )
+    finished = {}
+
+    def ingest(dataset, path, download_done):
+        ingestor.ingest(path, download_done=download_done.is_set)
+        finished["ingest"] = time.monotonic()
+
+    def downloaded(dataset, path):
+        finished["download"] = time.monotonic()
+
+    [result] = fast_scheduler(command=command, ingest_workers=2).run(
+        [({"title": "stream", "link": "x"}, tmp_path / "stream")],
+        on_complete=downloaded,
+        on_start=ingest,
+    )
+
+    assert result["status"] == "completed"
+    assert result["ingested"] is True
+    assert sorted(text for text, _ in seen) == [f"line {i}\n" for i in range(3)]
+    # Every file was eaten while the download kept running, the ingestion
+    # only returned once it finished
+    assert max(t for _, t in seen) < finished["download"] - 0.5
+    assert finished["ingest"] >= finished["download"] - 0.1
+    assert not list((tmp_path / "stream").glob("part*"))
@@ -0,0 +1,100 @@
+"""NutritionState dedup and FeedFetcher conditional fetching."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from feed_fetcher import FeedFetcher
+from nutrition_state import NutritionState, dataset_key
+
+INFOHASH = "0123456789abcdef0123456789abcdef01234567"
+
+FEED = f"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>datasets</title>
+<item><title>Alpha</title>
+<link>https://academictorrents.com/download/{INFOHASH}.torrent</link>
+<description>a</description></item>
+<item><title>Beta</title><link>https://example.org/beta.tar</link>
+<description>b</description></item>
+</channel></rss>
+""".encode()
+
+
+@pytest.fixture
+def state(tmp_path):
+    state = NutritionState(tmp_path / "state.db")
+    yield state
+    state.close()
+
+
+@pytest.fixture
+def feed_server():
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(dict(self.headers))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(FEED)))
+            self.end_headers()
+            self.wfile.write(FEED)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/feed.xml", requests_seen
+    server.shutdown()
+
+
+def test_dataset_key_prefers_infohash():
+    link = f"https://academictorrents.com/download/{INFOHASH.upper()}.torrent"
+    assert dataset_key({"link": link}) == INFOHASH
+    assert dataset_key({"link": f"magnet:?xt=urn:btih:{INFOHASH}"}) == INFOHASH
+    assert dataset_key({"link": "https://example.org/x"}) == "https://example.org/x"
+
+
+def test_observe_skips_finished_and_duplicate_datasets(state):
+    a = {"title": "A", "link": f"magnet:?xt=urn:btih:{INFOHASH}"}
+    b = {"title": "B", "link": "https://example.org/b"}
+
+    assert state.observe([a, b, dict(a)]) == [a, b]
+    state.mark(a, "downloading")
+    state.mark(a, "downloaded")
+    state.mark(a, "cleaned")
+    state.mark(b, "failed", error="boom")
+
+    assert state.observe([a, b]) == [b]
+    assert state.state(a) == "cleaned"
+    assert state.counts() == {"cleaned": 1, "failed": 1}
+
+
+def test_state_survives_reopen(tmp_path):
+    dataset = {"title": "A", "link": "https://example.org/a"}
+    first = NutritionState(tmp_path / "state.db")
+    first.mark(dataset, "ingested")
+    first.close()
+
+    second = NutritionState(tmp_path / "state.db")
+    assert second.observe([dataset]) == []
+    second.close()
+
+
+def test_unchanged_feed_costs_one_304(state, feed_server):
+    url, requests_seen = feed_server
+    fetcher = FeedFetcher(url, state)
+
+    datasets = fetcher.fetch()
+    assert [d["title"] for d in datasets] == ["Alpha", "Beta"]
+    assert state.feed_validators(url) == ('"v1"', None)
+
+    assert fetcher.fetch() is None
+    assert len(requests_seen) == 2
+    assert requests_seen[1]["If-None-Match"] == '"v1"'
@@ -0,0 +1,123 @@
+"""StreamingIngestor: chunking, bounded window, deletion and crash resume."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from streaming_ingest import (
+    CHECKPOINT_NAME,
+    StreamingIngestor,
+    iter_chunks,
+    punch_hole,
+)
+
+
+def write_lines(path, count, width=40):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        for i in range(count):
+            f.write(f"{path.name}:{i:06d}:".ljust(width, "x") + "\n")
+
+
+def committed_lines(results):
+    return [line for r in results for line in r["text"].splitlines()]
+
+
+@pytest.mark.parametrize("mmap_threshold", [1 << 30, 0])
+def test_chunks_cut_at_line_boundaries(tmp_path, mmap_threshold):
+    path = tmp_path / "data.txt"
+    write_lines(path, 500)
+    chunks = list(iter_chunks(path, 0, 1000, mmap_threshold))
+
+    assert b"".join(data for _, data in chunks) == path.read_bytes()
+    assert all(data.endswith(b"\n") for _, data in chunks)
+    assert all(len(data) <= 1000 for _, data in chunks)
+    offsets = [offset for offset, _ in chunks]
+    assert offsets == sorted(offsets) and offsets[0] == 0
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_ingests_everything_in_bounded_window_and_deletes(tmp_path, workers):
+    dataset = tmp_path / "dataset"
+    write_lines(dataset / "a.txt", 300)
+    write_lines(dataset / "sub" / "b.txt", 700)
+    expected = sorted(
+        (dataset / "a.txt").read_text().splitlines()
+        + (dataset / "sub" / "b.txt").read_text().splitlines()
+    )
+    results = []
+    ingestor = StreamingIngestor(
+        commit=results.append, chunk_size=2048, max_in_flight=3, workers=workers
+    )
+    stats = ingestor.ingest(dataset)
+
+    assert sorted(committed_lines(results)) == expected
+    assert stats["files"] == 2
+    assert stats["peak_in_flight"] <= 3
+    assert not (dataset / "a.txt").exists()
+    assert not (dataset / "sub" / "b.txt").exists()
+
+
+def test_resumes_after_crash_without_losing_chunks(tmp_path):
+    dataset = tmp_path / "dataset"
+    write_lines(dataset / "big.txt", 1000)
+    expected = (dataset / "big.txt").read_text().splitlines()
+
+    first = []
+
+    def crashing_commit(result):
+        if len(first) == 5:
+            raise RuntimeError("killed")
+        first.append(result)
+
+    options = {"chunk_size": 4096, "max_in_flight": 2, "workers": 0}
+    with pytest.raises(RuntimeError):
+        StreamingIngestor(commit=crashing_commit, **options).ingest(dataset)
+    assert (dataset / "big.txt").exists()
+    assert (dataset / CHECKPOINT_NAME).exists()
+
+    second = []
+    StreamingIngestor(commit=second.append, **options).ingest(dataset)
+
+    assert second[0]["offset"] > 0  # resumed mid-file
+    assert committed_lines(first) + committed_lines(second) == expected
+    assert not (dataset / "big.txt").exists()
+
+
+def test_waits_for_files_still_downloading(tmp_path):
+    dataset = tmp_path / "dataset"
+    write_lines(dataset / "early.txt", 10)
+    (dataset / "late.txt.aria2").write_text("control")
+    write_lines(dataset / "late.txt", 10)
+    finished = threading.Event()
+
+    def finish_download():
+        time.sleep(0.2)
+        os.remove(dataset / "late.txt.aria2")
+        finished.set()
+
+    results = []
+    ingestor = StreamingIngestor(
+        commit=results.append, workers=0, poll_interval=0.02, settle_seconds=3600
+    )
+    thread = threading.Thread(target=finish_download)
+    thread.start()
+    ingestor.ingest(dataset, download_done=finished.is_set)
+    thread.join()
+
+    assert [r["source"] for r in results] == ["early.txt", "late.txt"]
+
+
+def test_punch_hole_releases_committed_blocks(tmp_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(os.urandom(4 << 20))
+    fd = os.open(path, os.O_RDWR)
+    try:
+        if not punch_hole(fd, 0, 2 << 20):
+            pytest.skip("filesystem does not support hole punching")
+    finally:
+        os.close(fd)
+    assert path.stat().st_size == 4 << 20
+    assert path.stat().st_blocks * 512 <= (2 << 20) + 65536
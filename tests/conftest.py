@@ -0,0 +1,9 @@
+"""Shared pytest setup: the experiment and autonomy scripts import flat."""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT / "scripts", ROOT / "scripts" / "autonomy"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
@@ -0,0 +1,137 @@
+"""Adaptive shots: stopping rule, Bonferroni split and shot cap (fixed seeds)."""
+
+import pytest
+
+from paradox_adaptive_shots import (
+    AdaptiveShotPolicy,
+    settled_bucket,
+    wilson_interval,
+)
+
+
+def sampler(probabilities):
+    """Deterministic sample(shots): every round has exactly these proportions."""
+    rounds = []
+
+    def sample(shots):
+        rounds.append(shots)
+        return {state: round(p * shots) for state, p in probabilities.items()}
+
+    sample.rounds = rounds
+    return sample
+
+
+# Dominance sits exactly on the 0.7 threshold: never settles
+UNDECIDED = {"00": 0.7, "01": 0.1, "10": 0.1, "11": 0.1}
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0, 0.05) == (0.0, 1.0)
+    low, high = wilson_interval(80, 100, 0.05)
+    assert low == pytest.approx(0.71117, abs=1e-5)
+    assert high == pytest.approx(0.86663, abs=1e-5)
+    # A smaller per-round alpha widens the interval
+    narrow_low, narrow_high = wilson_interval(80, 100, 0.05 / 10)
+    assert narrow_low < low and narrow_high > high
+
+
+def test_bucket_needs_both_intervals_on_one_side():
+    assert settled_bucket((0.85, 0.95), (0.1, 0.3)) == "superposition"
+    assert settled_bucket((0.2, 0.4), (0.75, 0.9)) == "resolved"
+    assert settled_bucket((0.2, 0.4), (0.4, 0.6)) == "equilibrium"
+    assert settled_bucket((0.75, 0.85), (0.1, 0.3)) is None
+    assert settled_bucket((0.2, 0.4), (0.65, 0.75)) is None
+
+
+@pytest.mark.parametrize(
+    "probabilities, bucket",
+    [
+        ({"00": 1.0}, "resolved"),
+        ({"00": 0.25, "01": 0.25, "10": 0.25, "11": 0.25}, "superposition"),
+        ({"00": 0.5, "11": 0.5}, "equilibrium"),
+    ],
+)
+def test_clear_cases_settle_in_the_first_round(probabilities, bucket):
+    sample = sampler(probabilities)
+    policy = AdaptiveShotPolicy(initial_shots=200, max_shots=4000, seed=7)
+    counts, metrics = policy.run(sample)
+
+    assert sample.rounds == [200]
+    assert sum(counts.values()) == metrics["shots_used"] == 200
+    assert metrics["stop_reason"] == "settled"
+    assert metrics["settled_bucket"] == bucket
+
+
+def test_undecided_runs_to_the_shot_cap_exactly():
+    sample = sampler(UNDECIDED)
+    policy = AdaptiveShotPolicy(
+        initial_shots=100, round_shots=300, max_shots=1000, seed=7
+    )
+    counts, metrics = policy.run(sample)
+
+    # The last round is cut to the remaining budget
+    assert sample.rounds == [100, 300, 300, 300]
+    assert policy.max_rounds == metrics["rounds"] == 4
+    assert sum(counts.values()) == metrics["shots_used"] == 1000
+    assert metrics["stop_reason"] == "shot_budget"
+    assert metrics["settled_bucket"] is None
+
+
+def test_every_round_uses_the_bonferroni_alpha():
+    policy = AdaptiveShotPolicy(
+        initial_shots=100, round_shots=300, max_shots=1000, confidence=0.95
+    )
+    assert policy.round_alpha == pytest.approx(0.05 / 4)
+
+    _, metrics = policy.run(sampler(UNDECIDED))
+    assert metrics["dominant_probability_ci"] == list(
+        wilson_interval(700, 1000, policy.round_alpha)
+    )
+
+
+def test_time_budget_stops_after_the_current_round():
+    sample = sampler(UNDECIDED)
+    _, metrics = AdaptiveShotPolicy(max_seconds=0, seed=7).run(sample)
+    assert sample.rounds == [256]
+    assert metrics["stop_reason"] == "time_budget"
+
+
+def test_bootstrap_is_reproducible_for_a_seed():
+    def entropy_ci(seed):
+        policy = AdaptiveShotPolicy(initial_shots=100, max_shots=300, seed=seed)
+        return policy.run(sampler(UNDECIDED))[1]["entropy_ci"]
+
+    assert entropy_ci(3) == entropy_ci(3)
+    assert entropy_ci(3) != entropy_ci(4)
+
+
+def test_each_round_is_its_own_sampler_job(tmp_path, monkeypatch):
+    pytest.importorskip("qiskit_ibm_runtime")
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    from paradox_circuit_builders import PARADOX_BUILDERS
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    monkeypatch.chdir(tmp_path)
+    with ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=1
+    ) as runner:
+        submit_and_wait = runner._submit_and_wait
+        jobs = []
+
+        def count_jobs(pubs, shots, **kwargs):
+            jobs.append(shots)
+            return submit_and_wait(pubs, shots, **kwargs)
+
+        monkeypatch.setattr(runner, "_submit_and_wait", count_jobs)
+        builder, description = PARADOX_BUILDERS["halting_problem"]
+        policy = AdaptiveShotPolicy(
+            initial_shots=64, round_shots=64, max_shots=192, seed=1
+        )
+        result = runner.run_paradox(
+            "halting_problem", builder, description, adaptive=policy
+        )
+
+    adaptive = result["metrics"]["adaptive"]
+    assert jobs == [64] * adaptive["rounds"]
+    assert result["metrics"]["shots"] == adaptive["shots_used"] == sum(jobs)
@@ -0,0 +1,153 @@
+"""Pipelined executor with simulated queue delays on a fake backend."""
+
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit_ibm_runtime import SamplerV2  # noqa: E402
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2  # noqa: E402
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+NAMES = ["liar_paradox", "schrodinger_cat", "epr_paradox", "halting_problem"]
+
+
+class QueuedJob:
+    """Local job that stays queued for a while and counts as in flight."""
+
+    def __init__(self, job, sampler, queued):
+        self._job = job
+        self._sampler = sampler
+        self._done_at = time.monotonic() + queued
+
+    def job_id(self):
+        return self._job.job_id()
+
+    def in_final_state(self):
+        if time.monotonic() < self._done_at:
+            return False
+        self._sampler.finish(self)
+        return True
+
+    def result(self):
+        return self._job.result()
+
+    def __getattr__(self, name):
+        return getattr(self._job, name)
+
+
+class QueuedSampler:
+    """Sampler factory double recording the peak number of unfinished jobs."""
+
+    def __init__(self, queued=0.5, fail=()):
+        self.queued = queued
+        self.fail = set(fail)
+        self.submitted = 0
+        self.running = set()
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, backend):
+        self._sampler = SamplerV2(mode=backend)
+        return self
+
+    def run(self, pubs, shots):
+        with self._lock:
+            self.submitted += 1
+            if self.submitted in self.fail:
+                raise RuntimeError("queue rejected the job")
+            job = QueuedJob(self._sampler.run(pubs, shots=shots), self, self.queued)
+            self.running.add(job)
+            self.peak = max(self.peak, len(self.running))
+        return job
+
+    def finish(self, job):
+        with self._lock:
+            self.running.discard(job)
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=1
+    )
+
+
+def run(runner, sampler, max_in_flight=2):
+    return runner.run_async(
+        NAMES,
+        shots=64,
+        max_in_flight=max_in_flight,
+        poll_interval=0.001,
+        max_poll_interval=0.005,
+        sampler_factory=sampler,
+    )
+
+
+def test_in_flight_jobs_are_bounded(runner):
+    sampler = QueuedSampler()
+    results = run(runner, sampler)
+    assert [r["paradox"] for r in results] == NAMES
+    assert all("error" not in r for r in results)
+    assert sampler.submitted == len(NAMES)
+    assert sampler.peak == 2
+
+
+def test_a_failed_submission_only_fails_its_paradox(runner):
+    results = run(runner, QueuedSampler(fail={2}), max_in_flight=4)
+    assert [r["paradox"] for r in results] == NAMES
+    assert results[1]["status"] == "FAILED"
+    assert "queue rejected" in results[1]["error"]
+    assert all("error" not in r for r in results[:1] + results[2:])
+    assert len(list(runner.results)) == len(NAMES)
+
+
+def test_build_errors_are_recorded(runner):
+    def broken():
+        raise RuntimeError("cannot build")
+
+    builders = {**PARADOX_BUILDERS, "broken": (broken, "always fails")}
+    results = runner.run_async(
+        ["broken", "liar_paradox"],
+        builders=builders,
+        shots=64,
+        poll_interval=0.001,
+        sampler_factory=QueuedSampler(queued=0),
+    )
+    assert results[0]["status"] == "FAILED"
+    assert results[1]["paradox"] == "liar_paradox"
+    assert "error" not in results[1]
+
+
+def test_results_can_stay_in_the_store(runner):
+    assert runner.run_async(NAMES, shots=64, collect=False) is None
+    streamed = runner.results
+    assert isinstance(streamed, types.GeneratorType)
+    assert sorted(r["paradox"] for r in streamed) == sorted(NAMES)
+
+
+def test_concurrent_writers_share_the_ideal_cache(tmp_path, monkeypatch):
+    import quantum_paradox_runner
+
+    monkeypatch.chdir(tmp_path)
+    runner = ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), compare_ideal=True
+    )
+    # More distinct circuits than cache slots: hits, inserts and evictions
+    # race between the worker threads the executor records results from
+    sizes = range(1, quantum_paradox_runner.IDEAL_CACHE_SIZE + 17)
+    circuits = [
+        PARADOX_BUILDERS.build("halting_problem", program_length=n) for n in sizes
+    ]
+    with ThreadPoolExecutor(8) as pool:
+        tables = list(pool.map(runner._ideal_probabilities, circuits * 4))
+    assert len(tables) == 4 * len(circuits)
+    assert tables[0] == {"00": 0.25, "01": 0.25, "10": 0.25, "11": 0.25}
+    assert len(runner._ideal_cache) == quantum_paradox_runner.IDEAL_CACHE_SIZE
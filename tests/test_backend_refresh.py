@@ -0,0 +1,94 @@
+"""Stale snapshot refresh: fresh calibration swapped in, least_busy revisited."""
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2  # noqa: E402
+
+from paradox_backend_snapshot import BackendSnapshotCache  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+
+class FakeService:
+    """Runtime service double: named backends and a fixed least busy one."""
+
+    def __init__(self, least_busy):
+        self.backends = {"fake_manila": FakeManilaV2(), "fake_lima": FakeLimaV2()}
+        self._least_busy = least_busy
+
+    def backend(self, name):
+        return self.backends[name]
+
+    def least_busy(self, **filters):
+        return self.backends[self._least_busy]
+
+
+def connect_stale(tmp_path, monkeypatch, least_busy):
+    monkeypatch.chdir(tmp_path)
+    cache = BackendSnapshotCache(tmp_path / "snapshots", ttl=0)
+    stale = cache.save(FakeManilaV2())
+    runner = ParadoxExperimentRunner(ibm_token="token", snapshot_cache=cache)
+    service = FakeService(least_busy)
+    monkeypatch.setattr(runner, "_connect_service", lambda: service)
+
+    runner.connect_ibm()
+    cache._refreshing.join(30)
+    return runner, cache, stale, service
+
+
+def test_refreshed_snapshot_replaces_the_stale_one(tmp_path, monkeypatch):
+    runner, cache, stale, service = connect_stale(
+        tmp_path, monkeypatch, least_busy="fake_manila"
+    )
+    # Queued by the refresh thread; swapped in by the runner thread
+    loaded = runner.backend
+    assert runner._pending_refresh is not None
+    runner._apply_snapshot_refresh()
+    assert runner.backend is not loaded
+    assert runner.backend.name == "fake_manila"
+    assert runner.backend.saved_at >= stale.saved_at
+    assert runner._execution_backend() is service.backends["fake_manila"]
+    assert cache.load().name == "fake_manila"
+
+
+def test_less_busy_backend_is_used_from_the_next_start(tmp_path, monkeypatch):
+    runner, cache, _, _ = connect_stale(tmp_path, monkeypatch, least_busy="fake_lima")
+    # This run keeps its device; the next one starts on the less busy one
+    assert runner.backend.name == "fake_manila"
+    assert cache.load().name == "fake_lima"
+
+
+def test_a_paradox_keeps_the_calibration_it_started_with(tmp_path, monkeypatch):
+    from paradox_circuit_builders import PARADOX_BUILDERS
+
+    runner, cache, _, service = connect_stale(
+        tmp_path, monkeypatch, least_busy="fake_manila"
+    )
+    fresh = runner._pending_refresh[1]
+    transpile, submit = runner._transpile, runner._submit_and_wait
+    seen = {"transpile": [], "submit": []}
+
+    def transpile_then_refresh(qc):
+        seen["transpile"].append(runner.backend)
+        if len(seen["transpile"]) == 1:
+            # A second refresh lands while the first paradox is running
+            runner._on_snapshot_refresh(
+                service.backends["fake_manila"], cache.save(FakeManilaV2())
+            )
+        return transpile(qc)
+
+    def watch_submit(*args, **kwargs):
+        seen["submit"].append(runner.backend)
+        return submit(*args, **kwargs)
+
+    monkeypatch.setattr(runner, "_transpile", transpile_then_refresh)
+    monkeypatch.setattr(runner, "_submit_and_wait", watch_submit)
+    for name in ("liar_paradox", "epr_paradox"):
+        builder, description = PARADOX_BUILDERS[name]
+        result = runner.run_paradox(name, builder, description, shots=64)
+        assert "error" not in result
+
+    newer = seen["transpile"][1]
+    assert seen["transpile"][0] is fresh and seen["submit"][0] is fresh
+    assert newer is not fresh and seen["submit"][1] is newer
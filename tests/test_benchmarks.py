@@ -0,0 +1,75 @@
+"""Benchmark harness: regression compare, scaling fit and baseline files."""
+
+import json
+
+import pytest
+
+from paradox_benchmarks import (
+    SCHEMA_VERSION,
+    compare,
+    load,
+    main,
+    run_suite,
+    save,
+    scaling_exponent,
+)
+
+
+def document(**seconds):
+    return {
+        "schema": SCHEMA_VERSION,
+        "environment": {"python": "3.x"},
+        "results": {
+            name: {"group": "build", "min_seconds": value}
+            for name, value in seconds.items()
+        },
+    }
+
+
+def test_compare_classifies_every_case():
+    baseline = document(slow=0.010, fast=0.010, same=0.010, tiny=0.0001, gone=1.0)
+    current = document(slow=0.020, fast=0.004, same=0.011, tiny=0.0003, added=1.0)
+    status = {row["name"]: row["status"] for row in compare(baseline, current)}
+    assert status == {
+        "slow": "regression",
+        "fast": "improved",
+        "same": "ok",
+        # 3x slower, but below the noise floor
+        "tiny": "ok",
+        "gone": "missing",
+        "added": "new",
+    }
+
+
+def test_compare_exit_code_gates_on_regressions(tmp_path, capsys):
+    baseline = save(document(case=0.010), tmp_path / "baseline.json")
+    slower = save(document(case=0.020), tmp_path / "slower.json")
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert main(["compare", str(baseline), str(slower)]) == 1
+    assert main(["compare", str(baseline), str(slower), "--threshold", "1.5"]) == 0
+    assert "regressions=1" in capsys.readouterr().out
+
+
+def test_scaling_exponent():
+    sizes = [256, 1024, 4096, 16384]
+    assert scaling_exponent(sizes, [n * 1e-6 for n in sizes]) == pytest.approx(1.0)
+    assert scaling_exponent(sizes, [n * n * 1e-9 for n in sizes]) == pytest.approx(2.0)
+
+
+def test_baselines_round_trip_and_check_the_schema(tmp_path):
+    path = save(document(case=0.5), tmp_path / "nested" / "baseline.json")
+    assert load(path)["results"]["case"]["min_seconds"] == 0.5
+
+    path.write_text(json.dumps({**document(), "schema": SCHEMA_VERSION + 1}))
+    with pytest.raises(ValueError, match="schema"):
+        load(path)
+
+
+def test_run_suite_times_the_selected_cases():
+    result = run_suite(["build"], quick=True, repeat=2, match="liar_paradox")
+    assert result["schema"] == SCHEMA_VERSION and result["quick"]
+    assert result["results"]
+    for name, timing in result["results"].items():
+        assert "liar_paradox" in name and timing["group"] == "build"
+        assert 0 < timing["min_seconds"] <= timing["median_seconds"]
+        assert timing["repeat"] == 2
@@ -0,0 +1,75 @@
+"""PARADOX_BUILDERS: template builds match direct builds, reuse templates, scale."""
+
+import pytest
+
+pytest.importorskip("qiskit")
+
+from paradox_circuit_builders import PARADOX_BUILDERS, ParadoxRegistry  # noqa: E402
+
+CASES = [
+    ("collatz_conjecture", {"n": 7}),
+    ("collatz_conjecture", {"n": 27, "max_steps": 40}),
+    ("collatz_conjecture", {"n": 10**6, "max_steps": 500}),
+    ("halting_problem", {"program_length": 0}),
+    ("halting_problem", {"program_length": 256}),
+]
+
+
+def direct(name, params):
+    spec = PARADOX_BUILDERS.spec(name)
+    return spec.builder(**{**spec.params, **params})
+
+
+@pytest.mark.parametrize("name,params", CASES)
+def test_template_build_matches_direct_build(name, params):
+    assert PARADOX_BUILDERS.build(name, **params) == direct(name, params)
+
+
+def test_template_builds_are_independent_copies():
+    first = PARADOX_BUILDERS.build("collatz_conjecture", n=5)
+    first.x(0)
+    second = PARADOX_BUILDERS.build("collatz_conjecture", n=5)
+    assert second == direct("collatz_conjecture", {"n": 5})
+
+
+def test_values_sharing_a_skeleton_reuse_one_template():
+    spec = PARADOX_BUILDERS.spec("collatz_conjecture")
+    skeletons = []
+
+    def counting_skeleton(*key):
+        skeletons.append(key)
+        return spec.skeleton(*key)
+
+    registry = ParadoxRegistry()
+    registry.register(
+        "collatz_conjecture",
+        spec.builder,
+        spec.description,
+        spec.params,
+        layout=spec.layout,
+        skeleton=counting_skeleton,
+    )
+    # Same register width: one skeleton, every other build is a cache hit
+    values = [10**6 + i for i in range(8)]
+    circuits = [
+        registry.build("collatz_conjecture", n=n, max_steps=500) for n in values
+    ]
+
+    assert len(skeletons) == 1
+    assert registry.cache_info()["hits"] == len(values) - 1
+    for n, circuit in zip(values, circuits):
+        assert circuit == direct("collatz_conjecture", {"n": n, "max_steps": 500})
+
+
+def test_circuit_construction_scales_linearly():
+    from paradox_benchmarks import check_scaling
+
+    # 1.0 is linear; the margin absorbs timing noise, a quadratic builder
+    # would fit close to 2
+    rows = check_scaling(max_exponent=1.3, sizes=(256, 1024, 4096), repeat=3)
+    assert {row["paradox"] for row in rows} == {
+        "halting_problem",
+        "collatz_conjecture",
+    }
+    for row in rows:
+        assert row["linear"], f"{row['paradox']}: exponent {row['exponent']:.2f}"
@@ -0,0 +1,53 @@
+"""SparseCounts: JSON round trip, vectorized analysis, width checks."""
+
+import math
+
+import numpy as np
+import pytest
+
+from paradox_counts import SparseCounts
+
+COUNTS = {"00": 480, "11": 520, "01": 24}
+
+
+def test_round_trips_the_quantum_result_schema():
+    sparse = SparseCounts.from_dict(COUNTS)
+    assert sparse.to_dict() == COUNTS
+    assert sparse.shots == 1024
+    assert SparseCounts.from_json(sparse.to_json()).to_dict() == COUNTS
+    assert sparse.to_json()["distribution"]["11"] == pytest.approx(520 / 1024)
+
+
+def test_wide_registers_use_several_words():
+    wide = "1" + "0" * 98 + "1"
+    sparse = SparseCounts.from_dict({wide: 3, "0" * 100: 1})
+    assert sparse.keys.shape[1] == 2
+    assert sparse.to_dict() == {"0" * 100: 1, wide: 3}
+
+
+def test_analysis_matches_the_definitions():
+    sparse = SparseCounts.from_dict(COUNTS)
+    p = np.array([480, 24, 520]) / 1024
+    assert sparse.entropy() == pytest.approx(-(p * np.log2(p)).sum())
+    assert sparse.entropy(normalized=True) == pytest.approx(sparse.entropy() / 2)
+    assert sparse.top_k(1) == [("11", 520)]
+    assert sparse.marginal([0]).to_dict() == {"0": 480, "1": 544}
+
+    ideal = {"00": 0.5, "11": 0.5}
+    assert sparse.tvd(ideal) == pytest.approx(32 / 1024)
+    assert sparse.tvd(sparse) == 0.0
+    assert sparse.hellinger(ideal) == pytest.approx(
+        math.sqrt(
+            1 - sum(math.sqrt(p * 0.5) for p in (480 / 1024, 520 / 1024))
+        )
+    )
+    assert set(sparse.distances(ideal)) >= {"tvd", "hellinger"}
+
+
+def test_width_mismatch_is_reported_clearly():
+    with pytest.raises(ValueError, match="Register width mismatch"):
+        SparseCounts.from_dict({"00": 1, "011": 2})
+    with pytest.raises(ValueError, match="Register width mismatch"):
+        SparseCounts.from_dict(COUNTS).tvd({"000": 1.0})
+    with pytest.raises(ValueError, match="Register width mismatch"):
+        SparseCounts.from_dict(COUNTS).tvd(SparseCounts.from_dict({"000": 1}))
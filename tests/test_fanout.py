@@ -0,0 +1,60 @@
+"""Multi-backend fan-out on local fake backends."""
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2  # noqa: E402
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_fanout import backend_labels  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ParadoxExperimentRunner(ibm_token="", transpile_workers=1)
+
+
+def test_labels_are_unique():
+    backends = [FakeManilaV2(), "ibm_fez", FakeManilaV2(), FakeManilaV2()]
+    assert backend_labels(backends) == [
+        "fake_manila",
+        "ibm_fez",
+        "fake_manila#2",
+        "fake_manila#3",
+    ]
+
+
+def test_duplicate_backends_keep_their_own_entries(runner):
+    records = runner.run_fanout(
+        [FakeManilaV2(), FakeLimaV2(), FakeManilaV2()], ["epr_paradox"], shots=128
+    )
+    entries = records[0]["backends"]
+    assert set(entries) == {"fake_manila", "fake_lima", "fake_manila#2"}
+    assert all(entry["status"] == "completed" for entry in entries.values())
+    assert len(records[0]["cross_backend"]) == 3
+
+
+def test_failures_stay_local(runner):
+    def broken():
+        raise RuntimeError("cannot build")
+
+    builders = {**PARADOX_BUILDERS, "broken": (broken, "always fails")}
+    # A backend name needs the IBM service, which has no token here
+    records = runner.run_fanout(
+        [FakeManilaV2(), "ibm_nowhere"],
+        ["liar_paradox", "broken", "schrodinger_cat"],
+        builders=builders,
+        shots=64,
+    )
+    assert [r["paradox"] for r in records] == [
+        "liar_paradox",
+        "broken",
+        "schrodinger_cat",
+    ]
+    assert records[1]["status"] == "FAILED"
+    for record in (records[0], records[2]):
+        assert record["backends"]["fake_manila"]["status"] == "completed"
+        assert record["backends"]["ibm_nowhere"]["status"] == "failed"
@@ -0,0 +1,120 @@
+"""History index: UTC timestamps and emulated runs kept apart from hardware."""
+
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from paradox_history_index import HistoryIndex, _iso
+
+
+@pytest.fixture
+def utc_plus_two():
+    """Run in a fixed local time zone two hours ahead of UTC."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "EET-2"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+def test_iso_normalizes_every_form_to_utc(utc_plus_two):
+    expected = "2025-11-20T12:00:00.000000+00:00"
+    instant = datetime(2025, 11, 20, 12, tzinfo=timezone.utc)
+    assert _iso("2025-11-20T14:00:00") == expected  # naive = local time
+    assert _iso("2025-11-20T12:00:00Z") == expected
+    assert _iso("2025-11-20T13:00:00+01:00") == expected
+    assert _iso(instant.timestamp()) == expected
+    assert _iso(instant) == expected
+    assert _iso("not a date") == "not a date"
+
+
+def write_result(path, paradox, timestamp, **fields):
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        json.dumps(
+            {
+                "timestamp": timestamp,
+                "paradox": paradox,
+                "backend": {"name": "ibm_torino"},
+                "quantum_result": {"counts": {"00": 10, "11": 6}},
+                **fields,
+            }
+        )
+    )
+
+
+def test_mixed_sources_sort_and_filter_as_utc(tmp_path, utc_plus_two):
+    published = tmp_path / "quantum_paradoxes"
+    write_result(published / "a" / "result_sanitized.json", "A", "2025-11-20T13:30:00")
+    write_result(
+        published / "b" / "result_sanitized.json", "B", "2025-11-20T11:45:00+00:00"
+    )
+
+    index = HistoryIndex(tmp_path / "index.sqlite", repo_root=tmp_path)
+    try:
+        index.scan()
+        rows = index.query()
+        # A is 11:30 UTC, so it comes before B
+        assert [row["paradox"] for row in rows] == ["A", "B"]
+        since = datetime(2025, 11, 20, 11, 40, tzinfo=timezone.utc)
+        assert [row["paradox"] for row in index.query(since=since)] == ["B"]
+        assert [
+            row["paradox"] for row in index.query(until=since + timedelta(hours=1))
+        ] == ["A", "B"]
+    finally:
+        index.close()
+
+
+def test_indexes_from_before_normalization_are_rebuilt(tmp_path):
+    db = tmp_path / "index.sqlite"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE files (path TEXT, stale INTEGER)")
+    index = HistoryIndex(db, repo_root=tmp_path)
+    try:
+        columns = [row[1] for row in index.conn.execute("PRAGMA table_info(files)")]
+        assert "sha256" in columns
+    finally:
+        index.close()
+
+
+def test_emulated_runs_are_left_out_unless_asked_for(tmp_path):
+    published = tmp_path / "quantum_paradoxes"
+    write_result(published / "real" / "result_sanitized.json", "A", "2025-11-20")
+    write_result(
+        published / "emulated" / "result_sanitized.json",
+        "A",
+        "2025-11-21",
+        emulated=True,
+        emulator={"backend": "ibm_torino", "seed": 1},
+    )
+
+    index = HistoryIndex(tmp_path / "index.sqlite", repo_root=tmp_path)
+    try:
+        index.scan()
+        rows = index.query(backend="ibm_torino")
+        assert [row["emulated"] for row in rows] == [0]
+        rows = index.query(backend="ibm_torino", include_emulated=True)
+        assert [row["emulated"] for row in rows] == [0, 1]
+    finally:
+        index.close()
+
+
+def test_indexes_without_the_emulated_flag_are_rebuilt(tmp_path):
+    db = tmp_path / "index.sqlite"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY, paradox TEXT)")
+        conn.execute("PRAGMA user_version = 1")
+    index = HistoryIndex(db, repo_root=tmp_path)
+    try:
+        columns = [row[1] for row in index.conn.execute("PRAGMA table_info(runs)")]
+        assert "emulated" in columns
+    finally:
+        index.close()
@@ -0,0 +1,68 @@
+"""Opt-in ideal-distance comparison: Clifford only, bounded, cached."""
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+import paradox_ideal_simulator  # noqa: E402
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_counts import SparseCounts  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+COUNTS = SparseCounts.from_dict({"00": 480, "11": 520, "01": 24})
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    monkeypatch.chdir(tmp_path)
+
+    def make(**options):
+        return ParadoxExperimentRunner(
+            ibm_token="", backend=FakeManilaV2(), **options
+        )
+
+    return make
+
+
+@pytest.fixture
+def ideal_calls(monkeypatch):
+    calls = []
+    original = paradox_ideal_simulator.ideal_distribution
+
+    def counting(circuit, *args, **kwargs):
+        calls.append(circuit.name)
+        return original(circuit, *args, **kwargs)
+
+    monkeypatch.setattr(paradox_ideal_simulator, "ideal_distribution", counting)
+    return calls
+
+
+def test_off_by_default(runner, ideal_calls):
+    circuit = PARADOX_BUILDERS.build("epr_paradox")
+    assert runner()._ideal_distances(circuit, COUNTS) == {}
+    assert ideal_calls == []
+
+
+def test_computed_once_per_circuit(runner, ideal_calls):
+    comparing = runner(compare_ideal=True)
+    for _ in range(3):  # e.g. three fan-out backends
+        distances = comparing._ideal_distances(
+            PARADOX_BUILDERS.build("epr_paradox"), COUNTS
+        )
+        assert set(distances) == {"tvd", "hellinger", "kl_divergence"}
+    assert ideal_calls == ["epr_paradox"]
+
+
+def test_skips_non_clifford_and_large_supports(runner, ideal_calls):
+    comparing = runner(compare_ideal=True)
+    circuit = PARADOX_BUILDERS.build("epr_paradox")
+    circuit.t(0)
+    assert comparing._ideal_distances(circuit, COUNTS) == {}
+    assert ideal_calls == []
+
+    wide = PARADOX_BUILDERS.build("halting_problem", program_length=20)
+    assert comparing._ideal_distances(wide, COUNTS) == {}
+    assert comparing._ideal_distances(wide, COUNTS) == {}
+    assert ideal_calls == ["halting_problem"]
@@ -0,0 +1,81 @@
+"""Exact ideal simulator: stabilizer fast path against a dense statevector."""
+
+import math
+
+import pytest
+
+pytest.importorskip("qiskit")
+
+from qiskit import QuantumCircuit  # noqa: E402
+from qiskit.quantum_info import Statevector  # noqa: E402
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_ideal_simulator import (  # noqa: E402
+    AffineDistribution,
+    DenseDistribution,
+    IdealDistribution,
+    ideal_distribution,
+    is_clifford_circuit,
+)
+
+
+def statevector_probabilities(circuit):
+    probabilities = Statevector(
+        circuit.remove_final_measurements(inplace=False)
+    ).probabilities_dict()
+    return {state: p for state, p in probabilities.items() if p > 1e-12}
+
+
+def test_distributions_are_abstract():
+    with pytest.raises(TypeError):
+        IdealDistribution(2)
+
+
+@pytest.mark.parametrize("name", list(PARADOX_BUILDERS))
+def test_stabilizer_path_matches_the_statevector(name):
+    circuit = PARADOX_BUILDERS.build(name)
+    assert is_clifford_circuit(circuit)
+    distribution = ideal_distribution(circuit)
+    assert isinstance(distribution, AffineDistribution)
+
+    exact = distribution.probabilities()
+    expected = statevector_probabilities(circuit)
+    assert exact.keys() == expected.keys()
+    assert all(math.isclose(exact[s], expected[s]) for s in expected)
+
+
+def test_non_clifford_falls_back_to_the_statevector():
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.t(0)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    distribution = ideal_distribution(circuit)
+    assert isinstance(distribution, DenseDistribution)
+    exact = distribution.probabilities()
+    expected = statevector_probabilities(circuit)
+    assert all(math.isclose(exact[s], expected[s]) for s in expected)
+
+
+def test_large_circuits_sample_reproducibly():
+    circuit = PARADOX_BUILDERS.build("halting_problem", program_length=500)
+    distribution = ideal_distribution(circuit)
+    with pytest.raises(ValueError):
+        distribution.probabilities()
+    first = distribution.sample(2000, seed=7)
+    assert sum(first.values()) == 2000
+    assert all(len(state) == 501 for state in first)
+    assert distribution.sample(2000, seed=7) == first
+
+
+def test_run_ideal_needs_no_backend(tmp_path, monkeypatch):
+    pytest.importorskip("qiskit_ibm_runtime")
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    monkeypatch.chdir(tmp_path)
+    runner = ParadoxExperimentRunner(ibm_token="")
+    results = runner.run_ideal(["epr_paradox"], shots=1000, seed=1)
+    counts = results[0]["quantum_result"]["counts"]
+    assert set(counts) == {"00", "11"}
+    assert sum(counts.values()) == 1000
@@ -0,0 +1,135 @@
+"""Job journal: a crash between fetching and recording a result never pays twice."""
+
+import json
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit_ibm_runtime.fake_provider import FakeLimaV2, FakeManilaV2  # noqa: E402
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_fanout import MultiBackendFanout  # noqa: E402
+from paradox_job_journal import JobJournal  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+
+class FakeService:
+    """Runtime service double that hands back jobs of an earlier process."""
+
+    def __init__(self, jobs):
+        self.jobs = {job.job_id(): job for job in jobs}
+        self.backends = {"fake_manila": FakeManilaV2(), "fake_lima": FakeLimaV2()}
+
+    def job(self, job_id):
+        return self.jobs[job_id]
+
+    def backend(self, name):
+        return self.backends[name]
+
+
+def make_runner(journal_path, jobs=None, backend=None):
+    runner = ParadoxExperimentRunner(
+        ibm_token="",
+        backend=backend or FakeManilaV2(),
+        journal=JobJournal(journal_path),
+        transpile_workers=1,
+    )
+    runner.service = FakeService(jobs or [])
+    return runner
+
+
+def events(journal_path, name):
+    with open(journal_path) as f:
+        return [e for e in map(json.loads, f) if e["event"] == name]
+
+
+@pytest.fixture
+def journal_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "private" / "job_journal.jsonl"
+
+
+def crash_before_recording(runner, monkeypatch, submitted):
+    """Let jobs be submitted and finish, then die before any result is written."""
+    submit = runner._submit
+
+    def capture(*args, **kwargs):
+        job, seconds = submit(*args, **kwargs)
+        submitted.append(job)
+        return job, seconds
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(runner, "_submit", capture)
+    monkeypatch.setattr(runner, "_record_result", crash)
+    monkeypatch.setattr(MultiBackendFanout, "_aggregate", crash)
+
+
+def run(runner, method):
+    if method == "paradox":
+        builder, description = PARADOX_BUILDERS["liar_paradox"]
+        return [runner.run_paradox("liar_paradox", builder, description, shots=64)]
+    if method == "batch":
+        return runner.run_batch(["liar_paradox", "epr_paradox"], shots=64)
+    if method == "async":
+        return runner.run_async(["liar_paradox"], shots=64)
+    return runner.run_fanout(["fake_manila", "fake_lima"], ["liar_paradox"], shots=64)
+
+
+@pytest.mark.parametrize("method", ["paradox", "batch", "async", "fanout"])
+def test_fetched_but_unrecorded_jobs_are_reattached(
+    journal_path, monkeypatch, method
+):
+    runner = make_runner(journal_path)
+    submitted = []
+    with monkeypatch.context() as patches:
+        crash_before_recording(runner, patches, submitted)
+        with pytest.raises(KeyboardInterrupt):
+            run(runner, method)
+    runner.journal.close()
+
+    assert events(journal_path, "completed") == []
+    pending = JobJournal(journal_path).pending_jobs()
+    assert len(pending) == len(submitted) == (2 if method == "fanout" else 1)
+
+    resumed = make_runner(journal_path, jobs=submitted)
+    results = resumed.resume()
+    resumed.journal.close()
+
+    assert results and all("error" not in result for result in results)
+    # Re-attached, not submitted (and paid for) again
+    assert len(events(journal_path, "submitted")) == len(submitted)
+    assert {e["job_id"] for e in events(journal_path, "completed")} == {
+        job.job_id() for job in submitted
+    }
+    assert JobJournal(journal_path).unfinished() == []
+
+
+def test_resume_on_another_backend_finishes_the_run(journal_path, monkeypatch):
+    runner = make_runner(journal_path)
+    with monkeypatch.context() as patches:
+        crash_before_recording(runner, patches, [])
+        with pytest.raises(KeyboardInterrupt):
+            run(runner, "batch")
+    runner.journal.close()
+
+    resumed = make_runner(journal_path, backend=FakeLimaV2())
+    results = resumed.resume()
+    resumed.journal.close()
+
+    assert [r["backend"]["name"] for r in results] == ["fake_lima", "fake_lima"]
+    assert {e["backend"] for e in events(journal_path, "recorded")} == {"fake_lima"}
+    assert JobJournal(journal_path).unfinished() == []
+
+
+def test_completed_after_results_are_recorded(journal_path):
+    runner = make_runner(journal_path)
+    runner.run_batch(["liar_paradox", "schrodinger_cat"], shots=64)
+    runner.journal.close()
+
+    with open(journal_path) as f:
+        order = [e["event"] for e in map(json.loads, f)]
+    assert order[-3:] == ["recorded", "recorded", "completed"]
+    assert JobJournal(journal_path).pending_jobs() == []
@@ -0,0 +1,112 @@
+"""Circuit multiplexer on fake backends: placement, guard bands, demultiplexing."""
+
+from collections import deque
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit import QuantumCircuit  # noqa: E402
+from qiskit_ibm_runtime.fake_provider import (  # noqa: E402
+    FakeGuadalupeV2,
+    FakeManilaV2,
+)
+
+from paradox_multiplexer import CircuitMultiplexer, Frame, Slot  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+
+def marked(bits):
+    """A circuit that always measures ``bits`` (clbit 0 = rightmost)."""
+    qc = QuantumCircuit(len(bits), len(bits))
+    for q, bit in enumerate(reversed(bits)):
+        if bit == "1":
+            qc.x(q)
+    # Entangled, so the region must really be connected
+    for q in range(len(bits) - 1):
+        qc.cx(q, q + 1)
+        qc.cx(q, q + 1)
+    qc.measure(range(len(bits)), range(len(bits)))
+    return qc
+
+
+def distances(multiplexer, sources):
+    """Coupling-map hops from the nearest qubit in ``sources``."""
+    hops = {q: 0 for q in sources}
+    frontier = deque(sources)
+    while frontier:
+        q = frontier.popleft()
+        for n in multiplexer.neighbors[q]:
+            if n not in hops:
+                hops[n] = hops[q] + 1
+                frontier.append(n)
+    return hops
+
+
+@pytest.mark.parametrize("guard", [0, 1, 2])
+def test_regions_are_disjoint_and_guarded(guard):
+    multiplexer = CircuitMultiplexer(FakeGuadalupeV2(), guard=guard)
+    circuits = [marked("01"), marked("101"), marked("11"), marked("1")] * 2
+    frames = multiplexer.pack(circuits)
+
+    placed = sorted(slot.index for frame in frames for slot in frame.slots)
+    assert placed == list(range(len(circuits)))
+    for frame in frames:
+        regions = [slot.region for slot in frame.slots]
+        used = {
+            frame.circuit.find_bit(q).index
+            for instruction in frame.circuit.data
+            for q in instruction.qubits
+        }
+        assert used <= {q for region in regions for q in region}
+        for slot in frame.slots:
+            assert len(slot.region) == circuits[slot.index].num_qubits
+            hops = distances(multiplexer, slot.region)
+            for other in regions:
+                if other != slot.region:
+                    # No qubit of another region inside this guard band
+                    assert min(hops[q] for q in other) > guard
+
+
+def test_guard_band_spills_into_another_frame():
+    # Manila is a line of five qubits: 2 + 1 guard + 2 fits, 2 + 2 + 2 does not
+    circuits = [marked("11"), marked("11")]
+    assert len(CircuitMultiplexer(FakeManilaV2(), guard=1).pack(circuits)) == 1
+    assert len(CircuitMultiplexer(FakeManilaV2(), guard=2).pack(circuits)) == 2
+
+
+def test_too_wide_a_circuit_is_rejected():
+    with pytest.raises(ValueError, match="does not fit"):
+        CircuitMultiplexer(FakeManilaV2()).pack([marked("101101")])
+
+
+def test_demultiplex_splits_the_register_by_slot():
+    frame = Frame(None, [Slot(1, (4, 5), 0, 2), Slot(0, (0, 1, 2), 2, 3)])
+    counts = {"10101": 7, "10110": 3}
+    assert CircuitMultiplexer.demultiplex(frame, counts) == {
+        1: {"01": 7, "10": 3},
+        0: {"101": 10},
+    }
+
+
+def test_each_paradox_gets_its_own_counts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    expected = {"a": "01", "b": "110", "c": "1", "d": "10"}
+    builders = {
+        name: (lambda bits=bits: marked(bits), f"always {bits}")
+        for name, bits in expected.items()
+    }
+    with ParadoxExperimentRunner(
+        ibm_token="", backend=FakeGuadalupeV2(), transpile_workers=1
+    ) as runner:
+        results = runner.run_multiplexed(
+            list(expected), builders=builders, shots=200, repetitions=2
+        )
+
+    assert [r["paradox"] for r in results] == list(expected)
+    for result in results:
+        counts = result["quantum_result"]["counts"]
+        assert sum(counts.values()) == 400
+        # Noisy fake backend: the marked outcome still dominates
+        assert max(counts, key=counts.get) == expected[result["paradox"]]
+        assert len(result["metrics"]["multiplexed"]["regions"]) == 2
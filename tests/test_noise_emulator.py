@@ -0,0 +1,95 @@
+"""Noise emulator: worker-independent seeding, calibration cache, flagged results."""
+
+import json
+
+import pytest
+
+pytest.importorskip("qiskit_aer")
+pytest.importorskip("qiskit_ibm_runtime")
+
+from qiskit import transpile  # noqa: E402
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2  # noqa: E402
+
+import paradox_noise_emulator  # noqa: E402
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_noise_emulator import NoiseEmulator  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    """Counts noise-model compilations; starts without in-memory models."""
+    calls = []
+    compile_calibration = paradox_noise_emulator.compile_calibration
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return compile_calibration(*args, **kwargs)
+
+    monkeypatch.setattr(paradox_noise_emulator, "_calibrations", {})
+    monkeypatch.setattr(paradox_noise_emulator, "compile_calibration", counting)
+    return calls
+
+
+def sample(emulator, circuit, shots=512):
+    with emulator:
+        data = emulator.run([circuit], shots=shots).result()[0].data
+    return getattr(data, circuit.cregs[0].name).get_counts()
+
+
+def epr_circuit(backend):
+    qc = PARADOX_BUILDERS.build("epr_paradox")
+    return transpile(qc, backend, optimization_level=1, seed_transpiler=1)
+
+
+def test_counts_do_not_depend_on_the_worker_count(tmp_path, compiled):
+    backend = FakeManilaV2()
+    circuit = epr_circuit(backend)
+    options = {"seed": 11, "shard_shots": 128}
+
+    inline = sample(
+        NoiseEmulator(backend, max_workers=1, cache_dir=tmp_path / "a", **options),
+        circuit,
+    )
+    # Another cache directory: its workers must find a model file there too
+    pooled = sample(
+        NoiseEmulator(backend, max_workers=2, cache_dir=tmp_path / "b", **options),
+        circuit,
+    )
+    assert pooled == inline
+    assert sum(inline.values()) == 512
+    assert len(list((tmp_path / "b").glob("*.pkl"))) == 1
+
+
+def test_second_emulator_hits_the_disk_cache(tmp_path, compiled, monkeypatch):
+    backend = FakeManilaV2()
+    first = NoiseEmulator(backend, max_workers=1, cache_dir=tmp_path)
+    first.calibration
+    assert len(compiled) == 1
+
+    # A new process: nothing in memory, the pickle is loaded
+    monkeypatch.setattr(paradox_noise_emulator, "_calibrations", {})
+    second = NoiseEmulator(backend, max_workers=1, cache_dir=tmp_path)
+    assert second.calibration.keys() == first.calibration.keys()
+    assert len(compiled) == 1
+    # Other noise options are another model
+    NoiseEmulator(backend, cache_dir=tmp_path, readout_error=False).calibration
+    assert len(compiled) == 2
+
+
+def test_emulated_results_are_flagged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emulator = NoiseEmulator(FakeManilaV2(), seed=5, max_workers=1)
+    with ParadoxExperimentRunner(
+        ibm_token="", emulator=emulator, transpile_workers=1
+    ) as runner:
+        builder, description = PARADOX_BUILDERS["liar_paradox"]
+        runner.run_paradox("liar_paradox", builder, description, shots=128)
+        path = runner.output_dir / "liar_paradox" / "result_sanitized.json"
+
+    with open(path) as f:
+        result = json.load(f)
+    assert result["emulated"] is True
+    assert result["emulator"]["seed"] == 5
+    assert result["emulator"]["backend"] == "fake_manila"
+    assert sum(result["quantum_result"]["counts"].values()) == 128
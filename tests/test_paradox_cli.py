@@ -0,0 +1,94 @@
+"""paradox_cli: bundle, fast list/dry-run and report against a fake backend."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+import paradox_cli  # noqa: E402
+from paradox_backend_snapshot import BackendSnapshotCache  # noqa: E402
+from paradox_circuit_bundle import CircuitBundle  # noqa: E402
+from paradox_result_store import ResultStore  # noqa: E402
+
+CLI = Path(paradox_cli.__file__)
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Working directory with a FakeManilaV2 snapshot and a built bundle."""
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    monkeypatch.chdir(tmp_path)
+    BackendSnapshotCache().save(FakeManilaV2())
+    assert paradox_cli.main(["build"]) == 0
+    return tmp_path
+
+
+def test_bundle_round_trip(workspace):
+    bundle = CircuitBundle(workspace / "results/circuit_bundle")
+    assert bundle.is_current()
+    builders = bundle.builders()
+    assert [entry["name"] for entry in bundle.entries] == list(builders)
+    circuit = builders["liar_paradox"][0]()
+    assert circuit.num_qubits == bundle.entries[0]["num_qubits"]
+
+
+def test_bundle_is_stale_when_manifest_changes(workspace):
+    path = workspace / "results/circuit_bundle/manifest.json"
+    manifest = json.loads(path.read_text())
+    manifest["builders_digest"] = "outdated"
+    path.write_text(json.dumps(manifest))
+    assert CircuitBundle(path.parent).stale_reason() == (
+        "paradox_circuit_builders.py changed"
+    )
+
+
+def test_dry_run_uses_the_cache_the_second_time(workspace, capsys):
+    bundle = CircuitBundle(workspace / "results/circuit_bundle")
+    names = [entry["name"] for entry in bundle.entries]
+    assert paradox_cli.plan_from_cache(bundle, names) is None
+
+    assert paradox_cli.main(["dry-run", "--offline"]) == 0
+    plan = paradox_cli.plan_from_cache(bundle, names)
+    assert [row["paradox"] for row in plan] == names
+    assert all(row["transpile_cache_hit"] for row in plan)
+
+    capsys.readouterr()
+    assert paradox_cli.main(["dry-run", "--offline", "-p", "epr_paradox"]) == 0
+    assert "epr_paradox" in capsys.readouterr().out
+    assert not list((workspace / "results").glob("run_*"))
+
+
+def test_list_does_not_import_qiskit(workspace):
+    probe = (
+        "import runpy, sys; sys.argv = ['paradox_cli.py', 'list'];\n"
+        "try:\n"
+        f"    runpy.run_path({str(CLI)!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('QISKIT' if 'qiskit' in sys.modules else 'NO-QISKIT')"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=workspace,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "liar_paradox" in result.stdout
+    assert result.stdout.strip().endswith("NO-QISKIT")
+
+
+def test_report_streams_the_latest_run(workspace, capsys):
+    store = ResultStore(workspace / "results/run_20260101_000000/stream")
+    store.append({"paradox": "liar_paradox", "error": "backend offline"})
+    store.close()
+
+    assert paradox_cli.main(["report"]) == 0
+    out = capsys.readouterr().out
+    assert "❌ liar_paradox: backend offline" in out
+    assert "1 results in" in out
@@ -0,0 +1,133 @@
+"""Readout mitigation: dense vs sparse solver, projection, suite calibration."""
+
+from functools import reduce
+
+import numpy as np
+import pytest
+
+from paradox_counts import SparseCounts
+from paradox_readout_mitigation import (
+    ReadoutMitigator,
+    nearest_probability_distribution,
+)
+
+NUM_BITS = 5
+P1_GIVEN_0 = np.array([0.02, 0.05, 0.01, 0.08, 0.03])
+P0_GIVEN_1 = np.array([0.04, 0.07, 0.02, 0.10, 0.05])
+
+
+def noisy_counts(true, shots=10**9):
+    """Counts of ``true`` (probability per integer state) seen through readout."""
+    # Full 2^n confusion matrix, clbit 0 = least significant bit
+    matrix = reduce(
+        np.kron,
+        [
+            np.array([[1 - e0, e1], [e0, 1 - e1]])
+            for e0, e1 in zip(P1_GIVEN_0[::-1], P0_GIVEN_1[::-1])
+        ],
+    )
+    observed = matrix @ true
+    return SparseCounts.from_dict(
+        {
+            format(state, f"0{NUM_BITS}b"): int(round(p * shots))
+            for state, p in enumerate(observed)
+            if round(p * shots)
+        }
+    )
+
+
+def quasi(counts, **options):
+    return ReadoutMitigator(**options).solve(counts, P1_GIVEN_0, P0_GIVEN_1)
+
+
+def test_dense_solver_inverts_the_confusion_matrix():
+    true = np.random.default_rng(5).dirichlet(np.ones(2**NUM_BITS))
+    counts = noisy_counts(true)
+    assert len(counts) == 2**NUM_BITS
+
+    recovered = dict(zip(counts.states(), quasi(counts)))
+    for state, p in enumerate(true):
+        assert recovered[format(state, f"0{NUM_BITS}b")] == pytest.approx(
+            p, abs=1e-6
+        )
+
+
+def test_sparse_solver_matches_dense():
+    true = np.zeros(2**NUM_BITS)
+    true[[0b00000, 0b11111, 0b10101]] = [0.5, 0.3, 0.2]
+    counts = noisy_counts(true)
+
+    dense = quasi(counts)
+    # Without a Hamming cutoff the sparse system is the dense one
+    exact = quasi(counts, dense_limit=0, max_hamming=NUM_BITS)
+    np.testing.assert_allclose(exact, dense, atol=1e-6)
+    # The default cutoff drops only 3+ bit flips, which are rare
+    truncated = quasi(counts, dense_limit=0)
+    np.testing.assert_allclose(truncated, dense, atol=2e-3)
+
+
+def test_projection_onto_probabilities():
+    projected = nearest_probability_distribution(np.array([0.6, 0.5, -0.1]))
+    np.testing.assert_allclose(projected, [0.55, 0.45, 0.0])
+    valid = np.array([0.2, 0.3, 0.5])
+    np.testing.assert_allclose(nearest_probability_distribution(valid), valid)
+
+
+def test_suite_is_calibrated_once_before_it_runs(tmp_path, monkeypatch):
+    pytest.importorskip("qiskit_ibm_runtime")
+    from qiskit_ibm_runtime import SamplerV2
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    backend = FakeManilaV2()
+    calibration_jobs = []
+
+    class CalibrationSampler:
+        def __init__(self, backend):
+            self.sampler = SamplerV2(mode=backend)
+
+        def run(self, pubs, shots):
+            calibration_jobs.append(pubs)
+            return self.sampler.run(pubs, shots=shots)
+
+    mitigator = ReadoutMitigator(
+        cache_dir=tmp_path / "calibration",
+        calibration_shots=256,
+        sampler_factory=CalibrationSampler,
+    )
+    monkeypatch.chdir(tmp_path)
+    runner = ParadoxExperimentRunner(
+        ibm_token="", backend=backend, transpile_workers=1, readout_mitigator=mitigator
+    )
+
+    recording = []
+    record_result = runner._record_result
+    calibrate = mitigator.calibrate
+
+    def watch_record(*args, **kwargs):
+        recording.append(True)
+        try:
+            return record_result(*args, **kwargs)
+        finally:
+            recording.pop()
+
+    def watch_calibrate(*args, **kwargs):
+        assert not recording, "calibration job while recording a result"
+        return calibrate(*args, **kwargs)
+
+    monkeypatch.setattr(runner, "_record_result", watch_record)
+    monkeypatch.setattr(mitigator, "calibrate", watch_calibrate)
+    with runner:
+        names = ["liar_paradox", "epr_paradox", "schrodinger_cat"]
+        results = runner.run_batch(names, shots=128, max_pubs_per_job=1)
+
+    assert len(calibration_jobs) == 1
+    operations = set(backend.target.operation_names)
+    for circuit in calibration_jobs[0]:
+        # Transpiled: full device width, native operations only
+        assert circuit.num_qubits == backend.num_qubits
+        assert {i.operation.name for i in circuit.data} <= operations
+    for result in results:
+        mitigated = result["quantum_result"]["mitigated"]
+        assert sum(mitigated["distribution"].values()) == pytest.approx(1.0)
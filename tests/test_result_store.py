@@ -0,0 +1,84 @@
+"""Streaming result store: segments, torn tails and the runner's store path."""
+
+import types
+
+import numpy as np
+import pytest
+
+from paradox_result_store import ResultStore
+
+
+def record(i, counts=None):
+    return {
+        "paradox": f"p{i}",
+        "quantum_result": {"counts": counts or {"00": i, "11": 1}},
+    }
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_records_stream_back_in_order_across_segments(tmp_path, compress):
+    with ResultStore(tmp_path, segment_max_records=2, compress=compress) as store:
+        for i in range(5):
+            store.append(record(i))
+        assert [r["paradox"] for r in store.iter_records()] == [
+            f"p{i}" for i in range(5)
+        ]
+
+    assert len(store.segments()) == 3
+    reopened = ResultStore(tmp_path, compress=compress)
+    assert reopened.count == 5
+    assert [r["paradox"] for r in reopened.iter_records()][-1] == "p4"
+
+
+def test_new_records_never_extend_a_torn_segment(tmp_path):
+    with ResultStore(tmp_path) as store:
+        store.append(record(0))
+        store.append(record(1))
+    torn = store.segments()[0]
+    with open(torn, "a", encoding="utf-8") as f:
+        f.write('{"paradox": "p2", "quan')
+
+    store = ResultStore(tmp_path)
+    assert store.count == 2
+    store.append(record(3))
+    store.close()
+    assert len(store.segments()) == 2
+    assert [r["paradox"] for r in store.iter_records()] == ["p0", "p1", "p3"]
+
+
+def test_export_counts_is_columnar_per_segment(tmp_path):
+    with ResultStore(tmp_path, segment_max_records=2) as store:
+        store.append(record(0, {"01": 3, "10": 5}))
+        store.append({"paradox": "failed", "status": "FAILED"})
+        store.append(record(2, {"111": 7}))
+    written = store.export_counts()
+
+    assert [p.name for p in written] == [
+        "results-00000.counts.npz",
+        "results-00001.counts.npz",
+    ]
+    first = np.load(written[0])
+    assert first["record"].tolist() == [0, 0]
+    assert sorted(first["count"].tolist()) == [3, 5]
+    second = np.load(written[1])
+    assert second["record"].tolist() == [2]
+    assert second["num_bits"].tolist() == [3]
+    assert second["keys"].tolist() == [[7]]
+
+
+def test_results_can_stay_in_the_store(tmp_path, monkeypatch):
+    pytest.importorskip("qiskit_ibm_runtime")
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    names = ["liar_paradox", "epr_paradox", "schrodinger_cat"]
+    monkeypatch.chdir(tmp_path)
+    with ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=1
+    ) as runner:
+        assert runner.run_batch(names, shots=64, collect=False) is None
+
+        streamed = runner.results
+        assert isinstance(streamed, types.GeneratorType)
+        assert sorted(r["paradox"] for r in streamed) == sorted(names)
@@ -0,0 +1,66 @@
+"""run_batch on a local fake backend (no IBM account)."""
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from quantum_paradox_runner import ParadoxExperimentRunner  # noqa: E402
+
+NAMES = ["liar_paradox", "epr_paradox", "schrodinger_cat"]
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    monkeypatch.chdir(tmp_path)
+    return ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=1
+    )
+
+
+def test_batch_shares_one_job(runner):
+    results = runner.run_batch(NAMES, shots=256)
+    assert [r["paradox"] for r in results] == NAMES
+    for result in results:
+        assert result["metrics"]["batch_pubs"] == len(NAMES)
+        assert sum(result["quantum_result"]["counts"].values()) == 256
+    assert (runner.output_dir / "epr_paradox" / "result_sanitized.json").exists()
+
+
+def test_batch_chunks_and_build_errors(runner):
+    def broken():
+        raise RuntimeError("cannot build")
+
+    builders = {**PARADOX_BUILDERS, "broken": (broken, "always fails")}
+    results = runner.run_batch(
+        NAMES + ["broken"], builders=builders, shots=64, max_pubs_per_job=2
+    )
+    assert [r["metrics"]["batch_pubs"] for r in results[:3]] == [2, 2, 1]
+    assert results[3]["paradox"] == "broken"
+    assert results[3]["status"] == "FAILED"
+
+
+def test_a_failed_chunk_only_fails_its_paradoxes(runner, monkeypatch):
+    submit_and_wait = runner._submit_and_wait
+    calls = []
+
+    def first_job_fails(pubs, *args, **kwargs):
+        calls.append(len(pubs))
+        if len(calls) == 1:
+            raise RuntimeError("job rejected")
+        return submit_and_wait(pubs, *args, **kwargs)
+
+    monkeypatch.setattr(runner, "_submit_and_wait", first_job_fails)
+    results = runner.run_batch(NAMES, shots=64, max_pubs_per_job=2)
+    assert calls == [2, 1]
+    assert [r["status"] for r in results[:2]] == ["FAILED", "FAILED"]
+    assert "job rejected" in results[0]["error"]
+    assert results[2]["metrics"]["batch_pubs"] == 1
+
+
+def test_max_pubs_per_job_must_be_positive(runner):
+    with pytest.raises(ValueError):
+        runner.run_batch(NAMES, max_pubs_per_job=0)
+
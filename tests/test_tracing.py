@@ -0,0 +1,81 @@
+"""Stage tracing: per-runner tracers and non-overlapping (self time) stages."""
+
+import asyncio
+import time
+
+import pytest
+
+from paradox_tracing import Tracer, span, stopwatch
+
+
+def total(tracer, stage):
+    return tracer.report()["stages"][stage]["sum_seconds"]
+
+
+def test_nested_spans_record_self_time():
+    tracer = Tracer()
+    with span("transpile", tracer) as outer:
+        time.sleep(0.02)
+        with span("serialize", tracer) as inner:
+            time.sleep(0.05)
+    assert outer.seconds >= inner.seconds + 0.02
+    assert total(tracer, "serialize") == pytest.approx(inner.seconds)
+    assert total(tracer, "transpile") == pytest.approx(
+        outer.seconds - inner.seconds
+    )
+    # Stages add up to the traced wall time
+    assert total(tracer, "transpile") + total(tracer, "serialize") == (
+        pytest.approx(outer.seconds)
+    )
+
+
+def test_tracers_are_independent():
+    first, second, disabled = Tracer(), Tracer(), Tracer(enabled=False)
+    with span("build", first):
+        # Another tracer's span does not take time away from this one
+        with span("build", second) as other:
+            time.sleep(0.01)
+    with span("write", disabled), span("write", None), stopwatch():
+        pass
+    assert total(first, "build") >= other.seconds
+    assert set(first.report()["stages"]) == {"build"}
+    assert set(second.report()["stages"]) == {"build"}
+    assert disabled.report()["stages"] == {}
+
+
+def test_concurrent_tasks_do_not_nest_into_each_other():
+    tracer = Tracer()
+
+    async def submit():
+        with span("submit", tracer):
+            await asyncio.sleep(0.03)
+
+    async def main():
+        await asyncio.gather(submit(), submit())
+
+    asyncio.run(main())
+    stats = tracer.report()["stages"]["submit"]
+    assert stats["count"] == 2
+    assert stats["min_seconds"] >= 0.025
+
+
+def test_runners_keep_their_own_stage_timings(tmp_path, monkeypatch):
+    pytest.importorskip("qiskit_ibm_runtime")
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    monkeypatch.chdir(tmp_path)
+    traced = ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), tracer=Tracer(), transpile_workers=1
+    )
+    untraced = ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=1
+    )
+    untraced.run_batch(["liar_paradox"], shots=64)
+    assert traced.tracer.report()["stages"] == {}
+
+    traced.run_batch(["liar_paradox", "epr_paradox"], shots=64)
+    stages = traced.tracer.report()["stages"]
+    assert {"build", "transpile", "serialize", "submit", "write"} <= set(stages)
+    assert untraced.tracer.report()["stages"] == {}
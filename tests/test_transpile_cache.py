@@ -0,0 +1,86 @@
+"""TranspileCache index: in-memory LRU on hits, merged writes across processes."""
+
+import json
+import multiprocessing
+
+import pytest
+
+pytest.importorskip("qiskit")
+
+from qiskit import QuantumCircuit  # noqa: E402
+
+from paradox_transpile_cache import INDEX_FILE, TranspileCache  # noqa: E402
+
+
+def bell(name="bell"):
+    circuit = QuantumCircuit(2, 2, name=name)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    return circuit
+
+
+def index(cache_dir):
+    return json.loads((cache_dir / INDEX_FILE).read_text())
+
+
+def test_hits_do_not_rewrite_the_index(tmp_path):
+    cache = TranspileCache(tmp_path)
+    cache.put("a", bell())
+    written = (tmp_path / INDEX_FILE).stat().st_mtime_ns
+    before = index(tmp_path)["a"]["last_access"]
+
+    assert cache.get("a") is not None
+    assert (tmp_path / INDEX_FILE).stat().st_mtime_ns == written
+
+    cache.flush()
+    assert index(tmp_path)["a"]["last_access"] > before
+    assert index(tmp_path)["a"]["hits"] == 1
+
+
+def test_caches_sharing_a_directory_keep_each_others_entries(tmp_path):
+    first = TranspileCache(tmp_path)
+    second = TranspileCache(tmp_path)
+    first.put("a", bell("a"))
+    second.put("b", bell("b"))
+    first.put("c", bell("c"))
+
+    assert set(index(tmp_path)) == {"a", "b", "c"}
+    assert TranspileCache(tmp_path).get("b") is not None
+
+
+def test_removed_entries_are_not_resurrected(tmp_path):
+    first = TranspileCache(tmp_path)
+    second = TranspileCache(tmp_path)
+    first.put("a", bell("a"))
+    first.clear()
+    second.put("b", bell("b"))  # second still has no "a" in memory
+    assert set(index(tmp_path)) == {"b"}
+
+
+def test_eviction_applies_to_the_merged_index(tmp_path):
+    TranspileCache(tmp_path).put("old", bell("old"))
+    cache = TranspileCache(tmp_path, max_entries=1)
+    cache.put("new", bell("new"))
+    assert set(index(tmp_path)) == {"new"}
+    assert not (tmp_path / "old.qpy").exists()
+
+
+def _put_many(cache_dir, prefix):
+    cache = TranspileCache(cache_dir)
+    for i in range(10):
+        cache.put(f"{prefix}{i}", bell(f"{prefix}{i}"))
+
+
+def test_concurrent_processes(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=_put_many, args=(tmp_path, prefix))
+        for prefix in ("x", "y")
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+        assert worker.exitcode == 0
+    assert len(index(tmp_path)) == 20
@@ -0,0 +1,70 @@
+"""Transpile pool: Target sent once per worker, deterministic, workers reused."""
+
+import pytest
+
+pytest.importorskip("qiskit_ibm_runtime")
+
+from paradox_circuit_builders import PARADOX_BUILDERS  # noqa: E402
+from paradox_transpile_pool import (  # noqa: E402
+    DEFAULT_SEED_TRANSPILER,
+    TranspilePool,
+    transpile_circuit,
+    transpile_parallel,
+)
+
+
+@pytest.fixture(scope="module")
+def target():
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    return FakeManilaV2().target
+
+
+def test_parallel_matches_serial_with_the_default_seed(target):
+    circuits = [PARADOX_BUILDERS.build(name) for name in PARADOX_BUILDERS]
+    parallel = transpile_parallel(circuits, target, max_workers=2)
+    serial = [transpile_circuit(qc, target)[0] for qc in circuits]
+    assert [qc for qc, _ in parallel] == serial
+
+
+def test_repeated_runs_give_the_same_layout(target):
+    circuit = PARADOX_BUILDERS.build("collatz_conjecture")
+    first, _ = transpile_circuit(circuit, target)
+    second, _ = transpile_circuit(circuit, target)
+    assert first == second
+
+
+def test_pool_workers_are_reused_until_closed(target):
+    circuits = [PARADOX_BUILDERS.build(name) for name in PARADOX_BUILDERS]
+    pool = TranspilePool(max_workers=2)
+    try:
+        first = pool.map(circuits, target)
+        executor = pool._executor((target, 3, DEFAULT_SEED_TRANSPILER))
+        workers = set(executor._processes)
+        second = pool.map(circuits[::-1], target)
+        assert pool._executor((target, 3, DEFAULT_SEED_TRANSPILER)) is executor
+        assert set(executor._processes) == workers
+    finally:
+        pool.close()
+    assert [qc for qc, _ in second] == [qc for qc, _ in first][::-1]
+    assert pool._executors == {}
+
+
+def test_runner_keeps_one_pool_until_closed(tmp_path, monkeypatch):
+    from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+
+    from quantum_paradox_runner import ParadoxExperimentRunner
+
+    monkeypatch.chdir(tmp_path)
+    circuits = [PARADOX_BUILDERS.build(name) for name in PARADOX_BUILDERS]
+    with ParadoxExperimentRunner(
+        ibm_token="", backend=FakeManilaV2(), transpile_workers=2
+    ) as runner:
+        runner._transpile_many(circuits)
+        (executor,) = [e for _, e in runner.transpile_pool._executors.values()]
+        runner.transpile_cache.clear()  # the second suite misses again
+        runner._transpile_many(circuits)
+        assert [e for _, e in runner.transpile_pool._executors.values()] == [
+            executor
+        ]
+    assert runner.transpile_pool._executors == {}